@@ -65,6 +65,7 @@ Phase Dependencies:
 """
 
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -97,7 +98,10 @@ click.rich_click.OPTION_GROUPS = {
         },
         {
             "name": "Advanced Options",
-            "options": ["--replace", "--cookie-file", "--force-rematch"],
+            "options": [
+                "--replace", "--cookie-file", "--force-rematch", "--offline",
+                "--rescore", "--min-score", "--log-level",
+            ],
         },
         {
             "name": "Info",
@@ -109,6 +113,7 @@ click.rich_click.OPTION_GROUPS = {
 from spot_downloader.core import (
     Config,
     ConfigError,
+    MatchingConfig,
     Database,
     DatabaseError,
     FileManager,
@@ -121,6 +126,7 @@ from spot_downloader.core import (
 )
 from spot_downloader.spotify import Track
 from spot_downloader.core.database import LIKED_SONGS_KEY
+from spot_downloader.core.logger import LOG_LEVELS
 from spot_downloader.download import (
     download_tracks_phase3,
     fetch_lyrics_phase4,
@@ -128,12 +134,15 @@ from spot_downloader.download import (
 )
 from spot_downloader.utils.replace import replace_track_audio
 from spot_downloader.spotify import (
+    EnrichmentCache,
     SpotifyClient,
     fetch_liked_songs_phase1,
     fetch_playlist_phase1,
+    fetch_playlists_phase1,
 )
+from spot_downloader.spotify.fetcher import DEFAULT_LIKED_FULL_SYNC_DAYS
 from spot_downloader.utils import ensure_directory, extract_playlist_id
-from spot_downloader.youtube import match_tracks_phase2, get_tracks_needing_match
+from spot_downloader.youtube import match_tracks_phase2, get_tracks_needing_match, rescore_matches
 
 logger = get_logger(__name__)
 
@@ -165,6 +174,11 @@ __version__ = "0.3.0"
     is_flag=True,
     help="Skip Liked Songs in sync mode"
 )
+@click.option(
+    "--full-sync",
+    is_flag=True,
+    help="Sync mode: re-read all Liked Songs to detect removals"
+)
 @click.option(
     "--1", "phase1_only",
     is_flag=True,
@@ -224,6 +238,28 @@ __version__ = "0.3.0"
     is_flag=True,
     help="Retry failed YouTube matches"
 )
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="With --2: match only from cached YouTube Music searches (no network)"
+)
+@click.option(
+    "--rescore",
+    is_flag=True,
+    help="Re-select YouTube matches from stored candidates (no network)"
+)
+@click.option(
+    "--min-score",
+    type=float,
+    default=None,
+    help="With --rescore: minimum match score (default matching.min_score, or 70)"
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(LOG_LEVELS, case_sensitive=False),
+    default=None,
+    help="Log level (overrides output.log_level; default DEBUG)"
+)
 @click.option(
     "--version",
     is_flag=True,
@@ -236,6 +272,7 @@ def cli(
     liked: bool,
     sync: bool,
     no_liked: bool,
+    full_sync: bool,
     phase1_only: bool,
     phase2_only: bool,
     phase3_only: bool,
@@ -246,6 +283,10 @@ def cli(
     replace: Optional[tuple[Path, str]],
     cookie_file: Optional[Path],
     force_rematch: bool,
+    offline: bool,
+    rescore: bool,
+    min_score: Optional[float],
+    log_level: Optional[str],
     version: bool
 ) -> None:
     """
@@ -264,9 +305,12 @@ def cli(
         spot --url "https://..." --sync        # Sync specific playlist
         spot --sync                            # Sync ALL playlists + Liked Songs
         spot --sync --no-liked                 # Sync ALL playlists (skip Liked Songs)
+        spot --sync --full-sync                # Also re-read ALL Liked Songs
         
         Sync mode downloads new tracks and detects playlist changes
         (removed tracks, position changes). Prompts before applying changes locally.
+        Liked Songs are read only up to the first already-known tracks;
+        the whole library is re-read every spotify.liked_full_sync_days.
     
     \b
     EXPORT:
@@ -287,6 +331,9 @@ def cli(
     ADVANCED:
         spot --replace song.m4a "https://youtube.com/watch?v=..."
         spot --cookie-file cookies.txt --url "https://..."
+        spot --2 --force-rematch --offline     # Re-score cached searches, no network
+        spot --rescore --min-score 75          # Re-select matches from stored candidates
+        spot --log-level INFO --sync           # Faster, no per-item debug log
     """
     # Handle --version
     if version:
@@ -303,6 +350,15 @@ def cli(
         _handle_replace(replace, cookie_file)
         ctx.exit(0)
     
+    # --min-score only applies to --rescore
+    if min_score is not None and not rescore:
+        raise click.UsageError("--min-score can only be used with --rescore")
+    
+    # Handle --rescore (standalone operation)
+    if rescore:
+        _handle_rescore(min_score)
+        ctx.exit(0)
+    
     # --copy-files only makes sense with --export
     if copy_files:
         raise click.UsageError("--copy-files can only be used with --export")
@@ -330,6 +386,12 @@ def cli(
     if no_liked and liked:
         raise click.UsageError("Cannot use both --liked and --no-liked")
     
+    # --full-sync only affects Liked Songs in sync mode
+    if full_sync and not sync:
+        raise click.UsageError("--full-sync can only be used with --sync")
+    if full_sync and (url or no_liked):
+        raise click.UsageError("--full-sync only applies to Liked Songs (not with --url or --no-liked)")
+    
     # Validate URL is a playlist URL (not track, album, or artist)
     if url and "/playlist/" not in url:
         raise click.UsageError(
@@ -357,6 +419,10 @@ def cli(
     if sync and any([phase2_only, phase3_only, phase4_only, phase5_only]):
         raise click.UsageError("--sync can only be used with --1 or when running all phases")
     
+    # --offline replays cached PHASE 2 searches only
+    if offline and not phase2_only:
+        raise click.UsageError("--offline can only be used with --2")
+    
     # Determine which phases to run
     if has_phase_flag:
         # Single phase mode
@@ -385,6 +451,7 @@ def cli(
     ctx.obj["sync"] = sync
     ctx.obj["sync_all"] = sync_all
     ctx.obj["no_liked"] = no_liked
+    ctx.obj["full_sync"] = full_sync
     ctx.obj["run_phase1"] = run_phase1
     ctx.obj["run_phase2"] = run_phase2
     ctx.obj["run_phase3"] = run_phase3
@@ -392,6 +459,8 @@ def cli(
     ctx.obj["run_phase5"] = run_phase5
     ctx.obj["cookie_file"] = cookie_file
     ctx.obj["force_rematch"] = force_rematch
+    ctx.obj["offline"] = offline
+    ctx.obj["log_level"] = log_level
     ctx.obj["user_auth"] = needs_user_auth
     
     # Run the download workflow
@@ -404,7 +473,8 @@ def _run_download(options: dict) -> None:
     This is the main orchestration function that:
     1. Loads configuration
     2. Sets up logging
-    3. Initializes database and Spotify client
+    3. Initializes database (and the Spotify client, only when PHASE 1
+       or sync runs: phases 2-5 never talk to Spotify)
     4. Runs the appropriate phases
     5. Reports results
     
@@ -422,7 +492,10 @@ def _run_download(options: dict) -> None:
         config = _load_configuration()
         
         # Setup logging
-        setup_logging(config.output.directory)
+        setup_logging(
+            config.output.directory,
+            level=options["log_level"] or config.output.log_level
+        )
         logger.info("spot-downloader starting")
         
         # Ensure output directory exists
@@ -431,9 +504,6 @@ def _run_download(options: dict) -> None:
         # Initialize database
         database = _initialize_database(config.output.directory)
         
-        # Initialize Spotify client
-        _initialize_spotify(config, options["user_auth"])
-        
         # Determine playlist ID
         # Phase 1 requires --url or --liked explicitly
         # Phases 2-5 can work without playlist_id (process all playlists)
@@ -455,19 +525,26 @@ def _run_download(options: dict) -> None:
         
         # Handle sync_all mode (--sync without --url or --liked)
         if options.get("sync_all"):
+            _initialize_spotify(config, options["user_auth"])
             tracks = _run_sync_all(
                 database=database,
                 include_liked=not options.get("no_liked", False),
-                output_dir=config.output.directory
+                output_dir=config.output.directory,
+                sync_workers=config.spotify.sync_workers,
+                full_sync=options["full_sync"],
+                liked_full_sync_days=config.spotify.liked_full_sync_days
             )
             # After sync_all, we don't need to run phase1 again
             # and playlist_id stays None (phases work globally)
         elif options["run_phase1"]:
+            _initialize_spotify(config, options["user_auth"])
             tracks = _run_phase1(
                 database=database,
                 url=options["url"],
                 liked=options["liked"],
-                sync=options["sync"]
+                sync=options["sync"],
+                full_sync=options["full_sync"],
+                liked_full_sync_days=config.spotify.liked_full_sync_days
             )
         
         if options["run_phase2"]:
@@ -476,7 +553,9 @@ def _run_download(options: dict) -> None:
                 playlist_id=playlist_id,
                 tracks=tracks,
                 num_threads=config.download.matching_threads,
-                force_rematch=options["force_rematch"]
+                force_rematch=options["force_rematch"],
+                offline=options["offline"],
+                matching=config.matching
             )
         
         # Phases 3-5 require a specific playlist
@@ -527,6 +606,7 @@ def _run_download(options: dict) -> None:
         elif playlist_id is not None:
             _print_final_stats(database, playlist_id)
         
+        logger.debug(f"Database connection pool: {database.get_pool_stats()}")
         logger.info("spot-downloader completed successfully")
         
     except ConfigError as e:
@@ -561,6 +641,9 @@ def _run_download(options: dict) -> None:
         sys.exit(1)
         
     finally:
+        # Flushes any queued write-behind updates (also on KeyboardInterrupt)
+        if database is not None:
+            database.close()
         shutdown_logging()
 
 def _load_configuration() -> Config:
@@ -580,6 +663,10 @@ def _initialize_database(output_dir: Path) -> Database:
     """
     Initialize the SQLite database.
     
+    Write-behind mode is enabled: per-track state updates from the worker
+    threads are committed in batches. _run_download() closes the database
+    on every exit path, which flushes whatever is still queued.
+    
     Args:
         output_dir: Directory where database.db is stored.
     
@@ -590,13 +677,16 @@ def _initialize_database(output_dir: Path) -> Database:
         DatabaseError: If database cannot be initialized.
     """
     db_path = output_dir / "database.db"
-    return Database(db_path)
+    return Database(db_path, write_behind=True)
 
 
 def _initialize_spotify(config: Config, user_auth: bool) -> None:
     """
     Initialize the Spotify client singleton.
     
+    Tokens are cached next to database.db, so later runs skip both the
+    token request and the connection test while the token is valid.
+    
     Args:
         config: Configuration with Spotify credentials.
         user_auth: Whether to enable user authentication.
@@ -607,7 +697,10 @@ def _initialize_spotify(config: Config, user_auth: bool) -> None:
     SpotifyClient.init(
         client_id=config.spotify.client_id,
         client_secret=config.spotify.client_secret,
-        user_auth=user_auth
+        user_auth=user_auth,
+        page_workers=config.spotify.page_workers,
+        requests_per_second=config.spotify.requests_per_second,
+        cache_dir=config.output.directory
     )
 
 
@@ -615,7 +708,9 @@ def _run_phase1(
     database: Database,
     url: str | None,
     liked: bool,
-    sync: bool
+    sync: bool,
+    full_sync: bool = False,
+    liked_full_sync_days: float = DEFAULT_LIKED_FULL_SYNC_DAYS
 ) -> list[Track]:
     """
     Run PHASE 1: Fetch Spotify metadata.
@@ -625,6 +720,8 @@ def _run_phase1(
         url: Playlist URL (None if using --liked).
         liked: Whether to fetch Liked Songs.
         sync: Whether to filter to new tracks only.
+        full_sync: With sync, re-read all Liked Songs (not incrementally).
+        liked_full_sync_days: With sync, days between complete Liked Songs reads.
     
     Returns:
         List of Track objects to process.
@@ -640,7 +737,12 @@ def _run_phase1(
     logger.info("=" * 60)
     
     if liked:
-        liked_songs, tracks = fetch_liked_songs_phase1(database, sync_mode=sync)
+        liked_songs, tracks = fetch_liked_songs_phase1(
+            database,
+            sync_mode=sync,
+            full_sync=full_sync,
+            full_sync_days=liked_full_sync_days
+        )
         logger.info(f"Fetched {liked_songs.total_tracks} liked songs")
     else:
         playlist, tracks = fetch_playlist_phase1(database, url, sync_mode=sync)
@@ -659,7 +761,10 @@ def _run_phase1(
 def _run_sync_all(
     database: Database, 
     include_liked: bool = True,
-    output_dir: Path | None = None
+    output_dir: Path | None = None,
+    sync_workers: int = 4,
+    full_sync: bool = False,
+    liked_full_sync_days: float = DEFAULT_LIKED_FULL_SYNC_DAYS
 ) -> list[Track]:
     """
     Sync all known playlists (and optionally Liked Songs).
@@ -672,19 +777,23 @@ def _run_sync_all(
         database: Database instance.
         include_liked: Whether to also sync Liked Songs (requires user auth).
         output_dir: Output directory for FileManager (needed for rebuild).
+        sync_workers: Playlists fetched from Spotify concurrently.
+        full_sync: Re-read all Liked Songs instead of only the new ones.
+        liked_full_sync_days: Days between complete Liked Songs reads.
     
     Returns:
         Combined list of new Track objects from all playlists.
     
     Behavior:
         1. Get all playlists from database
-        2. For each playlist:
-           a. Take snapshot of current state
-           b. Run Phase 1 in sync mode
-           c. Detect changes (removals, position changes)
-           d. If changes found, prompt user and rebuild if confirmed
-        3. If include_liked, also sync Liked Songs
-        4. Return combined list of new tracks
+        2. Take a snapshot of each playlist's current state
+        3. Run Phase 1 in sync mode for all playlists (fetched concurrently,
+           stored one at a time)
+        4. For each playlist:
+           a. Detect changes (removals, position changes)
+           b. If changes found, prompt user and rebuild if confirmed
+        5. If include_liked, also sync Liked Songs
+        6. Return combined list of new tracks
     """
     logger.info("=" * 60)
     logger.info("SYNC ALL: Syncing all known playlists")
@@ -702,27 +811,45 @@ def _run_sync_all(
     all_new_tracks: list[Track] = []
     file_manager = FileManager(output_dir) if output_dir else None
     
-    # Sync each playlist
-    for i, playlist_info in enumerate(playlists, 1):
-        spotify_url = playlist_info.get("spotify_url")
+    # Artists/albums shared between playlists are looked up once per run
+    enrichment_cache = EnrichmentCache()
+    
+    syncable: list[dict] = []
+    for playlist_info in playlists:
+        if not playlist_info.get("spotify_url"):
+            logger.warning(f"Skipping playlist '{playlist_info.get('name', 'Unknown')}': no URL stored")
+            continue
+        syncable.append(playlist_info)
+    
+    # Take snapshots BEFORE sync (a playlist's links only change when it is stored)
+    snapshots_before = {
+        p["spotify_id"]: database.get_playlist_tracks_snapshot(p["spotify_id"])
+        for p in syncable
+    }
+    
+    # Fetch playlists concurrently; the database writes happen one playlist at a time
+    if syncable:
+        logger.info(f"Fetching {len(syncable)} playlists ({sync_workers} at a time)")
+    results = fetch_playlists_phase1(
+        database,
+        [p["spotify_url"] for p in syncable],
+        sync_mode=True,
+        cache=enrichment_cache,
+        max_workers=sync_workers
+    )
+    
+    for i, (playlist_info, result) in enumerate(zip(syncable, results), 1):
         playlist_id = playlist_info["spotify_id"]
         name = playlist_info.get("name", "Unknown")
         
-        if not spotify_url:
-            logger.warning(f"Skipping playlist '{name}': no URL stored")
-            continue
-        
-        logger.info(f"[{i}/{len(playlists)}] Syncing: {name}")
+        logger.info(f"[{i}/{len(syncable)}] Synced: {name}")
         
-        # Take snapshot BEFORE sync
-        snapshot_before = database.get_playlist_tracks_snapshot(playlist_id)
+        if isinstance(result, Exception):
+            logger.error(f"  → Failed to sync '{name}': {result}")
+            continue
         
         try:
-            playlist, tracks = fetch_playlist_phase1(
-                database, 
-                spotify_url, 
-                sync_mode=True
-            )
+            _, tracks = result
             all_new_tracks.extend(tracks)
             logger.info(f"  → {len(tracks)} new tracks")
             
@@ -730,7 +857,7 @@ def _run_sync_all(
             snapshot_after = database.get_playlist_tracks_snapshot(playlist_id)
             
             # Detect changes
-            changes = _detect_playlist_changes(snapshot_before, snapshot_after, name)
+            changes = _detect_playlist_changes(snapshots_before[playlist_id], snapshot_after, name)
             
             if changes["has_changes"] and file_manager:
                 _handle_playlist_changes(
@@ -757,7 +884,13 @@ def _run_sync_all(
         snapshot_before = database.get_playlist_tracks_snapshot(LIKED_SONGS_KEY)
         
         try:
-            liked_songs, tracks = fetch_liked_songs_phase1(database, sync_mode=True)
+            liked_songs, tracks = fetch_liked_songs_phase1(
+                database,
+                sync_mode=True,
+                cache=enrichment_cache,
+                full_sync=full_sync,
+                full_sync_days=liked_full_sync_days
+            )
             all_new_tracks.extend(tracks)
             logger.info(f"  → {len(tracks)} new tracks")
             
@@ -883,7 +1016,9 @@ def _run_phase2(
     playlist_id: str | None,
     tracks: list[Track] | None,
     num_threads: int,
-    force_rematch: bool = False
+    force_rematch: bool = False,
+    offline: bool = False,
+    matching: MatchingConfig | None = None
 ) -> None:
     """
     Run PHASE 2: Match tracks on YouTube Music.
@@ -898,6 +1033,9 @@ def _run_phase2(
         tracks: Tracks from PHASE 1 (None if running phase separately).
         num_threads: Number of parallel matching threads.
         force_rematch: If True, reset failed matches before processing.
+        offline: Only use cached search results. Tracks without them
+                stay pending.
+        matching: Scoring overrides (config.yaml `matching` section).
     """
     logger.info("=" * 60)
     logger.info("PHASE 2: Matching tracks on YouTube Music")
@@ -913,40 +1051,41 @@ def _run_phase2(
     # Get tracks to process
     if tracks is None:
         # Running phase 2 separately - get ALL tracks needing match globally
-        track_dicts = get_tracks_needing_match(database)
+        total = database.count_tracks_needing_youtube_match()
         
-        if not track_dicts:
+        if total == 0:
             logger.info("No tracks need YouTube matching")
             logger.info("PHASE 2 complete")
             return
         
-        # Convert to Track objects
-        tracks = [
+        # Converted to Track objects as the work queue is paged in
+        tracks = (
             Track.from_database_dict(d["track_id"], d)
-            for d in track_dicts
-        ]
-        logger.info(f"Found {len(tracks)} tracks needing YouTube match")
+            for d in get_tracks_needing_match(database)
+        )
+        logger.info(f"Found {total} tracks needing YouTube match")
     else:
         # Tracks from phase 1 - filter to only those needing match
-        existing_matched = set()
-        for t in tracks:
-            track_data = database.get_global_track(t.spotify_id)
-            if track_data and track_data.get("youtube_url"):
-                existing_matched.add(t.spotify_id)
+        existing_matched = database.get_matched_spotify_ids(
+            {t.spotify_id for t in tracks}
+        )
         
         if existing_matched:
             tracks = [t for t in tracks if t.spotify_id not in existing_matched]
             logger.info(f"Skipping {len(existing_matched)} already matched tracks")
+        total = len(tracks)
     
-    if not tracks:
+    if total == 0:
         logger.info("No tracks to match")
         logger.info("PHASE 2 complete")
         return
     
-    logger.info(f"Matching {len(tracks)} tracks using {num_threads} threads")
+    logger.info(f"Matching {total} tracks using {num_threads} threads")
     
     # Run matching (global - no playlist_id needed)
-    match_tracks_phase2(database, tracks, num_threads)
+    match_tracks_phase2(
+        database, tracks, num_threads, offline=offline, total=total, matching=matching
+    )
     
     logger.info("PHASE 2 complete")
 
@@ -1001,16 +1140,13 @@ def _run_phase3(
     logger.info("PHASE 3: Downloading audio files")
     logger.info("=" * 60)
     
-    # Get tracks needing download (global - not playlist-specific)
-    tracks = database.get_tracks_needing_download()
-    
-    if not tracks:
+    # Check for pending downloads (global - not playlist-specific);
+    # download_tracks_phase3 fetches the actual work queue
+    if next(database.iter_tracks_needing_download(page_size=1), None) is None:
         logger.info("No tracks need downloading")
         logger.info("PHASE 3 complete")
         return
     
-    logger.info(f"Found {len(tracks)} tracks to download")
-    
     if cookie_file:
         logger.info(f"Using cookie file: {cookie_file}")
     else:
@@ -1138,6 +1274,50 @@ def _handle_replace(replace_args: tuple[Path, str], cookie_file: Path | None) ->
     raise NotImplementedError("Contract only - implementation pending")
 
 
+def _handle_rescore(min_score: float | None) -> None:
+    """
+    Handle the --rescore standalone operation.
+    
+    Re-selects the YouTube match of every track not yet downloaded from the
+    candidates stored by PHASE 2, with the scoring settings of config.yaml's
+    `matching` section and optionally a different minimum score. No
+    network access.
+    
+    Args:
+        min_score: Minimum match score, or None for matching.min_score
+                  (MIN_SIMILARITY_SCORE if not set).
+    """
+    try:
+        config = load_config()
+        
+        db_path = config.output.directory / "database.db"
+        if not db_path.exists():
+            click.echo("No database found. Run a download first.", err=True)
+            sys.exit(1)
+        
+        database = Database(db_path)
+        try:
+            start = time.perf_counter()
+            counts = rescore_matches(database, min_score, config.matching)
+            seconds = time.perf_counter() - start
+        finally:
+            database.close()
+        
+        click.echo(f"Rescored {counts['tracks']} tracks in {seconds:.1f}s")
+        click.echo(f"  Unchanged:         {counts['unchanged']}")
+        click.echo(f"  Newly matched:     {counts['matched']}")
+        click.echo(f"  Different match:   {counts['rematched']}")
+        click.echo(f"  Now failed:        {counts['failed']}")
+        click.echo(f"  Need a new search: {counts['pending']} (run spot --2)")
+        
+    except ConfigError as e:
+        click.echo(f"Configuration error: {e.message}", err=True)
+        sys.exit(1)
+    except DatabaseError as e:
+        click.echo(f"Database error: {e.message}", err=True)
+        sys.exit(2)
+
+
 def _handle_export(export_arg: str, copy_files: bool) -> None:
     """
     Handle the --export standalone operation.
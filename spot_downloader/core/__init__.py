@@ -20,6 +20,7 @@ Usage:
 from spot_downloader.core.config import (
     Config,
     DownloadConfig,
+    MatchingConfig,
     OutputConfig,
     SpotifyConfig,
     load_config,
@@ -52,6 +53,7 @@ __all__ = [
     "SpotifyConfig",
     "OutputConfig",
     "DownloadConfig",
+    "MatchingConfig",
     "load_config",
     # Database
     "Database",
@@ -0,0 +1,59 @@
+"""
+Thread pool helpers for spot-downloader.
+
+The phase work queues are streamed from the database page by page
+(Database.iter_tracks_needing_*). Submitting a whole queue to a
+ThreadPoolExecutor up front would hold every task in memory again, so
+tasks are submitted with a bounded number in flight instead.
+
+Usage:
+    from spot_downloader.core.concurrency import iter_completed
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for track, future in iter_completed(executor, match, tracks, 16):
+            result = future.result()
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, Generator, Iterable, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_completed(
+    executor: Executor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_pending: int
+) -> Generator[tuple[T, "Future[R]"], None, None]:
+    """
+    Run func on each item and yield (item, future) as tasks complete.
+
+    Items are pulled from `items` lazily: at most max_pending tasks are
+    submitted and not yet yielded at any time.
+
+    Args:
+        executor: Executor running the tasks.
+        func: Function called with each item.
+        items: Items to process (any iterable, e.g. a generator).
+        max_pending: Maximum number of submitted, unfinished tasks.
+
+    Yields:
+        (item, future) for each item, in completion order. The future is
+        done; call future.result() to get the return value or exception.
+    """
+    pending: dict[Future[R], T] = {}
+
+    for item in items:
+        pending[executor.submit(func, item)] = item
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
@@ -5,11 +5,13 @@ This module handles loading, validating, and providing access to the
 application configuration stored in config.yaml.
 
 The configuration file contains:
-    - Spotify API credentials (client_id, client_secret)
+    - Spotify API credentials (client_id, client_secret) and request limits
     - Output directory for downloaded files
     - Export directory for portable playlist exports
+    - Log level for console and log files
     - Thread counts for matching and downloading phases
     - Optional cookie file path for YouTube Premium quality
+    - Optional YouTube match scoring overrides (PHASE 2 and --rescore)
 
 Configuration File Location:
     The config.yaml file must be in the current working directory
@@ -19,16 +21,30 @@ Example config.yaml:
     spotify:
       client_id: "your_client_id_here"
       client_secret: "your_client_secret_here"
+      page_workers: 8            # Optional: parallel page/batch requests
+      requests_per_second: 20    # Optional: Spotify request rate limit
+      sync_workers: 4            # Optional: playlists fetched at once by --sync
+      liked_full_sync_days: 7    # Optional: days between complete Liked Songs syncs
     
     output:
       directory: "~/Desktop/Music/SpotDownloader"
       export_directory: "~/Desktop/Music/SpotDownloader/export"
+      log_level: "DEBUG"         # Optional: DEBUG, INFO, WARNING or ERROR
     
     download:
       threads:
         matching: 8   # Phase 2: YouTube matching (higher is faster)
         download: 4   # Phase 3: Audio download (lower avoids rate limiting)
       cookie_file: null  # Optional: path to cookies.txt for YT Premium
+    
+    matching:            # Optional: scoring overrides, defaults in youtube/matcher.py
+      min_score: 70
+      title_weight: 0.65
+      artist_weight: 0.35
+      album_match_bonus: 5
+      forbidden_word_penalty: 15
+      result_type_bonus:
+        song_verified: 7
 """
 
 from dataclasses import dataclass
@@ -38,6 +54,7 @@ from typing import Any
 import yaml
 
 from spot_downloader.core.exceptions import ConfigError
+from spot_downloader.core.logger import DEFAULT_LOG_LEVEL, LOG_LEVELS
 
 
 # Default configuration file name (always in current working directory)
@@ -57,9 +74,23 @@ class SpotifyConfig:
                    A 32-character hexadecimal string.
         client_secret: The Spotify application client secret.
                    A 32-character hexadecimal string.
+        page_workers: Maximum concurrent requests when listing playlist
+                      items or Liked Songs and when batch-fetching
+                      artists/albums.
+        requests_per_second: Upper bound on the rate of all Spotify requests;
+                             lowered temporarily after 429 responses.
+        sync_workers: Playlists fetched concurrently by `spot --sync`
+                      (1 syncs them one after another).
+        liked_full_sync_days: `--sync` reads only new Liked Songs, and the
+                              whole library (to detect removals) once this
+                              many days have passed (0: every time).
     """
     client_id: str
     client_secret: str
+    page_workers: int = 8
+    requests_per_second: float = 20.0
+    sync_workers: int = 4
+    liked_full_sync_days: float = 7.0
 
 
 @dataclass(frozen=True)
@@ -74,9 +105,12 @@ class OutputConfig:
         export_directory: Absolute path for --export command output.
                          Defaults to {directory}/export if not specified.
                          Used for portable M3U playlists and file copies.
+        log_level: Lowest level logged to console and log_full.log
+                   (DEBUG, INFO, WARNING or ERROR). Overridden by --log-level.
     """
     directory: Path
     export_directory: Path
+    log_level: str = DEFAULT_LOG_LEVEL
 
 
 @dataclass(frozen=True)
@@ -102,6 +136,44 @@ class DownloadConfig:
     cookie_file: Path | None
 
 
+@dataclass(frozen=True)
+class MatchingConfig:
+    """
+    YouTube match scoring overrides.
+    
+    Every field is optional: None keeps the matcher's default (the
+    constants in youtube/matcher.py). Applied by PHASE 2 and by
+    `spot --rescore`, which re-selects matches from stored candidates
+    without searching again.
+    
+    Attributes:
+        min_score: Minimum score of an accepted match
+                   (overridden by --min-score).
+        title_weight: Weight of title similarity in the base score.
+        artist_weight: Weight of artist similarity in the base score.
+        album_match_bonus: Bonus when the album names are similar.
+        album_match_threshold: Album similarity (0-100) needed for the bonus.
+        forbidden_word_penalty: Penalty per forbidden word ("live",
+                                "remix", ...) missing from the Spotify title.
+        result_type_bonus: Bonus per result type (song_verified,
+                           song_unverified, video_verified, video_unverified).
+                           Only the listed keys are overridden.
+        explicit_match_scores: Adjustment per explicit flag combination
+                               (both_explicit, both_clean,
+                               spotify_explicit_yt_clean,
+                               spotify_clean_yt_explicit, unknown).
+                               Only the listed keys are overridden.
+    """
+    min_score: float | None = None
+    title_weight: float | None = None
+    artist_weight: float | None = None
+    album_match_bonus: float | None = None
+    album_match_threshold: float | None = None
+    forbidden_word_penalty: float | None = None
+    result_type_bonus: dict[str, float] | None = None
+    explicit_match_scores: dict[str, float] | None = None
+
+
 @dataclass(frozen=True)
 class Config:
     """
@@ -115,6 +187,7 @@ class Config:
         spotify: Spotify API credentials.
         output: Output directory settings.
         download: Download behavior settings.
+        matching: YouTube match scoring overrides.
     
     Example:
         config = load_config()
@@ -125,6 +198,7 @@ class Config:
     spotify: SpotifyConfig
     output: OutputConfig
     download: DownloadConfig
+    matching: MatchingConfig
 
 
 def load_config(config_path: Path | None = None) -> Config:
@@ -154,7 +228,8 @@ def load_config(config_path: Path | None = None) -> Config:
         4. Validate and extract spotify credentials
         5. Validate and expand output directory path
         6. Validate download settings with defaults
-        7. Create and return frozen Config object
+        7. Validate matching overrides (optional section)
+        8. Create and return frozen Config object
     
     Example:
         try:
@@ -211,11 +286,13 @@ def load_config(config_path: Path | None = None) -> Config:
     spotify_config = _parse_spotify_config(raw_config["spotify"])
     output_config = _parse_output_config(raw_config["output"])
     download_config = _parse_download_config(raw_config.get("download"))
+    matching_config = _parse_matching_config(raw_config.get("matching"))
     
     return Config(
         spotify=spotify_config,
         output=output_config,
-        download=download_config
+        download=download_config,
+        matching=matching_config
     )
 
 
@@ -257,10 +334,15 @@ def _parse_spotify_config(spotify_section: dict[str, Any]) -> SpotifyConfig:
         spotify_section: The 'spotify' section from config.yaml.
     
     Returns:
-        SpotifyConfig: Validated Spotify credentials.
+        SpotifyConfig: Validated Spotify credentials and request limits.
+                       Default page_workers: 8
+                       Default requests_per_second: 20
+                       Default sync_workers: 4
+                       Default liked_full_sync_days: 7
     
     Raises:
-        ConfigError: If client_id or client_secret is missing or empty.
+        ConfigError: If client_id or client_secret is missing or empty,
+                     or if a request limit is not a positive number.
     """
     client_id = spotify_section.get("client_id", "")
     client_secret = spotify_section.get("client_secret", "")
@@ -277,9 +359,45 @@ def _parse_spotify_config(spotify_section: dict[str, Any]) -> SpotifyConfig:
             details={"field": "spotify.client_secret"}
         )
     
+    page_workers = spotify_section.get("page_workers", 8)
+    if isinstance(page_workers, bool) or not isinstance(page_workers, int) or page_workers < 1:
+        raise ConfigError(
+            "'spotify.page_workers' must be a positive integer",
+            details={"field": "spotify.page_workers", "value": page_workers}
+        )
+    
+    requests_per_second = spotify_section.get("requests_per_second", 20.0)
+    if (isinstance(requests_per_second, bool)
+            or not isinstance(requests_per_second, (int, float))
+            or requests_per_second <= 0):
+        raise ConfigError(
+            "'spotify.requests_per_second' must be a positive number",
+            details={"field": "spotify.requests_per_second", "value": requests_per_second}
+        )
+    
+    sync_workers = spotify_section.get("sync_workers", 4)
+    if isinstance(sync_workers, bool) or not isinstance(sync_workers, int) or sync_workers < 1:
+        raise ConfigError(
+            "'spotify.sync_workers' must be a positive integer",
+            details={"field": "spotify.sync_workers", "value": sync_workers}
+        )
+    
+    liked_full_sync_days = spotify_section.get("liked_full_sync_days", 7.0)
+    if (isinstance(liked_full_sync_days, bool)
+            or not isinstance(liked_full_sync_days, (int, float))
+            or liked_full_sync_days < 0):
+        raise ConfigError(
+            "'spotify.liked_full_sync_days' must be a non-negative number",
+            details={"field": "spotify.liked_full_sync_days", "value": liked_full_sync_days}
+        )
+    
     return SpotifyConfig(
         client_id=client_id.strip(),
-        client_secret=client_secret.strip()
+        client_secret=client_secret.strip(),
+        page_workers=page_workers,
+        requests_per_second=float(requests_per_second),
+        sync_workers=sync_workers,
+        liked_full_sync_days=float(liked_full_sync_days)
     )
 
 
@@ -297,7 +415,8 @@ def _parse_output_config(output_section: dict[str, Any]) -> OutputConfig:
         OutputConfig: Validated output configuration with expanded paths.
     
     Raises:
-        ConfigError: If directory is missing or empty.
+        ConfigError: If directory is missing or empty, or log_level is
+                     not a known level name.
     """
     directory = output_section.get("directory", "")
     
@@ -323,7 +442,18 @@ def _parse_output_config(output_section: dict[str, Any]) -> OutputConfig:
         # Default: output_directory/export
         export_path = path / "export"
     
-    return OutputConfig(directory=path, export_directory=export_path)
+    log_level = output_section.get("log_level", DEFAULT_LOG_LEVEL)
+    if not isinstance(log_level, str) or log_level.strip().upper() not in LOG_LEVELS:
+        raise ConfigError(
+            f"'output.log_level' must be one of: {', '.join(LOG_LEVELS)}",
+            details={"field": "output.log_level", "value": log_level}
+        )
+    
+    return OutputConfig(
+        directory=path,
+        export_directory=export_path,
+        log_level=log_level.strip().upper()
+    )
 
 
 def _parse_download_config(download_section: dict[str, Any] | None) -> DownloadConfig:
@@ -422,4 +552,73 @@ def _parse_download_config(download_section: dict[str, Any] | None) -> DownloadC
         matching_threads=matching_threads,
         download_threads=download_threads,
         cookie_file=cookie_file
-    )
\ No newline at end of file
+    )
+
+
+def _parse_matching_config(matching_section: dict[str, Any] | None) -> MatchingConfig:
+    """
+    Parse and validate the optional matching configuration section.
+    
+    Only checks the values are numbers; the bonus table keys are checked
+    by the matcher (youtube.matcher.ScoringWeights.from_config()).
+    
+    Args:
+        matching_section: The 'matching' section from config.yaml, or None.
+    
+    Returns:
+        MatchingConfig: The overrides given (None for the others).
+    
+    Raises:
+        ConfigError: If the section is not a dictionary, has an unknown
+                     key, or a value is not a number (a mapping of
+                     numbers for the bonus tables), or a weight or
+                     threshold is negative.
+    """
+    if matching_section is None:
+        return MatchingConfig()
+    
+    if not isinstance(matching_section, dict):
+        raise ConfigError(
+            "Section 'matching' must be a dictionary",
+            details={"section": "matching"}
+        )
+    
+    numbers = {
+        "min_score", "title_weight", "artist_weight", "album_match_bonus",
+        "album_match_threshold", "forbidden_word_penalty",
+    }
+    non_negative = {"title_weight", "artist_weight", "album_match_threshold"}
+    tables = {"result_type_bonus", "explicit_match_scores"}
+    
+    values: dict[str, Any] = {}
+    for key, value in matching_section.items():
+        field = f"matching.{key}"
+        if key in numbers:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ConfigError(
+                    f"'{field}' must be a number",
+                    details={"field": field, "value": value}
+                )
+            if key in non_negative and value < 0:
+                raise ConfigError(
+                    f"'{field}' must be a non-negative number",
+                    details={"field": field, "value": value}
+                )
+            values[key] = float(value)
+        elif key in tables:
+            if not isinstance(value, dict) or any(
+                isinstance(v, bool) or not isinstance(v, (int, float))
+                for v in value.values()
+            ):
+                raise ConfigError(
+                    f"'{field}' must be a dictionary of numbers",
+                    details={"field": field, "value": value}
+                )
+            values[key] = {str(k): float(v) for k, v in value.items()}
+        else:
+            raise ConfigError(
+                f"Unknown setting '{field}'",
+                details={"field": field}
+            )
+    
+    return MatchingConfig(**values)
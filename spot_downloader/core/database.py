@@ -5,9 +5,22 @@ This module uses a Global Track Registry pattern: each unique Spotify track
 is stored once in `global_tracks`, and linked to playlists via `playlist_tracks`.
 
 Schema:
-    playlists:          Playlist metadata (id, name, spotify_url, last_synced)
+    playlists:          Playlist metadata (id, name, spotify_url, last_synced, snapshot_id,
+                        last_full_sync)
     global_tracks:      One row per unique spotify_id (metadata + processing state)
     playlist_tracks:    Junction table (playlist_id, track_id, position, added_at)
+    track_raw_metadata: Full Spotify response per track (zlib-compressed JSON),
+                        kept out of global_tracks and loaded via get_raw_metadata()
+    artists, albums:    Cache of the Spotify artist/album fields used for Phase 1
+                        enrichment (genres, label, copyright), with fetch time
+    youtube_search_cache: YouTube Music search responses per (query, filter,
+                        limit), zlib-compressed JSON, for Phase 2 re-runs
+    match_candidates:   Phase 2 candidates of each track with their component
+                        scores (zlib-compressed JSON), for spot --rescore
+
+    Each phase work queue (get_tracks_needing_*) is backed by a partial index
+    containing only the tracks pending for that phase. Older databases are
+    upgraded in place by _migrate() (see _MIGRATIONS).
 
 Benefits:
     - Same track in N playlists = 1 download, 1 YouTube match, 1 lyrics fetch
@@ -17,30 +30,48 @@ Benefits:
 Usage:
     db = Database(output_dir / "database.db")
     
-    # PHASE 1: Add tracks
-    track_db_id = db.get_or_create_global_track(spotify_id, metadata)
-    db.link_track_to_playlist(playlist_id, track_db_id, position=1)
+    # PHASE 1: Add tracks (single transaction for the whole playlist)
+    db.upsert_tracks_and_links(playlist_id, [
+        {"spotify_id": spotify_id, "track_data": metadata, "position": 1, "added_at": None},
+    ])
     
-    # PHASE 2-5: Process globally
-    for track in db.get_tracks_needing_youtube_match():
+    # PHASE 2-5: Process globally (paged, only the columns each phase needs)
+    for track in db.iter_tracks_needing_youtube_match():
         db.set_youtube_url(track["spotify_id"], youtube_url)
 """
 
+import atexit
 import json
 import sqlite3
 import threading
+import time
+import weakref
+import zlib
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Generator
 
 from spot_downloader.core.exceptions import DatabaseError
+from spot_downloader.core.logger import get_logger
+
+logger = get_logger(__name__)
 
 
-DATABASE_VERSION = 2
+DATABASE_VERSION = 9
 LIKED_SONGS_KEY = "__liked_songs__"
 YOUTUBE_MATCH_FAILED = "MATCH_FAILED"
 
+# UPSERT ... RETURNING requires SQLite 3.35+
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Write-behind defaults: flush every N ms or as soon as M updates are queued
+WRITE_BEHIND_FLUSH_INTERVAL_MS = 250
+WRITE_BEHIND_FLUSH_ROWS = 200
+
+# Rows fetched per query by the iter_tracks_needing_* work-queue iterators
+WORK_QUEUE_PAGE_SIZE = 500
+
 
 _SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS schema_version (
@@ -52,7 +83,9 @@ CREATE TABLE IF NOT EXISTS playlists (
     spotify_id TEXT UNIQUE NOT NULL,
     spotify_url TEXT,
     name TEXT,
-    last_synced TEXT
+    last_synced TEXT,
+    snapshot_id TEXT,  -- Spotify snapshot_id of the last complete fetch
+    last_full_sync TEXT  -- Last complete (non-incremental) Liked Songs fetch
 );
 
 CREATE TABLE IF NOT EXISTS global_tracks (
@@ -78,7 +111,6 @@ CREATE TABLE IF NOT EXISTS global_tracks (
     explicit INTEGER,
     popularity INTEGER,
     preview_url TEXT,
-    metadata TEXT,  -- JSON blob for full Spotify response
     
     -- YouTube matching
     youtube_url TEXT,
@@ -117,24 +149,198 @@ CREATE TABLE IF NOT EXISTS playlist_tracks (
 
 CREATE INDEX IF NOT EXISTS idx_global_tracks_spotify_id ON global_tracks(spotify_id);
 CREATE INDEX IF NOT EXISTS idx_global_tracks_youtube_url ON global_tracks(youtube_url);
-CREATE INDEX IF NOT EXISTS idx_global_tracks_downloaded ON global_tracks(downloaded);
 CREATE INDEX IF NOT EXISTS idx_playlist_tracks_playlist ON playlist_tracks(playlist_id);
 CREATE INDEX IF NOT EXISTS idx_playlist_tracks_track ON playlist_tracks(track_id);
 """
 
+# Full Spotify responses live in a side table so the phase queries never read
+# them. Written as zlib-compressed JSON; rows migrated from the old
+# global_tracks.metadata column stay plain JSON text (both are accepted).
+_RAW_METADATA_SQL = """
+CREATE TABLE IF NOT EXISTS track_raw_metadata (
+    track_id INTEGER PRIMARY KEY,
+    data BLOB NOT NULL,
+    FOREIGN KEY (track_id) REFERENCES global_tracks(id) ON DELETE CASCADE
+);
+"""
+
+# Phase 1 enrichment cache. `data` is a JSON projection of the API object
+# (see SpotifyFetcher); fetched_at is an ISO timestamp used for TTL expiry.
+_ENRICHMENT_CACHE_SQL = """
+CREATE TABLE IF NOT EXISTS artists (
+    spotify_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS albums (
+    spotify_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+"""
+
+# Phase 2 search cache. One row per ytmusic search() call; fetched_at drives
+# both TTL expiry and oldest-first eviction (prune_search_cache).
+_SEARCH_CACHE_SQL = """
+CREATE TABLE IF NOT EXISTS youtube_search_cache (
+    query TEXT NOT NULL,
+    search_filter TEXT NOT NULL,
+    result_limit INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (query, search_filter, result_limit)
+);
+
+CREATE INDEX IF NOT EXISTS idx_youtube_search_cache_fetched
+    ON youtube_search_cache(fetched_at);
+"""
+
+# Phase 2 candidates per track: the duration-filtered results of each search
+# with their ScoreComponents, as zlib-compressed JSON (see YouTubeMatcher).
+_MATCH_CANDIDATES_SQL = """
+CREATE TABLE IF NOT EXISTS match_candidates (
+    track_id INTEGER PRIMARY KEY,
+    data BLOB NOT NULL,
+    scored_at TEXT NOT NULL,
+    FOREIGN KEY (track_id) REFERENCES global_tracks(id) ON DELETE CASCADE
+);
+"""
+
+# Partial indexes for the phase work queues (get_tracks_needing_*).
+# Each index only contains the rows still pending for that phase, ordered by
+# created_at, so fetching a work queue scales with pending work instead of
+# library size. The WHERE clauses must stay identical to the queries below
+# (and use literals, not bound parameters) for SQLite to pick the index.
+_WORK_QUEUE_INDEXES_SQL = f"""
+CREATE INDEX IF NOT EXISTS idx_pending_match
+    ON global_tracks(created_at)
+    WHERE youtube_url IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_pending_download
+    ON global_tracks(created_at)
+    WHERE youtube_url IS NOT NULL AND youtube_url != '{YOUTUBE_MATCH_FAILED}' AND downloaded = 0;
+
+CREATE INDEX IF NOT EXISTS idx_pending_lyrics
+    ON global_tracks(created_at)
+    WHERE downloaded = 1 AND lyrics_fetched = 0;
+
+CREATE INDEX IF NOT EXISTS idx_pending_embedding
+    ON global_tracks(created_at)
+    WHERE downloaded = 1 AND (
+        metadata_embedded = 0
+        OR (lyrics_fetched = 1 AND lyrics_text IS NOT NULL AND lyrics_embedded = 0)
+    );
+"""
+
+# Columns selected by the iter_tracks_needing_* work queues (never the
+# metadata JSON blob or the lyrics).
+_TRACK_INFO_COLUMNS = (
+    "spotify_id", "name", "artist", "artists", "album", "duration_ms",
+    "spotify_url", "isrc", "cover_url", "release_date", "track_number",
+    "disc_number", "year", "genres", "publisher", "copyright", "explicit",
+    "popularity", "preview_url",
+)
+_MATCH_QUEUE_COLUMNS = _TRACK_INFO_COLUMNS
+_DOWNLOAD_QUEUE_COLUMNS = ("spotify_id", "name", "artist", "spotify_url", "youtube_url")
+
+# Schema for a new database (always the latest version)
+_SCHEMA_SQL += (
+    _WORK_QUEUE_INDEXES_SQL + _RAW_METADATA_SQL + _ENRICHMENT_CACHE_SQL
+    + _SEARCH_CACHE_SQL + _MATCH_CANDIDATES_SQL
+)
+
+# Upgrade scripts: version N is applied to databases at version N - 1
+_MIGRATIONS: dict[int, str] = {
+    # The two-valued downloaded index is superseded by the partial indexes and
+    # would otherwise be preferred by the planner when no statistics exist.
+    3: _WORK_QUEUE_INDEXES_SQL + "DROP INDEX IF EXISTS idx_global_tracks_downloaded;\n",
+    # The legacy metadata column is emptied but not dropped (no table rebuild)
+    4: _RAW_METADATA_SQL + """
+INSERT OR REPLACE INTO track_raw_metadata (track_id, data)
+    SELECT id, metadata FROM global_tracks WHERE metadata IS NOT NULL;
+UPDATE global_tracks SET metadata = NULL WHERE metadata IS NOT NULL;
+""",
+    5: "ALTER TABLE playlists ADD COLUMN snapshot_id TEXT;\n",
+    6: _ENRICHMENT_CACHE_SQL,
+    7: "ALTER TABLE playlists ADD COLUMN last_full_sync TEXT;\n",
+    8: _SEARCH_CACHE_SQL,
+    9: _MATCH_CANDIDATES_SQL,
+}
+
+
+def _flush_at_exit(database_ref: "weakref.ref[Database]") -> None:
+    """atexit hook: never lose queued write-behind updates on interpreter exit."""
+    database = database_ref()
+    if database is not None:
+        try:
+            database.flush()
+        except Exception:
+            pass
+
 
 class Database:
     """
     Thread-safe SQLite database with Global Track Registry.
     
-    Uses a single persistent connection with thread locking for safety.
-    All public methods acquire self._lock before executing.
+    Connection pool (WAL mode):
+        - Readers: one connection per thread, created lazily. Reads run
+          concurrently and never wait for writers (WAL snapshot isolation).
+        - Writer: a single dedicated connection serialized by self._write_lock.
+          SQLite allows only one writer at a time anyway, so this keeps lock
+          contention inside the process instead of on SQLITE_BUSY retries.
+    
+    Pool size and write lock contention are reported by get_pool_stats().
+    
+    Write-behind mode (write_behind=True):
+        Per-track state updates (set_youtube_url, mark_downloaded, set_lyrics,
+        mark_*_embedded, ...) and PHASE 2 search cache and match candidate
+        writes are queued in memory instead of committed one by one. A
+        background thread applies them in a single transaction every
+        flush_interval_ms, or as soon as flush_rows updates are pending.
+        
+        Ordering and visibility are preserved:
+        - Any direct write applies the queue first, in the same write lock.
+        - Reads of track state flush the queue before querying. Search cache
+          lookups don't: a response still queued is simply searched again.
+        - close() and interpreter exit flush everything that is still queued.
+        
+        Because updates are applied later, "Track not found" is logged as a
+        warning at flush time instead of being raised to the caller.
     """
     
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        write_behind: bool = False,
+        flush_interval_ms: int = WRITE_BEHIND_FLUSH_INTERVAL_MS,
+        flush_rows: int = WRITE_BEHIND_FLUSH_ROWS
+    ) -> None:
         self.db_path = db_path
-        self._lock = threading.Lock()
-        self._conn: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        
+        # Reader pool: thread-local lookup + registry for reaping and close()
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._readers: dict[threading.Thread, sqlite3.Connection] = {}
+        
+        # Contention metrics
+        self._readers_created = 0
+        self._write_acquisitions = 0
+        self._write_contended = 0
+        self._write_wait_total = 0.0
+        self._write_wait_max = 0.0
+        
+        # Write-behind queue: (sql, params, spotify_id that must exist or None)
+        self._write_behind = write_behind
+        self._flush_interval = flush_interval_ms / 1000
+        self._flush_rows = flush_rows
+        self._pending: list[tuple[str, tuple[Any, ...], str | None]] = []
+        self._pending_cond = threading.Condition()
+        self._flusher: threading.Thread | None = None
+        self._closing = False
+        self._flushes = 0
         
         if not db_path.parent.exists():
             raise DatabaseError(
@@ -149,58 +355,271 @@ class Database:
                 f"Failed to initialize database: {e}",
                 details={"path": str(db_path)}
             ) from e
+        
+        if write_behind:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="db-write-behind", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(_flush_at_exit, weakref.ref(self))
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30.0,
+            check_same_thread=False  # Closed from close(), possibly by another thread
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
     
     @contextmanager
-    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+    def _write_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
-        Get the persistent database connection as a context manager.
+        Get the dedicated writer connection, holding the write lock.
         
-        The connection is created once and reused for all operations.
-        The context manager pattern is kept for compatibility but doesn't
-        close the connection on exit.
+        Lock wait time is recorded for get_pool_stats().
         """
-        if self._conn is None:
-            self._conn = sqlite3.connect(
-                str(self.db_path), 
-                timeout=30.0,
-                check_same_thread=False  # We handle thread safety with _lock
-            )
-            self._conn.row_factory = sqlite3.Row
-            self._conn.execute("PRAGMA foreign_keys = ON")
-            self._conn.execute("PRAGMA journal_mode = WAL")
-        yield self._conn
+        if not self._write_lock.acquire(blocking=False):
+            start = time.perf_counter()
+            self._write_lock.acquire()
+            waited = time.perf_counter() - start
+            self._write_contended += 1
+            self._write_wait_total += waited
+            self._write_wait_max = max(self._write_wait_max, waited)
+        self._write_acquisitions += 1
+        
+        try:
+            if self._writer is None:
+                self._writer = self._connect()
+                self._writer.execute("PRAGMA journal_mode = WAL")
+            if self._pending:
+                # Queued updates happened before this write: apply them first
+                self._apply_pending(self._writer)
+            yield self._writer
+        finally:
+            self._write_lock.release()
+    
+    @contextmanager
+    def _read_connection(
+        self,
+        flush_pending: bool = True
+    ) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Get this thread's read-only connection.
+        
+        Connections are created on first use per thread. When a new one is
+        created, connections owned by threads that have exited are closed.
+        
+        Args:
+            flush_pending: Apply queued write-behind updates first. Only
+                          queries that don't read track state (playlists,
+                          membership, positions) pass False.
+        """
+        if flush_pending and self._pending:
+            self.flush()
+        
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._pool_lock:
+                self._reap_dead_readers()
+                self._readers[threading.current_thread()] = conn
+                self._readers_created += 1
+        yield conn
+    
+    def _reap_dead_readers(self) -> None:
+        """Close reader connections of finished threads (caller holds _pool_lock)."""
+        for thread in [t for t in self._readers if not t.is_alive()]:
+            try:
+                self._readers.pop(thread).close()
+            except sqlite3.Error:
+                pass
+    
+    def get_pool_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool size and write lock contention metrics.
+        
+        Returns:
+            Dict with: read_connections (open now), read_connections_created,
+            write_lock_acquisitions, write_lock_contended (had to wait),
+            write_lock_wait_total_ms, write_lock_wait_max_ms
+        """
+        with self._pool_lock:
+            read_connections = len(self._readers)
+        return {
+            "read_connections": read_connections,
+            "read_connections_created": self._readers_created,
+            "write_lock_acquisitions": self._write_acquisitions,
+            "write_lock_contended": self._write_contended,
+            "write_lock_wait_total_ms": round(self._write_wait_total * 1000, 1),
+            "write_lock_wait_max_ms": round(self._write_wait_max * 1000, 1),
+            "write_behind_pending": len(self._pending),
+            "write_behind_flushes": self._flushes,
+        }
+    
+    # =========================================================================
+    # Write-Behind Queue
+    # =========================================================================
+    
+    def _execute_state_update(
+        self,
+        sql: str,
+        params: tuple[Any, ...],
+        required_spotify_id: str | None = None
+    ) -> None:
+        """
+        Execute a per-track state update, or queue it in write-behind mode.
+        
+        Args:
+            sql: UPDATE (or upsert) statement.
+            params: Statement parameters.
+            required_spotify_id: If set, the update must match a row
+                                 ("Track not found" otherwise).
+        """
+        if self._write_behind:
+            with self._pending_cond:
+                self._pending.append((sql, params, required_spotify_id))
+                if len(self._pending) >= self._flush_rows:
+                    self._pending_cond.notify()
+            return
+        
+        with self._write_connection() as conn:
+            cursor = conn.execute(sql, params)
+            if required_spotify_id is not None and cursor.rowcount == 0:
+                raise DatabaseError(f"Track not found: {required_spotify_id}")
+            conn.commit()
+    
+    def _apply_pending(self, conn: sqlite3.Connection) -> None:
+        """Apply all queued updates in one transaction (caller holds the write lock)."""
+        with self._pending_cond:
+            ops, self._pending = self._pending, []
+        if not ops:
+            return
+        
+        try:
+            for sql, params, required_spotify_id in ops:
+                cursor = conn.execute(sql, params)
+                if required_spotify_id is not None and cursor.rowcount == 0:
+                    logger.warning(f"Deferred update skipped, track not found: {required_spotify_id}")
+            conn.commit()
+            self._flushes += 1
+        except sqlite3.Error as e:
+            conn.rollback()
+            # Keep the updates queued (in order) so a later flush can retry them
+            with self._pending_cond:
+                self._pending[:0] = ops
+            raise DatabaseError(
+                f"Failed to write {len(ops)} deferred updates: {e}",
+                details={"pending": len(ops)}
+            ) from e
+    
+    def flush(self) -> None:
+        """
+        Write all queued state updates to the database now.
+        
+        No-op when write-behind is disabled or nothing is queued.
+        
+        Raises:
+            DatabaseError: If the updates could not be written.
+                          They stay queued for the next flush.
+        """
+        if not self._pending:
+            return
+        with self._write_connection() as conn:
+            self._apply_pending(conn)
+    
+    def _flush_loop(self) -> None:
+        """Background thread: flush on interval or when the batch is full."""
+        while True:
+            with self._pending_cond:
+                if not self._closing and len(self._pending) < self._flush_rows:
+                    self._pending_cond.wait(self._flush_interval)
+                if self._closing:
+                    return  # close() performs the final flush
+            try:
+                self.flush()
+            except DatabaseError as e:
+                logger.error(f"Write-behind flush failed (will retry): {e}")
     
     def close(self) -> None:
-        """Close the database connection."""
-        with self._lock:
-            if self._conn is not None:
-                self._conn.close()
-                self._conn = None
+        """Flush queued updates, then close the writer and all reader connections."""
+        if self._flusher is not None:
+            with self._pending_cond:
+                self._closing = True
+                self._pending_cond.notify()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        
+        with self._write_lock:
+            if self._writer is not None:
+                # Refresh planner statistics where SQLite thinks they are stale
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._writer.close()
+                self._writer = None
+        with self._pool_lock:
+            for conn in self._readers.values():
+                conn.close()
+            self._readers.clear()
+        # Connections cached in other threads' locals are now closed; drop ours
+        self._local = threading.local()
     
     def __del__(self) -> None:
-        """Ensure connection is closed on garbage collection."""
-        if hasattr(self, '_conn') and self._conn is not None:
+        """Ensure connections are closed on garbage collection."""
+        if getattr(self, "_pending", None):
+            try:
+                self.flush()
+            except Exception:
+                pass
+        conns = list(getattr(self, "_readers", {}).values())
+        if getattr(self, "_writer", None) is not None:
+            conns.append(self._writer)
+        for conn in conns:
             try:
-                self._conn.close()
+                conn.close()
             except Exception:
                 pass
     
     def _init_database(self) -> None:
-        with self._get_connection() as conn:
-            conn.executescript(_SCHEMA_SQL)
-            
-            cursor = conn.execute("SELECT version FROM schema_version LIMIT 1")
-            row = cursor.fetchone()
+        with self._write_connection() as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+            )
+            row = None
+            if cursor.fetchone() is not None:
+                row = conn.execute("SELECT version FROM schema_version LIMIT 1").fetchone()
             
             if row is None:
+                conn.executescript(_SCHEMA_SQL)
                 conn.execute("INSERT INTO schema_version (version) VALUES (?)", (DATABASE_VERSION,))
-            elif row[0] != DATABASE_VERSION:
+            elif row[0] < DATABASE_VERSION:
+                self._migrate(conn, row[0])
+            elif row[0] > DATABASE_VERSION:
                 raise DatabaseError(
                     f"Database version mismatch: expected {DATABASE_VERSION}, got {row[0]}",
                     details={"expected": DATABASE_VERSION, "actual": row[0]}
                 )
             conn.commit()
     
+    def _migrate(self, conn: sqlite3.Connection, from_version: int) -> None:
+        """Upgrade an existing database one schema version at a time."""
+        for version in range(from_version + 1, DATABASE_VERSION + 1):
+            if version not in _MIGRATIONS:
+                raise DatabaseError(
+                    f"No migration path from database version {from_version} to {DATABASE_VERSION}",
+                    details={"expected": DATABASE_VERSION, "actual": from_version}
+                )
+            conn.executescript(_MIGRATIONS[version])
+            conn.execute("UPDATE schema_version SET version = ?", (version,))
+            conn.commit()
+            logger.info(f"Database schema migrated to version {version}")
+    
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat()
     
@@ -208,7 +627,37 @@ class Database:
         cursor = conn.execute("SELECT id FROM playlists WHERE spotify_id = ?", (spotify_id,))
         row = cursor.fetchone()
         return row[0] if row else None
-    
+
+    @contextmanager
+    def _spotify_id_set(
+        self,
+        conn: sqlite3.Connection,
+        spotify_ids: set[str]
+    ) -> Generator[str, None, None]:
+        """
+        Bulk-load spotify_ids into a temp table for set-based joins.
+
+        Replaces `IN (?, ?, ...)` lists, which hit SQLite's bind-variable
+        limit and are slow to plan for large playlists. Must be used with the
+        writer connection (readers are query_only, which also covers temp
+        tables). Yields the table name; the table is emptied on exit and the
+        caller commits.
+        
+        Read-only queries bind the ids as one JSON array and join
+        json_each(?) instead, on a reader (see get_matched_spotify_ids()).
+        """
+        # Plain heap table: callers join it against the indexed global_tracks
+        # column, so a key on it would only slow down the bulk load
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS id_set (spotify_id TEXT)")
+        conn.executemany(
+            "INSERT INTO temp.id_set (spotify_id) VALUES (?)",
+            ((spotify_id,) for spotify_id in spotify_ids)
+        )
+        try:
+            yield "temp.id_set"
+        finally:
+            conn.execute("DELETE FROM temp.id_set")
+
     def _serialize_track_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Convert Python types to SQLite-compatible values."""
         row = dict(data)
@@ -217,8 +666,12 @@ class Database:
             if field in row and isinstance(row[field], (list, tuple)):
                 row[field] = json.dumps(row[field])
         
-        if "metadata" in row and isinstance(row["metadata"], dict):
-            row["metadata"] = json.dumps(row["metadata"])
+        # Stored in track_raw_metadata by _store_raw_metadata(), not in global_tracks
+        if row.get("metadata") is not None:
+            metadata = row["metadata"]
+            if not isinstance(metadata, str):
+                metadata = json.dumps(metadata)
+            row["metadata"] = zlib.compress(metadata.encode("utf-8"))
         
         for field in ["downloaded", "lyrics_fetched", "lyrics_synced", 
                       "metadata_embedded", "lyrics_embedded", "explicit"]:
@@ -231,7 +684,10 @@ class Database:
         """Convert SQLite row to Python dict with proper types."""
         data = dict(row)
         
-        for field in ["artists", "genres", "metadata"]:
+        # Legacy column on migrated databases (always NULL); see get_raw_metadata()
+        data.pop("metadata", None)
+        
+        for field in ["artists", "genres"]:
             if field in data and data[field] is not None:
                 try:
                     data[field] = json.loads(data[field])
@@ -251,64 +707,106 @@ class Database:
     
     def add_playlist(self, playlist_id: str, spotify_url: str, name: str) -> None:
         """Create or update a playlist entry."""
-        with self._lock:
-            with self._get_connection() as conn:
-                conn.execute("""
-                    INSERT INTO playlists (spotify_id, spotify_url, name, last_synced)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(spotify_id) DO UPDATE SET
-                        spotify_url = excluded.spotify_url,
-                        name = excluded.name,
-                        last_synced = excluded.last_synced
-                """, (playlist_id, spotify_url, name, self._now_iso()))
-                conn.commit()
+        with self._write_connection() as conn:
+            conn.execute("""
+                INSERT INTO playlists (spotify_id, spotify_url, name, last_synced)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(spotify_id) DO UPDATE SET
+                    spotify_url = excluded.spotify_url,
+                    name = excluded.name,
+                    last_synced = excluded.last_synced
+            """, (playlist_id, spotify_url, name, self._now_iso()))
+            conn.commit()
+    
+    def get_playlist_snapshot_id(self, playlist_id: str) -> str | None:
+        """Get the Spotify snapshot_id stored by the last complete fetch."""
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute(
+                "SELECT snapshot_id FROM playlists WHERE spotify_id = ?",
+                (playlist_id,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+    
+    def set_playlist_snapshot_id(self, playlist_id: str, snapshot_id: str | None) -> None:
+        """
+        Store the Spotify snapshot_id of a playlist.
+        
+        Only call this after the playlist's tracks and links have been fully
+        stored, so an interrupted fetch is never mistaken for an unchanged one.
+        """
+        with self._write_connection() as conn:
+            conn.execute(
+                "UPDATE playlists SET snapshot_id = ? WHERE spotify_id = ?",
+                (snapshot_id, playlist_id)
+            )
+            conn.commit()
+    
+    def get_playlist_last_full_sync(self, playlist_id: str) -> str | None:
+        """Get the ISO timestamp of the last complete fetch (None if never)."""
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute(
+                "SELECT last_full_sync FROM playlists WHERE spotify_id = ?",
+                (playlist_id,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+    
+    def set_playlist_last_full_sync(self, playlist_id: str) -> None:
+        """
+        Record that a playlist was just fetched completely.
+        
+        Like set_playlist_snapshot_id(), only call this once all tracks and
+        links are stored and orphaned links have been removed.
+        """
+        with self._write_connection() as conn:
+            conn.execute(
+                "UPDATE playlists SET last_full_sync = ? WHERE spotify_id = ?",
+                (self._now_iso(), playlist_id)
+            )
+            conn.commit()
     
     def ensure_liked_songs_exists(self) -> None:
         """Ensure the __liked_songs__ playlist entry exists."""
-        with self._lock:
-            with self._get_connection() as conn:
-                conn.execute("""
-                    INSERT INTO playlists (spotify_id, spotify_url, name, last_synced)
-                    VALUES (?, NULL, 'Liked Songs', ?)
-                    ON CONFLICT(spotify_id) DO UPDATE SET last_synced = excluded.last_synced
-                """, (LIKED_SONGS_KEY, self._now_iso()))
-                conn.commit()
+        with self._write_connection() as conn:
+            conn.execute("""
+                INSERT INTO playlists (spotify_id, spotify_url, name, last_synced)
+                VALUES (?, NULL, 'Liked Songs', ?)
+                ON CONFLICT(spotify_id) DO UPDATE SET last_synced = excluded.last_synced
+            """, (LIKED_SONGS_KEY, self._now_iso()))
+            conn.commit()
     
     def playlist_exists(self, playlist_id: str) -> bool:
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("SELECT 1 FROM playlists WHERE spotify_id = ?", (playlist_id,))
-                return cursor.fetchone() is not None
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute("SELECT 1 FROM playlists WHERE spotify_id = ?", (playlist_id,))
+            return cursor.fetchone() is not None
     
     def get_playlist_info(self, playlist_id: str) -> dict[str, Any] | None:
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT spotify_url, name, last_synced FROM playlists WHERE spotify_id = ?",
-                    (playlist_id,)
-                )
-                row = cursor.fetchone()
-                return dict(row) if row else None
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute(
+                "SELECT spotify_url, name, last_synced, snapshot_id FROM playlists WHERE spotify_id = ?",
+                (playlist_id,)
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
     
     def get_all_playlists(self) -> list[dict[str, Any]]:
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT spotify_id, spotify_url, name, last_synced FROM playlists ORDER BY name"
-                )
-                return [dict(row) for row in cursor.fetchall()]
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute(
+                "SELECT spotify_id, spotify_url, name, last_synced FROM playlists ORDER BY name"
+            )
+            return [dict(row) for row in cursor.fetchall()]
     
     def get_active_playlist_id(self) -> str | None:
         """Get the most recently synced playlist ID."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT spotify_id FROM playlists 
-                    WHERE last_synced IS NOT NULL
-                    ORDER BY last_synced DESC LIMIT 1
-                """)
-                row = cursor.fetchone()
-                return row[0] if row else None
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute("""
+                SELECT spotify_id FROM playlists 
+                WHERE last_synced IS NOT NULL
+                ORDER BY last_synced DESC LIMIT 1
+            """)
+            row = cursor.fetchone()
+            return row[0] if row else None
     
     # =========================================================================
     # Global Track Registry
@@ -321,16 +819,15 @@ class Database:
         If track exists, updates metadata but preserves processing state
         (youtube_url, downloaded, lyrics, etc.).
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("SELECT id FROM global_tracks WHERE spotify_id = ?", (spotify_id,))
-                row = cursor.fetchone()
-                
-                if row:
-                    self._update_track_metadata(conn, row[0], track_data)
-                    return row[0]
-                
-                return self._insert_global_track(conn, spotify_id, track_data)
+        with self._write_connection() as conn:
+            cursor = conn.execute("SELECT id FROM global_tracks WHERE spotify_id = ?", (spotify_id,))
+            row = cursor.fetchone()
+            
+            if row:
+                self._update_track_metadata(conn, row[0], track_data)
+                return row[0]
+            
+            return self._insert_global_track(conn, spotify_id, track_data)
     
     def _insert_global_track(self, conn: sqlite3.Connection, spotify_id: str, track_data: dict[str, Any]) -> int:
         row = self._serialize_track_data(track_data)
@@ -341,8 +838,8 @@ class Database:
                 spotify_id, name, artist, artists, album, duration_ms, spotify_url,
                 isrc, cover_url, release_date, track_number, disc_number, year,
                 genres, publisher, copyright, explicit, popularity, preview_url,
-                metadata, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             spotify_id, row.get("name"), row.get("artist"), row.get("artists"),
             row.get("album"), row.get("duration_ms"), row.get("spotify_url"),
@@ -350,8 +847,9 @@ class Database:
             row.get("track_number"), row.get("disc_number"), row.get("year"),
             row.get("genres"), row.get("publisher"), row.get("copyright"),
             row.get("explicit"), row.get("popularity"), row.get("preview_url"),
-            row.get("metadata"), now, now
+            now, now
         ))
+        self._store_raw_metadata(conn, cursor.lastrowid, row.get("metadata"))
         conn.commit()
         return cursor.lastrowid
     
@@ -365,7 +863,7 @@ class Database:
                 spotify_url = ?, isrc = ?, cover_url = ?, release_date = ?,
                 track_number = ?, disc_number = ?, year = ?, genres = ?,
                 publisher = ?, copyright = ?, explicit = ?, popularity = ?,
-                preview_url = ?, metadata = ?, updated_at = ?
+                preview_url = ?, updated_at = ?
             WHERE id = ?
         """, (
             row.get("name"), row.get("artist"), row.get("artists"), row.get("album"),
@@ -373,35 +871,175 @@ class Database:
             row.get("cover_url"), row.get("release_date"), row.get("track_number"),
             row.get("disc_number"), row.get("year"), row.get("genres"),
             row.get("publisher"), row.get("copyright"), row.get("explicit"),
-            row.get("popularity"), row.get("preview_url"), row.get("metadata"),
+            row.get("popularity"), row.get("preview_url"),
             self._now_iso(), track_id
         ))
+        self._store_raw_metadata(conn, track_id, row.get("metadata"))
         conn.commit()
     
+    def _store_raw_metadata(self, conn: sqlite3.Connection, track_id: int, data: bytes | None) -> None:
+        """Upsert the compressed Spotify response for a track (no-op if None)."""
+        if data is None:
+            return
+        conn.execute("""
+            INSERT INTO track_raw_metadata (track_id, data) VALUES (?, ?)
+            ON CONFLICT(track_id) DO UPDATE SET data = excluded.data
+        """, (track_id, data))
+    
+    def upsert_tracks_and_links(
+        self,
+        playlist_id: str,
+        tracks: list[dict[str, Any]]
+    ) -> list[int]:
+        """
+        Batched equivalent of get_or_create_global_track() + link_track_to_playlist().
+
+        All tracks are upserted into global_tracks and linked to the playlist
+        inside a single transaction, so a large playlist costs one commit
+        instead of two per track. Processing state is preserved for existing
+        tracks exactly as in get_or_create_global_track().
+
+        Args:
+            playlist_id: Spotify playlist ID (or LIKED_SONGS_KEY).
+            tracks: One dict per track with keys:
+                    - spotify_id: Spotify track ID
+                    - track_data: Metadata dict (same format as get_or_create_global_track)
+                    - position: Track position in playlist (1-indexed)
+                    - added_at: ISO timestamp when track was added (optional)
+
+        Returns:
+            Database IDs of the tracks, in input order.
+        """
+        if not tracks:
+            return []
+
+        with self._write_connection() as conn:
+            db_playlist_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_playlist_id is None:
+                raise DatabaseError(f"Playlist not found: {playlist_id}")
+
+            now = self._now_iso()
+            try:
+                track_db_ids = [
+                    self._upsert_global_track(conn, t["spotify_id"], t["track_data"], now)
+                    for t in tracks
+                ]
+
+                conn.executemany("""
+                    INSERT INTO playlist_tracks (playlist_id, track_id, position, added_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(playlist_id, track_id) DO UPDATE SET
+                        position = excluded.position,
+                        added_at = COALESCE(excluded.added_at, playlist_tracks.added_at)
+                """, [
+                    (db_playlist_id, track_db_id, t["position"], t.get("added_at"))
+                    for track_db_id, t in zip(track_db_ids, tracks)
+                ])
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise DatabaseError(
+                    f"Failed to store tracks: {e}",
+                    details={"playlist_id": playlist_id, "track_count": len(tracks)}
+                ) from e
+
+            return track_db_ids
+
+    def _upsert_global_track(
+        self,
+        conn: sqlite3.Connection,
+        spotify_id: str,
+        track_data: dict[str, Any],
+        now: str
+    ) -> int:
+        """Insert or update one global track without committing. Returns the database ID."""
+        row = self._serialize_track_data(track_data)
+
+        cursor = conn.execute(f"""
+            INSERT INTO global_tracks (
+                spotify_id, name, artist, artists, album, duration_ms, spotify_url,
+                isrc, cover_url, release_date, track_number, disc_number, year,
+                genres, publisher, copyright, explicit, popularity, preview_url,
+                created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(spotify_id) DO UPDATE SET
+                name = excluded.name, artist = excluded.artist, artists = excluded.artists,
+                album = excluded.album, duration_ms = excluded.duration_ms,
+                spotify_url = excluded.spotify_url, isrc = excluded.isrc,
+                cover_url = excluded.cover_url, release_date = excluded.release_date,
+                track_number = excluded.track_number, disc_number = excluded.disc_number,
+                year = excluded.year, genres = excluded.genres,
+                publisher = excluded.publisher, copyright = excluded.copyright,
+                explicit = excluded.explicit, popularity = excluded.popularity,
+                preview_url = excluded.preview_url, updated_at = excluded.updated_at
+            {"RETURNING id" if _SUPPORTS_RETURNING else ""}
+        """, (
+            spotify_id, row.get("name"), row.get("artist"), row.get("artists"),
+            row.get("album"), row.get("duration_ms"), row.get("spotify_url"),
+            row.get("isrc"), row.get("cover_url"), row.get("release_date"),
+            row.get("track_number"), row.get("disc_number"), row.get("year"),
+            row.get("genres"), row.get("publisher"), row.get("copyright"),
+            row.get("explicit"), row.get("popularity"), row.get("preview_url"),
+            now, now
+        ))
+
+        if _SUPPORTS_RETURNING:
+            track_db_id = cursor.fetchone()[0]
+        else:
+            # SQLite < 3.35: lastrowid is unreliable for the UPDATE branch of an upsert
+            cursor = conn.execute("SELECT id FROM global_tracks WHERE spotify_id = ?", (spotify_id,))
+            track_db_id = cursor.fetchone()[0]
+
+        self._store_raw_metadata(conn, track_db_id, row.get("metadata"))
+        return track_db_id
+
     def get_global_track(self, spotify_id: str) -> dict[str, Any] | None:
         """Get a track by its Spotify ID."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("SELECT * FROM global_tracks WHERE spotify_id = ?", (spotify_id,))
-                row = cursor.fetchone()
-                if row:
-                    data = self._deserialize_track_row(row)
-                    data["track_id"] = row["spotify_id"]  # Convenience alias
-                    return data
-                return None
+        with self._read_connection() as conn:
+            cursor = conn.execute("SELECT * FROM global_tracks WHERE spotify_id = ?", (spotify_id,))
+            row = cursor.fetchone()
+            if row:
+                data = self._deserialize_track_row(row)
+                data["track_id"] = row["spotify_id"]  # Convenience alias
+                return data
+            return None
     
     def get_global_track_by_path(self, file_path: str) -> dict[str, Any] | None:
         """Get a track by its file path (for --replace)."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("SELECT * FROM global_tracks WHERE file_path = ?", (file_path,))
-                row = cursor.fetchone()
-                if row:
-                    data = self._deserialize_track_row(row)
-                    data["track_id"] = row["spotify_id"]
-                    return data
-                return None
-    
+        with self._read_connection() as conn:
+            cursor = conn.execute("SELECT * FROM global_tracks WHERE file_path = ?", (file_path,))
+            row = cursor.fetchone()
+            if row:
+                data = self._deserialize_track_row(row)
+                data["track_id"] = row["spotify_id"]
+                return data
+            return None
+
+    def get_raw_metadata(self, spotify_id: str) -> dict[str, Any] | None:
+        """
+        Get the full Spotify response stored for a track (lazy, for PHASE 5).
+
+        Returns None if the track is unknown or no response was stored.
+        """
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT m.data FROM track_raw_metadata m
+                JOIN global_tracks g ON g.id = m.track_id
+                WHERE g.spotify_id = ?
+            """, (spotify_id,))
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        data = row[0]
+        if isinstance(data, bytes):
+            data = zlib.decompress(data).decode("utf-8")
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid raw metadata for track {spotify_id}")
+            return None
+
     # =========================================================================
     # Playlist-Track Links
     # =========================================================================
@@ -422,35 +1060,108 @@ class Database:
             position: Track position in playlist (1-indexed)
             added_at: ISO timestamp when track was added to playlist
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                db_playlist_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_playlist_id is None:
-                    raise DatabaseError(f"Playlist not found: {playlist_id}")
-                
-                conn.execute("""
-                    INSERT INTO playlist_tracks (playlist_id, track_id, position, added_at)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(playlist_id, track_id) DO UPDATE SET
-                        position = excluded.position,
-                        added_at = COALESCE(excluded.added_at, playlist_tracks.added_at)
-                """, (db_playlist_id, track_db_id, position, added_at))
-                conn.commit()
+        with self._write_connection() as conn:
+            db_playlist_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_playlist_id is None:
+                raise DatabaseError(f"Playlist not found: {playlist_id}")
+            
+            conn.execute("""
+                INSERT INTO playlist_tracks (playlist_id, track_id, position, added_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(playlist_id, track_id) DO UPDATE SET
+                    position = excluded.position,
+                    added_at = COALESCE(excluded.added_at, playlist_tracks.added_at)
+            """, (db_playlist_id, track_db_id, position, added_at))
+            conn.commit()
     
     def get_playlist_track_ids(self, playlist_id: str) -> set[str]:
         """Get all Spotify track IDs in a playlist (for sync mode filtering)."""
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return set()
-                
-                cursor = conn.execute("""
-                    SELECT g.spotify_id FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ?
-                """, (db_id,))
-                return {row[0] for row in cursor.fetchall()}
+        with self._read_connection(flush_pending=False) as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return set()
+            
+            cursor = conn.execute("""
+                SELECT g.spotify_id FROM global_tracks g
+                JOIN playlist_tracks pt ON g.id = pt.track_id
+                WHERE pt.playlist_id = ?
+            """, (db_id,))
+            return {row[0] for row in cursor.fetchall()}
+    
+    def get_playlist_links(self, playlist_id: str) -> dict[str, tuple[int, str | None]]:
+        """
+        Get position and added_at of every track linked to a playlist.
+        
+        Returns:
+            Dict mapping spotify_id to (position, added_at).
+        """
+        with self._read_connection(flush_pending=False) as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return {}
+            
+            cursor = conn.execute("""
+                SELECT g.spotify_id, pt.position, pt.added_at FROM global_tracks g
+                JOIN playlist_tracks pt ON g.id = pt.track_id
+                WHERE pt.playlist_id = ?
+            """, (db_id,))
+            return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+    
+    def splice_playlist_head(
+        self,
+        playlist_id: str,
+        old_head_end: int,
+        head_spotify_ids: set[str],
+        new_head_size: int
+    ) -> int:
+        """
+        Make room for a re-fetched head of a playlist (incremental sync).
+        
+        The first old_head_end positions are being replaced by
+        new_head_size tracks that the caller stores afterwards with
+        upsert_tracks_and_links(). In one transaction this:
+        - removes links at positions <= old_head_end whose track is not in
+          head_spotify_ids (removed from the head on Spotify), and
+        - shifts every link after old_head_end by
+          new_head_size - old_head_end, so the tail keeps its order behind
+          the new head.
+        
+        Removals from the tail are not detected; that needs a complete
+        fetch and sync_playlist_tracks().
+        
+        Args:
+            playlist_id: Spotify playlist ID (or LIKED_SONGS_KEY).
+            old_head_end: Last stored position covered by the new head.
+            head_spotify_ids: spotify_ids of the new head.
+            new_head_size: Number of positions the new head occupies.
+        
+        Returns:
+            Number of links removed from the head.
+        """
+        with self._write_connection() as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return 0
+            
+            with self._spotify_id_set(conn, head_spotify_ids) as id_table:
+                cursor = conn.execute(f"""
+                    DELETE FROM playlist_tracks
+                    WHERE playlist_id = ?
+                    AND position <= ?
+                    AND track_id NOT IN (
+                        SELECT g.id FROM {id_table} v
+                        JOIN global_tracks g ON g.spotify_id = v.spotify_id
+                    )
+                """, (db_id, old_head_end))
+                removed = cursor.rowcount
+            
+            conn.execute("""
+                UPDATE playlist_tracks SET position = position + ?
+                WHERE playlist_id = ? AND position > ?
+            """, (new_head_size - old_head_end, db_id, old_head_end))
+            
+            conn.commit()
+            return removed
     
     def get_liked_songs_track_ids(self) -> set[str]:
         """Convenience method for sync mode with liked songs."""
@@ -458,26 +1169,25 @@ class Database:
     
     def get_playlist_tracks(self, playlist_id: str) -> list[dict[str, Any]]:
         """Get all tracks in a playlist, ordered by position."""
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return []
-                
-                cursor = conn.execute("""
-                    SELECT g.*, pt.position, pt.added_at as playlist_added_at
-                    FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ?
-                    ORDER BY pt.position
-                """, (db_id,))
-                
-                result = []
-                for row in cursor.fetchall():
-                    track = self._deserialize_track_row(row)
-                    track["track_id"] = row["spotify_id"]
-                    result.append(track)
-                return result
+        with self._read_connection() as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return []
+            
+            cursor = conn.execute("""
+                SELECT g.*, pt.position, pt.added_at as playlist_added_at
+                FROM global_tracks g
+                JOIN playlist_tracks pt ON g.id = pt.track_id
+                WHERE pt.playlist_id = ?
+                ORDER BY pt.position
+            """, (db_id,))
+            
+            result = []
+            for row in cursor.fetchall():
+                track = self._deserialize_track_row(row)
+                track["track_id"] = row["spotify_id"]
+                result.append(track)
+            return result
     
     def get_playlists_containing_track(self, spotify_id: str) -> list[dict[str, Any]]:
         """
@@ -485,30 +1195,28 @@ class Database:
         
         Returns list of dicts with: playlist_spotify_id, name, position
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT p.spotify_id as playlist_spotify_id, p.name, pt.position
-                    FROM playlists p
-                    JOIN playlist_tracks pt ON p.id = pt.playlist_id
-                    JOIN global_tracks g ON pt.track_id = g.id
-                    WHERE g.spotify_id = ?
-                    ORDER BY p.name
-                """, (spotify_id,))
-                return [dict(row) for row in cursor.fetchall()]
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute("""
+                SELECT p.spotify_id as playlist_spotify_id, p.name, pt.position
+                FROM playlists p
+                JOIN playlist_tracks pt ON p.id = pt.playlist_id
+                JOIN global_tracks g ON pt.track_id = g.id
+                WHERE g.spotify_id = ?
+                ORDER BY p.name
+            """, (spotify_id,))
+            return [dict(row) for row in cursor.fetchall()]
     
     def get_max_position(self, playlist_id: str) -> int:
         """Get the highest position number in a playlist."""
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return 0
-                cursor = conn.execute(
-                    "SELECT MAX(position) FROM playlist_tracks WHERE playlist_id = ?", (db_id,)
-                )
-                row = cursor.fetchone()
-                return row[0] if row[0] is not None else 0
+        with self._read_connection(flush_pending=False) as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return 0
+            cursor = conn.execute(
+                "SELECT MAX(position) FROM playlist_tracks WHERE playlist_id = ?", (db_id,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row[0] is not None else 0
     
     # =========================================================================
     # Track Processing Queries (Global - not per-playlist)
@@ -516,52 +1224,154 @@ class Database:
     
     def get_tracks_needing_youtube_match(self) -> list[dict[str, Any]]:
         """Get all tracks that need YouTube matching (youtube_url IS NULL)."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM global_tracks 
-                    WHERE youtube_url IS NULL 
-                    ORDER BY created_at
-                """)
-                return self._fetch_tracks_with_id(cursor)
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM global_tracks 
+                WHERE youtube_url IS NULL 
+                ORDER BY created_at
+            """)
+            return self._fetch_tracks_with_id(cursor)
     
     def get_tracks_needing_download(self) -> list[dict[str, Any]]:
         """Get all tracks matched but not downloaded."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM global_tracks
-                    WHERE youtube_url IS NOT NULL 
-                    AND youtube_url != ?
-                    AND downloaded = 0
-                    ORDER BY created_at
-                """, (YOUTUBE_MATCH_FAILED,))
-                return self._fetch_tracks_with_id(cursor)
+        with self._read_connection() as conn:
+            # Literal (not bound) MATCH_FAILED so idx_pending_download applies
+            cursor = conn.execute(f"""
+                SELECT * FROM global_tracks
+                WHERE youtube_url IS NOT NULL 
+                AND youtube_url != '{YOUTUBE_MATCH_FAILED}'
+                AND downloaded = 0
+                ORDER BY created_at
+            """)
+            return self._fetch_tracks_with_id(cursor)
     
     def get_tracks_needing_lyrics(self) -> list[dict[str, Any]]:
         """Get all downloaded tracks that need lyrics fetching."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM global_tracks
-                    WHERE downloaded = 1 AND lyrics_fetched = 0
-                    ORDER BY created_at
-                """)
-                return self._fetch_tracks_with_id(cursor)
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM global_tracks
+                WHERE downloaded = 1 AND lyrics_fetched = 0
+                ORDER BY created_at
+            """)
+            return self._fetch_tracks_with_id(cursor)
     
     def get_tracks_needing_embedding(self) -> list[dict[str, Any]]:
         """Get all tracks needing metadata or lyrics embedding."""
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM global_tracks
-                    WHERE downloaded = 1 AND (
-                        metadata_embedded = 0 
-                        OR (lyrics_fetched = 1 AND lyrics_text IS NOT NULL AND lyrics_embedded = 0)
-                    )
-                    ORDER BY created_at
-                """)
-                return self._fetch_tracks_with_id(cursor)
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM global_tracks
+                WHERE downloaded = 1 AND (
+                    metadata_embedded = 0 
+                    OR (lyrics_fetched = 1 AND lyrics_text IS NOT NULL AND lyrics_embedded = 0)
+                )
+                ORDER BY created_at
+            """)
+            return self._fetch_tracks_with_id(cursor)
+    
+    # Work-queue predicates, kept identical to the partial index definitions
+    _MATCH_QUEUE_WHERE = "youtube_url IS NULL"
+    _DOWNLOAD_QUEUE_WHERE = (
+        f"youtube_url IS NOT NULL AND youtube_url != '{YOUTUBE_MATCH_FAILED}' AND downloaded = 0"
+    )
+    
+    def iter_tracks_needing_youtube_match(
+        self, page_size: int = WORK_QUEUE_PAGE_SIZE
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield tracks needing YouTube matching, with the columns Track needs."""
+        return self._iter_work_queue(
+            _MATCH_QUEUE_COLUMNS, "idx_pending_match", self._MATCH_QUEUE_WHERE, page_size
+        )
+    
+    def iter_tracks_needing_download(
+        self, page_size: int = WORK_QUEUE_PAGE_SIZE
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield matched, not yet downloaded tracks (id, name, artist, URLs only)."""
+        return self._iter_work_queue(
+            _DOWNLOAD_QUEUE_COLUMNS, "idx_pending_download", self._DOWNLOAD_QUEUE_WHERE, page_size
+        )
+    
+    def count_tracks_needing_youtube_match(self) -> int:
+        """Count tracks needing YouTube matching (progress total for PHASE 2)."""
+        return self._count_work_queue("idx_pending_match", self._MATCH_QUEUE_WHERE)
+    
+    def count_tracks_needing_download(self) -> int:
+        """Count matched, not yet downloaded tracks (progress total for PHASE 3)."""
+        return self._count_work_queue("idx_pending_download", self._DOWNLOAD_QUEUE_WHERE)
+    
+    def _count_work_queue(self, index: str, where: str) -> int:
+        """Count a work queue by scanning its partial index (pending rows only)."""
+        with self._read_connection() as conn:
+            row = conn.execute(
+                f"SELECT COUNT(*) FROM global_tracks INDEXED BY {index} WHERE {where}"
+            ).fetchone()
+            return row[0]
+    
+    def _iter_work_queue(
+        self,
+        columns: tuple[str, ...],
+        index: str,
+        where: str,
+        page_size: int
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Page through a work queue in created_at order.
+        
+        Uses keyset pagination on (created_at, id): each page is a separate
+        short query, so no read transaction stays open while the caller
+        processes rows, and rows updated by the caller in the meantime are
+        neither skipped nor repeated.
+        
+        The partial index is forced with INDEXED BY: without statistics the
+        planner may prefer a plain column index and re-sort the whole queue
+        for every page. SQLite raises an error if `where` no longer matches
+        the index definition.
+        """
+        first_page, next_page = self._work_queue_sql(columns, index, where)
+        
+        last_key: tuple[str, int] | None = None
+        while True:
+            with self._read_connection() as conn:
+                if last_key is None:
+                    rows = conn.execute(first_page, (page_size,)).fetchall()
+                else:
+                    rows = conn.execute(next_page, (*last_key, page_size)).fetchall()
+            
+            for row in rows:
+                track = self._deserialize_track_row(row)
+                del track["id"], track["created_at"]
+                track["track_id"] = row["spotify_id"]
+                yield track
+            
+            if len(rows) < page_size:
+                return
+            last_key = (rows[-1]["created_at"], rows[-1]["id"])
+    
+    @staticmethod
+    def _work_queue_sql(columns: tuple[str, ...], index: str, where: str) -> tuple[str, str]:
+        """Return the (first page, next page) queries of _iter_work_queue()."""
+        select = (
+            f"SELECT id, created_at, {', '.join(columns)} "
+            f"FROM global_tracks INDEXED BY {index} WHERE {where}"
+        )
+        first_page = f"{select} ORDER BY created_at, id LIMIT ?"
+        next_page = f"{select} AND (created_at, id) > (?, ?) ORDER BY created_at, id LIMIT ?"
+        return first_page, next_page
+    
+    def get_matched_spotify_ids(self, spotify_ids: set[str]) -> set[str]:
+        """
+        Return the subset of spotify_ids that already have a youtube_url
+        (including MATCH_FAILED), in one set-based query.
+        """
+        if not spotify_ids:
+            return set()
+        
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT g.spotify_id FROM json_each(?) v
+                JOIN global_tracks g ON g.spotify_id = v.value
+                WHERE g.youtube_url IS NOT NULL
+            """, (json.dumps(list(spotify_ids)),))
+            return {row[0] for row in cursor}
     
     def _fetch_tracks_with_id(self, cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
         """Helper to fetch tracks and add track_id alias."""
@@ -578,18 +1388,12 @@ class Database:
     
     def set_youtube_url(self, spotify_id: str, youtube_url: str, score: float | None = None) -> None:
         """Set YouTube URL for a track (updates globally, affects all playlists)."""
-        with self._lock:
-            with self._get_connection() as conn:
-                now = self._now_iso()
-                cursor = conn.execute("""
-                    UPDATE global_tracks 
-                    SET youtube_url = ?, match_score = ?, match_timestamp = ?, updated_at = ?
-                    WHERE spotify_id = ?
-                """, (youtube_url, score, now, now, spotify_id))
-                
-                if cursor.rowcount == 0:
-                    raise DatabaseError(f"Track not found: {spotify_id}")
-                conn.commit()
+        now = self._now_iso()
+        self._execute_state_update("""
+            UPDATE global_tracks 
+            SET youtube_url = ?, match_score = ?, match_timestamp = ?, updated_at = ?
+            WHERE spotify_id = ?
+        """, (youtube_url, score, now, now, spotify_id), required_spotify_id=spotify_id)
     
     def mark_youtube_match_failed(self, spotify_id: str) -> None:
         """Mark a track as failed to match on YouTube."""
@@ -597,84 +1401,86 @@ class Database:
     
     def mark_downloaded(self, spotify_id: str, file_path: Path | str) -> None:
         """Mark track as downloaded with canonical file path."""
-        with self._lock:
-            with self._get_connection() as conn:
-                now = self._now_iso()
-                cursor = conn.execute("""
-                    UPDATE global_tracks 
-                    SET downloaded = 1, file_path = ?, download_timestamp = ?, updated_at = ?
-                    WHERE spotify_id = ?
-                """, (str(file_path), now, now, spotify_id))
-                
-                if cursor.rowcount == 0:
-                    raise DatabaseError(f"Track not found: {spotify_id}")
-                conn.commit()
+        now = self._now_iso()
+        self._execute_state_update("""
+            UPDATE global_tracks 
+            SET downloaded = 1, file_path = ?, download_timestamp = ?, updated_at = ?
+            WHERE spotify_id = ?
+        """, (str(file_path), now, now, spotify_id), required_spotify_id=spotify_id)
     
     def set_lyrics(self, spotify_id: str, lyrics_text: str, is_synced: bool, source: str) -> None:
         """Store fetched lyrics for a track."""
-        with self._lock:
-            with self._get_connection() as conn:
-                now = self._now_iso()
-                cursor = conn.execute("""
-                    UPDATE global_tracks 
-                    SET lyrics_text = ?, lyrics_synced = ?, lyrics_source = ?, 
-                        lyrics_fetched = 1, updated_at = ?
-                    WHERE spotify_id = ?
-                """, (lyrics_text, 1 if is_synced else 0, source, now, spotify_id))
-                
-                if cursor.rowcount == 0:
-                    raise DatabaseError(f"Track not found: {spotify_id}")
-                conn.commit()
+        self._execute_state_update("""
+            UPDATE global_tracks 
+            SET lyrics_text = ?, lyrics_synced = ?, lyrics_source = ?, 
+                lyrics_fetched = 1, updated_at = ?
+            WHERE spotify_id = ?
+        """, (lyrics_text, 1 if is_synced else 0, source, self._now_iso(), spotify_id),
+            required_spotify_id=spotify_id)
     
     def mark_lyrics_not_found(self, spotify_id: str) -> None:
         """Mark that lyrics fetch was attempted but not found."""
-        with self._lock:
-            with self._get_connection() as conn:
-                now = self._now_iso()
-                conn.execute("""
-                    UPDATE global_tracks SET lyrics_fetched = 1, updated_at = ?
-                    WHERE spotify_id = ?
-                """, (now, spotify_id))
-                conn.commit()
+        self._execute_state_update("""
+            UPDATE global_tracks SET lyrics_fetched = 1, updated_at = ?
+            WHERE spotify_id = ?
+        """, (self._now_iso(), spotify_id))
     
     def mark_metadata_embedded(self, spotify_id: str, new_file_path: Path | str | None = None) -> None:
         """Mark track as having metadata embedded."""
-        with self._lock:
-            with self._get_connection() as conn:
-                now = self._now_iso()
-                if new_file_path:
-                    conn.execute("""
-                        UPDATE global_tracks 
-                        SET metadata_embedded = 1, file_path = ?, updated_at = ?
-                        WHERE spotify_id = ?
-                    """, (str(new_file_path), now, spotify_id))
-                else:
-                    conn.execute("""
-                        UPDATE global_tracks SET metadata_embedded = 1, updated_at = ?
-                        WHERE spotify_id = ?
-                    """, (now, spotify_id))
-                conn.commit()
+        now = self._now_iso()
+        if new_file_path:
+            self._execute_state_update("""
+                UPDATE global_tracks 
+                SET metadata_embedded = 1, file_path = ?, updated_at = ?
+                WHERE spotify_id = ?
+            """, (str(new_file_path), now, spotify_id))
+        else:
+            self._execute_state_update("""
+                UPDATE global_tracks SET metadata_embedded = 1, updated_at = ?
+                WHERE spotify_id = ?
+            """, (now, spotify_id))
     
     def mark_lyrics_embedded(self, spotify_id: str) -> None:
         """Mark track as having lyrics embedded."""
-        with self._lock:
-            with self._get_connection() as conn:
-                conn.execute("""
-                    UPDATE global_tracks SET lyrics_embedded = 1, updated_at = ?
-                    WHERE spotify_id = ?
-                """, (self._now_iso(), spotify_id))
-                conn.commit()
+        self._execute_state_update("""
+            UPDATE global_tracks SET lyrics_embedded = 1, updated_at = ?
+            WHERE spotify_id = ?
+        """, (self._now_iso(), spotify_id))
     
     def reset_embedding_flags(self, spotify_id: str) -> None:
         """Reset embedding flags after --replace (track needs re-embedding)."""
-        with self._lock:
-            with self._get_connection() as conn:
-                conn.execute("""
-                    UPDATE global_tracks 
-                    SET metadata_embedded = 0, lyrics_embedded = 0, updated_at = ?
-                    WHERE spotify_id = ?
-                """, (self._now_iso(), spotify_id))
-                conn.commit()
+        self._execute_state_update("""
+            UPDATE global_tracks 
+            SET metadata_embedded = 0, lyrics_embedded = 0, updated_at = ?
+            WHERE spotify_id = ?
+        """, (self._now_iso(), spotify_id))
+    
+    def update_youtube_urls(
+        self,
+        matches: dict[str, tuple[str | None, float | None]]
+    ) -> None:
+        """
+        Set the YouTube URL and match score of many tracks in one transaction.
+        
+        Args:
+            matches: Spotify ID -> (YouTube URL, score). The URL may be
+                    YOUTUBE_MATCH_FAILED, or None (pending: matched again by
+                    the next PHASE 2, with a None score).
+        """
+        if not matches:
+            return
+        
+        now = self._now_iso()
+        with self._write_connection() as conn:
+            conn.executemany("""
+                UPDATE global_tracks
+                SET youtube_url = ?, match_score = ?, match_timestamp = ?, updated_at = ?
+                WHERE spotify_id = ?
+            """, [
+                (url, score, now if url is not None else None, now, spotify_id)
+                for spotify_id, (url, score) in matches.items()
+            ])
+            conn.commit()
     
     def reset_failed_matches(self, playlist_id: str | None = None) -> int:
         """
@@ -687,29 +1493,230 @@ class Database:
         Returns:
             Number of tracks reset.
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                now = self._now_iso()
-                
-                if playlist_id is not None:
-                    db_id = self._get_playlist_db_id(conn, playlist_id)
-                    if db_id is None:
-                        return 0
-                    cursor = conn.execute("""
-                        UPDATE global_tracks 
-                        SET youtube_url = NULL, match_score = NULL, match_timestamp = NULL, updated_at = ?
-                        WHERE youtube_url = ?
-                        AND id IN (SELECT track_id FROM playlist_tracks WHERE playlist_id = ?)
-                    """, (now, YOUTUBE_MATCH_FAILED, db_id))
-                else:
-                    cursor = conn.execute("""
-                        UPDATE global_tracks 
-                        SET youtube_url = NULL, match_score = NULL, match_timestamp = NULL, updated_at = ?
-                        WHERE youtube_url = ?
-                    """, (now, YOUTUBE_MATCH_FAILED))
-                
-                conn.commit()
-                return cursor.rowcount
+        with self._write_connection() as conn:
+            now = self._now_iso()
+            
+            if playlist_id is not None:
+                db_id = self._get_playlist_db_id(conn, playlist_id)
+                if db_id is None:
+                    return 0
+                cursor = conn.execute("""
+                    UPDATE global_tracks 
+                    SET youtube_url = NULL, match_score = NULL, match_timestamp = NULL, updated_at = ?
+                    WHERE youtube_url = ?
+                    AND id IN (SELECT track_id FROM playlist_tracks WHERE playlist_id = ?)
+                """, (now, YOUTUBE_MATCH_FAILED, db_id))
+            else:
+                cursor = conn.execute("""
+                    UPDATE global_tracks 
+                    SET youtube_url = NULL, match_score = NULL, match_timestamp = NULL, updated_at = ?
+                    WHERE youtube_url = ?
+                """, (now, YOUTUBE_MATCH_FAILED))
+            
+            conn.commit()
+            return cursor.rowcount
+    
+    # =========================================================================
+    # Artist/Album Cache (PHASE 1 enrichment)
+    # =========================================================================
+    
+    def get_cached_artists(self, artist_ids: set[str], max_age_seconds: float) -> dict[str, dict]:
+        """Get cached artist data fetched within max_age_seconds, keyed by ID."""
+        return self._get_cached_entities("artists", artist_ids, max_age_seconds)
+    
+    def get_cached_albums(self, album_ids: set[str], max_age_seconds: float) -> dict[str, dict]:
+        """Get cached album data fetched within max_age_seconds, keyed by ID."""
+        return self._get_cached_entities("albums", album_ids, max_age_seconds)
+    
+    def store_cached_artists(self, artists: dict[str, dict]) -> None:
+        """Store (or refresh) artist data keyed by Spotify artist ID."""
+        self._store_cached_entities("artists", artists)
+    
+    def store_cached_albums(self, albums: dict[str, dict]) -> None:
+        """Store (or refresh) album data keyed by Spotify album ID."""
+        self._store_cached_entities("albums", albums)
+    
+    def _get_cached_entities(
+        self,
+        table: str,
+        spotify_ids: set[str],
+        max_age_seconds: float
+    ) -> dict[str, dict]:
+        if not spotify_ids:
+            return {}
+        
+        cutoff = datetime.fromtimestamp(
+            time.time() - max_age_seconds, timezone.utc
+        ).isoformat()
+        
+        # Cache tables are written directly, never through write-behind
+        with self._read_connection(flush_pending=False) as conn:
+            cursor = conn.execute(f"""
+                SELECT c.spotify_id, c.data FROM json_each(?) v
+                JOIN {table} c ON c.spotify_id = v.value
+                WHERE c.fetched_at >= ?
+            """, (json.dumps(list(spotify_ids)), cutoff))
+            rows = cursor.fetchall()
+        
+        return {row[0]: json.loads(row[1]) for row in rows}
+    
+    def _store_cached_entities(self, table: str, entities: dict[str, dict]) -> None:
+        if not entities:
+            return
+        
+        now = self._now_iso()
+        with self._write_connection() as conn:
+            conn.executemany(f"""
+                INSERT INTO {table} (spotify_id, data, fetched_at) VALUES (?, ?, ?)
+                ON CONFLICT(spotify_id) DO UPDATE SET
+                    data = excluded.data,
+                    fetched_at = excluded.fetched_at
+            """, [
+                (spotify_id, json.dumps(data), now)
+                for spotify_id, data in entities.items()
+            ])
+            conn.commit()
+    
+    # =========================================================================
+    # YouTube Music Search Cache (PHASE 2)
+    # =========================================================================
+    
+    def get_cached_search(
+        self,
+        query: str,
+        search_filter: str,
+        limit: int,
+        max_age_seconds: float | None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Get a cached search response.
+        
+        Args:
+            query: Search query as sent to YouTube Music.
+            search_filter: ytmusicapi filter ("songs", "videos").
+            limit: Requested result limit.
+            max_age_seconds: Ignore entries older than this (None: any age).
+        
+        Returns:
+            The cached result list (possibly empty), or None on a cache miss.
+        """
+        sql = """
+            SELECT data FROM youtube_search_cache
+            WHERE query = ? AND search_filter = ? AND result_limit = ?
+        """
+        params: tuple[Any, ...] = (query, search_filter, limit)
+        if max_age_seconds is not None:
+            cutoff = datetime.fromtimestamp(
+                time.time() - max_age_seconds, timezone.utc
+            ).isoformat()
+            sql += " AND fetched_at >= ?"
+            params += (cutoff,)
+        
+        with self._read_connection(flush_pending=False) as conn:
+            row = conn.execute(sql, params).fetchone()
+        
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+    
+    def store_cached_search(
+        self,
+        query: str,
+        search_filter: str,
+        limit: int,
+        results: list[dict[str, Any]]
+    ) -> None:
+        """Store (or refresh) a search response; see get_cached_search()."""
+        data = zlib.compress(json.dumps(results).encode("utf-8"))
+        # Queued in write-behind mode: PHASE 2 workers store one per search
+        self._execute_state_update("""
+            INSERT INTO youtube_search_cache
+                (query, search_filter, result_limit, data, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(query, search_filter, result_limit) DO UPDATE SET
+                data = excluded.data,
+                fetched_at = excluded.fetched_at
+        """, (query, search_filter, limit, data, self._now_iso()))
+    
+    def prune_search_cache(self, max_entries: int, max_age_seconds: float) -> int:
+        """
+        Evict expired search cache entries, then the oldest beyond max_entries.
+        
+        Returns:
+            Number of entries removed.
+        """
+        cutoff = datetime.fromtimestamp(
+            time.time() - max_age_seconds, timezone.utc
+        ).isoformat()
+        
+        with self._write_connection() as conn:
+            removed = conn.execute(
+                "DELETE FROM youtube_search_cache WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+            removed += conn.execute("""
+                DELETE FROM youtube_search_cache WHERE rowid IN (
+                    SELECT rowid FROM youtube_search_cache
+                    ORDER BY fetched_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (max_entries,)).rowcount
+            conn.commit()
+            return removed
+    
+    # =========================================================================
+    # Match Candidates (PHASE 2, spot --rescore)
+    # =========================================================================
+    
+    def store_match_candidates(self, spotify_id: str, candidates: dict[str, Any]) -> None:
+        """Store (replace) the PHASE 2 candidates of a track."""
+        data = zlib.compress(json.dumps(candidates).encode("utf-8"))
+        # Queued in write-behind mode, next to the track's set_youtube_url()
+        self._execute_state_update("""
+            INSERT INTO match_candidates (track_id, data, scored_at)
+            SELECT id, ?, ? FROM global_tracks WHERE spotify_id = ?
+            ON CONFLICT(track_id) DO UPDATE SET
+                data = excluded.data,
+                scored_at = excluded.scored_at
+        """, (data, self._now_iso(), spotify_id))
+    
+    def iter_match_candidates(
+        self,
+        page_size: int = 1000
+    ) -> Generator[tuple[str, int, str | None, float | None, dict[str, Any]], None, None]:
+        """
+        Iterate over stored PHASE 2 candidates of tracks not yet downloaded.
+        
+        Pages with keyset pagination on track_id, like _iter_work_queue().
+        
+        Yields:
+            (spotify_id, popularity, youtube_url, match_score, candidates)
+            per track.
+        """
+        last_id = 0
+        while True:
+            with self._read_connection() as conn:
+                rows = conn.execute("""
+                    SELECT c.track_id, g.spotify_id, g.popularity, g.youtube_url,
+                           g.match_score, c.data
+                    FROM match_candidates c
+                    JOIN global_tracks g ON g.id = c.track_id
+                    WHERE c.track_id > ? AND g.downloaded = 0
+                    ORDER BY c.track_id
+                    LIMIT ?
+                """, (last_id, page_size)).fetchall()
+            
+            for row in rows:
+                yield (
+                    row["spotify_id"],
+                    row["popularity"] or 0,
+                    row["youtube_url"],
+                    row["match_score"],
+                    json.loads(zlib.decompress(row["data"]).decode("utf-8"))
+                )
+            
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["track_id"]
     
     # =========================================================================
     # Statistics
@@ -717,79 +1724,68 @@ class Database:
     
     def get_playlist_stats(self, playlist_id: str) -> dict[str, int]:
         """Get download statistics for a specific playlist."""
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return {"total": 0, "matched": 0, "downloaded": 0, 
-                            "failed_match": 0, "pending_match": 0, "pending_download": 0}
-                
-                stats = {}
-                
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM playlist_tracks WHERE playlist_id = ?", (db_id,))
-                stats["total"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute("""
-                    SELECT COUNT(*) FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ? AND g.downloaded = 1
-                """, (db_id,))
-                stats["downloaded"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute("""
-                    SELECT COUNT(*) FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ? AND g.youtube_url = ?
-                """, (db_id, YOUTUBE_MATCH_FAILED))
-                stats["failed_match"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute("""
-                    SELECT COUNT(*) FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ? AND g.youtube_url IS NULL
-                """, (db_id,))
-                stats["pending_match"] = cursor.fetchone()[0]
-                
-                stats["matched"] = stats["total"] - stats["pending_match"] - stats["failed_match"]
-                stats["pending_download"] = stats["matched"] - stats["downloaded"]
-                
-                return stats
+        with self._read_connection() as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return {"total": 0, "matched": 0, "downloaded": 0, 
+                        "failed_match": 0, "pending_match": 0, "pending_download": 0}
+            
+            # One pass over the playlist's links instead of one COUNT per figure
+            cursor = conn.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(CASE WHEN g.downloaded = 1 THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN g.youtube_url = ? THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN g.youtube_url IS NULL THEN 1 ELSE 0 END), 0)
+                FROM playlist_tracks pt
+                JOIN global_tracks g ON g.id = pt.track_id
+                WHERE pt.playlist_id = ?
+            """, (YOUTUBE_MATCH_FAILED, db_id))
+            row = cursor.fetchone()
+            stats = {
+                "total": row[0],
+                "downloaded": row[1],
+                "failed_match": row[2],
+                "pending_match": row[3],
+            }
+            
+            stats["matched"] = stats["total"] - stats["pending_match"] - stats["failed_match"]
+            stats["pending_download"] = stats["matched"] - stats["downloaded"]
+            
+            return stats
     
     def get_global_stats(self) -> dict[str, int]:
         """Get overall database statistics."""
-        with self._lock:
-            with self._get_connection() as conn:
-                stats = {}
-                
-                cursor = conn.execute("SELECT COUNT(*) FROM playlists")
-                stats["playlists"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute("SELECT COUNT(*) FROM global_tracks")
-                stats["total_tracks"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM global_tracks WHERE youtube_url IS NOT NULL AND youtube_url != ?",
-                    (YOUTUBE_MATCH_FAILED,))
-                stats["matched_tracks"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute("SELECT COUNT(*) FROM global_tracks WHERE downloaded = 1")
-                stats["downloaded_tracks"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM global_tracks WHERE lyrics_text IS NOT NULL")
-                stats["tracks_with_lyrics"] = cursor.fetchone()[0]
-                
-                cursor = conn.execute("SELECT COUNT(*) FROM playlist_tracks")
-                stats["playlist_track_links"] = cursor.fetchone()[0]
-                
-                # This shows the efficiency gain: links > unique tracks = deduplication working
-                stats["deduplication_ratio"] = (
-                    round(stats["playlist_track_links"] / stats["total_tracks"], 2)
-                    if stats["total_tracks"] > 0 else 0
-                )
-                
-                return stats
+        with self._read_connection() as conn:
+            # Single scan of global_tracks; the two other tables are plain counts
+            cursor = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM playlists),
+                    COUNT(*),
+                    COALESCE(SUM(CASE WHEN youtube_url IS NOT NULL AND youtube_url != ?
+                                      THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN downloaded = 1 THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN lyrics_text IS NOT NULL THEN 1 ELSE 0 END), 0),
+                    (SELECT COUNT(*) FROM playlist_tracks)
+                FROM global_tracks
+            """, (YOUTUBE_MATCH_FAILED,))
+            row = cursor.fetchone()
+            stats = {
+                "playlists": row[0],
+                "total_tracks": row[1],
+                "matched_tracks": row[2],
+                "downloaded_tracks": row[3],
+                "tracks_with_lyrics": row[4],
+                "playlist_track_links": row[5],
+            }
+            
+            # This shows the efficiency gain: links > unique tracks = deduplication working
+            stats["deduplication_ratio"] = (
+                round(stats["playlist_track_links"] / stats["total_tracks"], 2)
+                if stats["total_tracks"] > 0 else 0
+            )
+            
+            return stats
     
     # =========================================================================
     # Sync Change Detection & Playlist Management
@@ -807,20 +1803,19 @@ class Database:
         Returns:
             Dictionary mapping spotify_id to position for all tracks in playlist.
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return {}
-                
-                cursor = conn.execute("""
-                    SELECT g.spotify_id, pt.position
-                    FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ?
-                """, (db_id,))
-                
-                return {row[0]: row[1] for row in cursor.fetchall()}
+        with self._read_connection(flush_pending=False) as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return {}
+            
+            cursor = conn.execute("""
+                SELECT g.spotify_id, pt.position
+                FROM global_tracks g
+                JOIN playlist_tracks pt ON g.id = pt.track_id
+                WHERE pt.playlist_id = ?
+            """, (db_id,))
+            
+            return {row[0]: row[1] for row in cursor.fetchall()}
     
     def clear_playlist_tracks(self, playlist_id: str) -> int:
         """
@@ -835,17 +1830,16 @@ class Database:
         Returns:
             Number of links removed.
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return 0
-                
-                cursor = conn.execute(
-                    "DELETE FROM playlist_tracks WHERE playlist_id = ?", (db_id,)
-                )
-                conn.commit()
-                return cursor.rowcount
+        with self._write_connection() as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return 0
+            
+            cursor = conn.execute(
+                "DELETE FROM playlist_tracks WHERE playlist_id = ?", (db_id,)
+            )
+            conn.commit()
+            return cursor.rowcount
     
     def delete_playlist(self, playlist_id: str) -> bool:
         """
@@ -860,13 +1854,12 @@ class Database:
         Returns:
             True if playlist existed and was deleted, False otherwise.
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "DELETE FROM playlists WHERE spotify_id = ?", (playlist_id,)
-                )
-                conn.commit()
-                return cursor.rowcount > 0
+        with self._write_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM playlists WHERE spotify_id = ?", (playlist_id,)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
     
     def get_playlist_tracks_for_export(self, playlist_id: str) -> list[dict[str, Any]]:
         """
@@ -881,30 +1874,29 @@ class Database:
             List of dicts with: position, name, artist, duration_ms, file_path
             Ordered by position.
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return []
-                
-                cursor = conn.execute("""
-                    SELECT pt.position, g.name, g.artist, g.duration_ms, g.file_path
-                    FROM global_tracks g
-                    JOIN playlist_tracks pt ON g.id = pt.track_id
-                    WHERE pt.playlist_id = ? AND g.downloaded = 1 AND g.file_path IS NOT NULL
-                    ORDER BY pt.position
-                """, (db_id,))
-                
-                return [
-                    {
-                        "position": row[0],
-                        "name": row[1],
-                        "artist": row[2],
-                        "duration_ms": row[3],
-                        "file_path": row[4]
-                    }
-                    for row in cursor.fetchall()
-                ]
+        with self._read_connection() as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return []
+            
+            cursor = conn.execute("""
+                SELECT pt.position, g.name, g.artist, g.duration_ms, g.file_path
+                FROM global_tracks g
+                JOIN playlist_tracks pt ON g.id = pt.track_id
+                WHERE pt.playlist_id = ? AND g.downloaded = 1 AND g.file_path IS NOT NULL
+                ORDER BY pt.position
+            """, (db_id,))
+            
+            return [
+                {
+                    "position": row[0],
+                    "name": row[1],
+                    "artist": row[2],
+                    "duration_ms": row[3],
+                    "file_path": row[4]
+                }
+                for row in cursor.fetchall()
+            ]
     
     def get_all_downloaded_tracks(self) -> list[dict[str, Any]]:
         """
@@ -913,24 +1905,23 @@ class Database:
         Returns:
             List of dicts with: spotify_id, name, artist, file_path
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT spotify_id, name, artist, file_path
-                    FROM global_tracks
-                    WHERE downloaded = 1 AND file_path IS NOT NULL
-                    ORDER BY artist, name
-                """)
-                
-                return [
-                    {
-                        "spotify_id": row[0],
-                        "name": row[1],
-                        "artist": row[2],
-                        "file_path": row[3]
-                    }
-                    for row in cursor.fetchall()
-                ]
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT spotify_id, name, artist, file_path
+                FROM global_tracks
+                WHERE downloaded = 1 AND file_path IS NOT NULL
+                ORDER BY artist, name
+            """)
+            
+            return [
+                {
+                    "spotify_id": row[0],
+                    "name": row[1],
+                    "artist": row[2],
+                    "file_path": row[3]
+                }
+                for row in cursor.fetchall()
+            ]
     
     def sync_playlist_tracks(
         self,
@@ -950,31 +1941,30 @@ class Database:
         Returns:
             Number of orphaned links removed.
         """
-        with self._lock:
-            with self._get_connection() as conn:
-                db_id = self._get_playlist_db_id(conn, playlist_id)
-                if db_id is None:
-                    return 0
-                
-                # Find track_ids that are in playlist_tracks but not in valid_spotify_ids
-                # and delete them
-                if not valid_spotify_ids:
-                    # If no valid IDs, remove all links
-                    cursor = conn.execute(
-                        "DELETE FROM playlist_tracks WHERE playlist_id = ?",
-                        (db_id,)
-                    )
-                else:
-                    # Build placeholders for IN clause
-                    placeholders = ",".join("?" for _ in valid_spotify_ids)
+        with self._write_connection() as conn:
+            db_id = self._get_playlist_db_id(conn, playlist_id)
+            if db_id is None:
+                return 0
+            
+            # Find track_ids that are in playlist_tracks but not in valid_spotify_ids
+            # and delete them
+            if not valid_spotify_ids:
+                # If no valid IDs, remove all links
+                cursor = conn.execute(
+                    "DELETE FROM playlist_tracks WHERE playlist_id = ?",
+                    (db_id,)
+                )
+            else:
+                # Anti-join against a temp table: no per-ID bind variables
+                with self._spotify_id_set(conn, valid_spotify_ids) as id_table:
                     cursor = conn.execute(f"""
-                        DELETE FROM playlist_tracks 
-                        WHERE playlist_id = ? 
+                        DELETE FROM playlist_tracks
+                        WHERE playlist_id = ?
                         AND track_id NOT IN (
-                            SELECT id FROM global_tracks 
-                            WHERE spotify_id IN ({placeholders})
+                            SELECT g.id FROM {id_table} v
+                            JOIN global_tracks g ON g.spotify_id = v.spotify_id
                         )
-                    """, (db_id, *valid_spotify_ids))
-                
-                conn.commit()
-                return cursor.rowcount
\ No newline at end of file
+                    """, (db_id,))
+            
+            conn.commit()
+            return cursor.rowcount
\ No newline at end of file
@@ -3,7 +3,7 @@ Logging configuration for spot-downloader.
 
 This module sets up the logging system with multiple outputs:
     - Console: Real-time progress with tqdm-compatible formatting
-    - log_full.log: Complete log of all events (DEBUG and above)
+    - log_full.log: Complete log of all events (DEBUG and above by default)
     - log_errors.log: Only ERROR and CRITICAL level messages
     - download_failures.log: Failed download track names with Spotify URLs
     - lyrics_failures.log: Tracks where lyrics were not found
@@ -28,7 +28,7 @@ Usage:
 import logging
 import sys
 from pathlib import Path
-from typing import TextIO
+from typing import Any, TextIO
 from datetime import datetime
 
 from tqdm import tqdm
@@ -48,6 +48,10 @@ MATCH_CLOSE_ALTERNATIVES_FILENAME = "match_close_alternatives.log"
 
 
 
+# Accepted values for setup_logging(level=...) / --log-level / output.log_level
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+DEFAULT_LOG_LEVEL = "DEBUG"
+
 # Log format for file output (detailed with timestamp)
 FILE_LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 FILE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -582,7 +586,7 @@ class ErrorOnlyFilter(logging.Filter):
         return record.levelno >= logging.ERROR
 
 
-def setup_logging(output_dir: Path) -> None:
+def setup_logging(output_dir: Path, level: str = DEFAULT_LOG_LEVEL) -> None:
     """
     Configure the logging system for the application.
     
@@ -592,12 +596,21 @@ def setup_logging(output_dir: Path) -> None:
     Args:
         output_dir: Directory where log files will be created.
                     Logs are stored in logs/{timestamp}/ subdirectory.
+        level: Lowest level logged (one of LOG_LEVELS). DEBUG keeps the
+               complete log_full.log; INFO and above let
+               logger.isEnabledFor(logging.DEBUG) guards in hot loops skip
+               building debug messages at all.
     
     Behavior:
         1. Create output_dir/logs/{timestamp} directory
-        2. Configure root logger level to DEBUG
+        2. Configure root logger level to `level`
         3. Create and configure all handlers with appropriate paths
     
+    Report Files:
+        download_failures.log, lyrics_failures.log and
+        match_close_alternatives.log are written regardless of `level`
+        (see _log_report).
+    
     File Handling:
         - Each run creates a new timestamped subdirectory
         - Files use UTF-8 encoding
@@ -614,23 +627,25 @@ def setup_logging(output_dir: Path) -> None:
     logs_dir = output_dir / "logs" / timestamp
     logs_dir.mkdir(parents=True, exist_ok=True)
     
+    levelno = logging.getLevelNamesMapping()[level.upper()]
+    
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(levelno)
     
     # Remove any existing handlers
     root_logger.handlers.clear()
     
     # Console handler (tqdm-compatible) with colors
     console_handler = TqdmLoggingHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(max(logging.INFO, levelno))
     console_handler.setFormatter(ColoredConsoleFormatter())
     root_logger.addHandler(console_handler)
     
     # Full log file handler
     full_log_path = logs_dir / "log_full.log"
     full_handler = logging.FileHandler(full_log_path, mode="w", encoding="utf-8")
-    full_handler.setLevel(logging.DEBUG)
+    full_handler.setLevel(levelno)
     full_handler.setFormatter(logging.Formatter(FILE_LOG_FORMAT, FILE_DATE_FORMAT))
     root_logger.addHandler(full_handler)
     
@@ -768,6 +783,27 @@ def format_progress_message(completed: int, total: int, matched: int, failed: in
     )
 
 
+def _log_report(
+    logger: logging.Logger,
+    level: int,
+    msg: str,
+    extra: dict[str, Any]
+) -> None:
+    """
+    Log a record meant for one of the report file handlers.
+    
+    Unlike logger.log(), this skips the logger's own level check, so the
+    report handlers still receive the record when setup_logging() was
+    given a higher level. Console and log files keep filtering by their
+    handler levels as usual.
+    """
+    if logger.disabled:
+        return
+    fn, lno, func, _ = logger.findCaller(stacklevel=2)
+    record = logger.makeRecord(logger.name, level, fn, lno, msg, (), None, func, extra)
+    logger.handle(record)
+
+
 def log_download_failure(
     logger: logging.Logger,
     track_name: str,
@@ -805,7 +841,9 @@ def log_download_failure(
             assigned_number=42
         )
     """
-    logger.error(
+    _log_report(
+        logger,
+        logging.ERROR,
         f"Download failed: {track_name} - {error_message}",
         extra={
             "download_failed_track_name": track_name,
@@ -859,7 +897,9 @@ def log_lyrics_failure(
         #    "42-Instrumental Track-Artist Name.m4a
         #     https://open.spotify.com/track/xxx"
     """
-    logger.warning(
+    _log_report(
+        logger,
+        logging.WARNING,
         f"No lyrics found for: {track_name}",
         extra={
             "lyrics_failed_track_name": track_name,
@@ -936,7 +976,9 @@ def log_match_close_alternatives(
         #   - Song Title (Live) https://www.youtube.com/watch?v=www (score: 83.1)
         # Multiple close matches found. Verify if correct.
     """
-    logger.debug(
+    _log_report(
+        logger,
+        logging.DEBUG,
         f"Multiple close matches for: {track_name} (selected score: {score:.1f})",
         extra={
             "match_alt_track_name": track_name,
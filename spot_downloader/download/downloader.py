@@ -55,14 +55,15 @@ import random
 import shutil
 import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Generator, Iterable, Optional
 
 from yt_dlp import YoutubeDL
 
+from spot_downloader.core.concurrency import iter_completed
 from spot_downloader.core.database import Database
 from spot_downloader.core.exceptions import DownloadError
 from spot_downloader.core.file_manager import FileManager
@@ -81,6 +82,9 @@ BASE_DELAY = 1.5  # seconds
 MAX_DELAY = 15.0  # seconds
 JITTER_FACTOR = 0.3  # randomness factor for backoff
 
+# Tracks submitted ahead per download thread by download_tracks()
+PENDING_TASKS_PER_THREAD = 2
+
 
 class YtDlpSilentLogger:
     """
@@ -274,9 +278,10 @@ class Downloader:
     
     def download_tracks(
         self,
-        tracks: list[dict[str, Any]],
+        tracks: Iterable[dict[str, Any]],
         playlist_id: str,
-        num_threads: int | None = None
+        num_threads: int | None = None,
+        total: int | None = None
     ) -> DownloadStats:
         """
         Download multiple tracks using parallel processing.
@@ -284,42 +289,45 @@ class Downloader:
         This is the main entry point for PHASE 3 batch processing.
         
         Args:
-            tracks: List of track data dicts from database.
+            tracks: Track data dicts from database (a list or any iterable,
+                   e.g. Database.iter_tracks_needing_download()).
                    Each dict must have 'spotify_id', 'youtube_url',
                    'name', 'artist', and other metadata fields.
             playlist_id: Playlist ID (used for logging context).
             num_threads: Override default thread count.
+            total: Number of tracks, for the progress bar. Required when
+                  tracks has no len() (e.g. a generator).
         
         Returns:
             DownloadStats with counts of success/failure.
         
         Behavior:
             1. Create thread pool with num_threads workers
-            2. Submit download_track() task for each track
+            2. Submit download_track() tasks, a few per thread ahead
             3. Track progress with Rich progress bar
             4. Collect results and statistics
             5. Return final stats
         """
         threads = num_threads if num_threads is not None else self._num_threads
-        stats = DownloadStats(total=len(tracks))
+        if total is None:
+            total = len(tracks)
+        stats = DownloadStats(total=total)
         
-        if not tracks:
+        if total == 0:
             logger.info("No tracks to download")
             return stats
         
-        logger.info(f"Starting download of {len(tracks)} tracks with {threads} threads")
+        logger.info(f"Starting download of {total} tracks with {threads} threads")
         
-        with DownloadProgressBar(total=len(tracks), description="Downloading") as progress:
+        with DownloadProgressBar(total=total, description="Downloading") as progress:
             with ThreadPoolExecutor(max_workers=threads) as executor:
-                # Submit all download tasks
-                future_to_track = {
-                    executor.submit(self.download_track, track_data): track_data
-                    for track_data in tracks
-                }
-                
                 # Process completed tasks
-                for future in as_completed(future_to_track):
-                    track_data = future_to_track[future]
+                for track_data, future in iter_completed(
+                    executor,
+                    self.download_track,
+                    tracks,
+                    threads * PENDING_TASKS_PER_THREAD
+                ):
                     track_name = track_data.get("name", "Unknown")
                     artist = track_data.get("artist", "Unknown")
                     
@@ -745,12 +753,12 @@ def download_tracks_phase3(
     """
     file_manager = FileManager(output_dir)
     
-    tracks = database.get_tracks_needing_download()
+    total = database.count_tracks_needing_download()
     
-    if not tracks:
+    if total == 0:
         logger.info("No tracks to download")
     else:
-        logger.info(f"Found {len(tracks)} tracks to download")
+        logger.info(f"Found {total} tracks to download")
         
         downloader = Downloader(
             database=database,
@@ -759,7 +767,10 @@ def download_tracks_phase3(
             num_threads=num_threads
         )
         
-        stats = downloader.download_tracks(tracks, playlist_id, num_threads)
+        # Streamed page by page from the work queue
+        stats = downloader.download_tracks(
+            database.iter_tracks_needing_download(), playlist_id, num_threads, total
+        )
     
     # Always rebuild all playlist links at the end
     # This ensures consistency even for tracks that were already downloaded
@@ -767,7 +778,7 @@ def download_tracks_phase3(
     logger.info("Rebuilding playlist links...")
     _rebuild_all_playlist_links(database, file_manager)
     
-    if not tracks:
+    if total == 0:
         return DownloadStats(total=0)
     return stats
 
@@ -831,19 +842,23 @@ def _rebuild_all_playlist_links(database: Database, file_manager: FileManager) -
         logger.debug(f"Rebuilt {created} links for '{playlist_name}'")
 
 
-def get_tracks_needing_download(database: Database, playlist_id: str | None = None) -> list[dict[str, Any]]:
+def get_tracks_needing_download(
+    database: Database,
+    playlist_id: str | None = None
+) -> Generator[dict[str, Any], None, None]:
     """
     Get tracks from database that need downloading.
     
     Convenience function for getting tracks to process in PHASE 3
-    when running phases separately.
+    when running phases separately. Tracks are read page by page; use
+    database.count_tracks_needing_download() for the total.
     
     Args:
         database: Database instance.
         playlist_id: Playlist ID (currently unused - downloads are global).
     
-    Returns:
-        List of track data dicts for tracks with youtube_url set
-        but downloaded=False.
+    Yields:
+        Track data dicts for tracks with youtube_url set
+        but downloaded=False (only the fields download_track() reads).
     """
-    return database.get_tracks_needing_download()
\ No newline at end of file
+    return database.iter_tracks_needing_download()
\ No newline at end of file
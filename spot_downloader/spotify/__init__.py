@@ -5,6 +5,7 @@ This module provides all functionality for interacting with Spotify API:
     - SpotifyClient: Singleton API client for Spotify operations
     - Track, Playlist, LikedSongs: Data models for Spotify entities
     - SpotifyFetcher: PHASE 1 implementation for fetching metadata
+    - EnrichmentCache: Artist/album memo shared by fetches in one run
 
 Usage:
     from spot_downloader.spotify import (
@@ -24,9 +25,11 @@ Usage:
 
 from spot_downloader.spotify.client import SpotifyClient
 from spot_downloader.spotify.fetcher import (
+    EnrichmentCache,
     SpotifyFetcher,
     fetch_liked_songs_phase1,
     fetch_playlist_phase1,
+    fetch_playlists_phase1,
 )
 from spot_downloader.spotify.models import LikedSongs, Playlist, Track
 
@@ -39,6 +42,8 @@ __all__ = [
     "LikedSongs",
     # Fetcher
     "SpotifyFetcher",
+    "EnrichmentCache",
     "fetch_playlist_phase1",
+    "fetch_playlists_phase1",
     "fetch_liked_songs_phase1",
 ]
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+PHASE 1 benchmark harness for spot-downloader.
+
+Runs fetch_playlist_phase1() against the offline stand-ins from
+spot_downloader.spotify.replay, with a fresh database per run, and reports
+wall time, request count and injected 429s. No credentials are needed
+except for `record`.
+
+Commands:
+    synthetic: Generated playlists of the given sizes (default 1k/10k/50k).
+    record:    Fetch a real playlist once and save every Spotify response.
+    replay:    Fetch a recorded playlist again from the saved responses.
+
+Usage:
+    python -m spot_downloader.spotify.benchmark synthetic --latency 0.05
+    python -m spot_downloader.spotify.benchmark synthetic --sizes 1000 --rate-limit-every 100
+    python -m spot_downloader.spotify.benchmark record URL recording.json.gz
+    python -m spot_downloader.spotify.benchmark replay URL recording.json.gz --latency 0.1
+
+Network options (synthetic and replay):
+    --latency, --jitter: Simulated seconds per request.
+    --rate-limit-every N: Answer every Nth request with a 429.
+    --retry-after: Retry-After of those 429s, in seconds.
+    --page-workers, --requests-per-second: Passed to SpotifyClient.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from spot_downloader.core.database import Database
+from spot_downloader.spotify.client import (
+    DEFAULT_PAGE_WORKERS,
+    DEFAULT_REQUESTS_PER_SECOND,
+    SpotifyClient,
+    _create_spotify,
+)
+from spot_downloader.spotify.fetcher import fetch_playlist_phase1
+from spot_downloader.spotify.replay import (
+    FakeNetwork,
+    RecordingSpotify,
+    ReplaySpotify,
+    SyntheticSpotify,
+)
+
+
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Outcome of one PHASE 1 run against a stand-in."""
+    label: str
+    tracks: int
+    seconds: float
+    requests: int
+    rate_limited: int
+
+    def __str__(self) -> str:
+        rate = self.tracks / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"{self.label:>20}  {self.tracks:>7} tracks  {self.seconds:>8.2f}s  "
+            f"{rate:>9.0f} tracks/s  {self.requests:>6} requests  "
+            f"{self.rate_limited:>4} x 429"
+        )
+
+
+def run_phase1(
+    spotify: Any,
+    network: FakeNetwork,
+    playlist_url: str,
+    label: str,
+    page_workers: int = DEFAULT_PAGE_WORKERS,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND
+) -> BenchmarkResult:
+    """
+    Time one fetch_playlist_phase1() call against a stand-in.
+
+    The SpotifyClient singleton is reset before and after the run, and a
+    new database is created in a temporary directory, so every run starts
+    cold (no enrichment cache, no stored snapshot_id).
+
+    Args:
+        spotify: ReplaySpotify, SyntheticSpotify or another stand-in.
+        network: The stand-in's FakeNetwork, read for request counts.
+        playlist_url: Playlist to fetch.
+        label: Name of the run in the report.
+        page_workers: Passed to SpotifyClient.
+        requests_per_second: Passed to SpotifyClient.
+    """
+    SpotifyClient.reset()
+    SpotifyClient.init_with_instance(
+        spotify,
+        page_workers=page_workers,
+        requests_per_second=requests_per_second
+    )
+    requests_before = network.requests
+    rate_limited_before = network.rate_limited
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="spot-bench-") as tmp:
+            database = Database(Path(tmp) / "benchmark.db")
+            try:
+                start = time.perf_counter()
+                _, tracks = fetch_playlist_phase1(database, playlist_url)
+                seconds = time.perf_counter() - start
+            finally:
+                database.close()
+    finally:
+        SpotifyClient.reset()
+
+    return BenchmarkResult(
+        label=label,
+        tracks=len(tracks),
+        seconds=seconds,
+        requests=network.requests - requests_before,
+        rate_limited=network.rate_limited - rate_limited_before
+    )
+
+
+def _network(args: argparse.Namespace) -> FakeNetwork:
+    return FakeNetwork(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after
+    )
+
+
+def _run_synthetic(args: argparse.Namespace) -> None:
+    for size in args.sizes:
+        network = _network(args)
+        playlist_id = f"synthetic{size}"
+        spotify = SyntheticSpotify(playlists={playlist_id: size}, network=network)
+        print(run_phase1(
+            spotify,
+            network,
+            spotify.playlist_url(playlist_id),
+            label=f"synthetic {size}",
+            page_workers=args.page_workers,
+            requests_per_second=args.requests_per_second
+        ))
+
+
+def _run_replay(args: argparse.Namespace) -> None:
+    network = _network(args)
+    spotify = ReplaySpotify.from_file(args.recording, network)
+    print(run_phase1(
+        spotify,
+        network,
+        args.playlist_url,
+        label=f"replay {args.recording.name}",
+        page_workers=args.page_workers,
+        requests_per_second=args.requests_per_second
+    ))
+
+
+def _run_record(args: argparse.Namespace) -> None:
+    # Imported here: only recording needs config.yaml
+    from spot_downloader.core.config import load_config
+
+    config = load_config(args.config)
+    recorder = RecordingSpotify(
+        _create_spotify(config.spotify.client_id, config.spotify.client_secret, user_auth=False)
+    )
+    SpotifyClient.reset()
+    SpotifyClient.init_with_instance(
+        recorder,
+        page_workers=config.spotify.page_workers,
+        requests_per_second=config.spotify.requests_per_second
+    )
+    try:
+        with tempfile.TemporaryDirectory(prefix="spot-record-") as tmp:
+            database = Database(Path(tmp) / "record.db")
+            try:
+                _, tracks = fetch_playlist_phase1(database, args.playlist_url)
+            finally:
+                database.close()
+    finally:
+        SpotifyClient.reset()
+
+    recorder.save(args.recording)
+    print(f"Recorded {len(recorder)} responses ({len(tracks)} tracks) to {args.recording}")
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m spot_downloader.spotify.benchmark",
+        description="Benchmark PHASE 1 against offline Spotify stand-ins."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    network = argparse.ArgumentParser(add_help=False)
+    network.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    network.add_argument("--jitter", type=float, default=0.0, help="extra random seconds per request")
+    network.add_argument("--rate-limit-every", type=int, default=0, help="answer every Nth request with a 429")
+    network.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of injected 429s")
+    network.add_argument("--page-workers", type=int, default=DEFAULT_PAGE_WORKERS)
+    network.add_argument("--requests-per-second", type=float, default=DEFAULT_REQUESTS_PER_SECOND)
+
+    synthetic = commands.add_parser("synthetic", parents=[network], help="generated playlists")
+    synthetic.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    synthetic.set_defaults(run=_run_synthetic)
+
+    replay = commands.add_parser("replay", parents=[network], help="replay a recording")
+    replay.add_argument("playlist_url")
+    replay.add_argument("recording", type=Path)
+    replay.set_defaults(run=_run_replay)
+
+    record = commands.add_parser("record", help="record a real playlist fetch")
+    record.add_argument("playlist_url")
+    record.add_argument("recording", type=Path)
+    record.add_argument("--config", type=Path, default=None, help="config.yaml (default: ./config.yaml)")
+    record.set_defaults(run=_run_record)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point (see module docstring)."""
+    args = _parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
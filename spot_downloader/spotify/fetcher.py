@@ -10,13 +10,19 @@ PHASE 1 Workflow:
     3. Batch fetch artist/album data (for genres, publisher, etc.)
     4. Convert to Track objects
     5. Store in Global Track Registry:
-       - get_or_create_global_track() for each unique track
-       - link_track_to_playlist() for playlist membership
+       - upsert_tracks_and_links() adds/updates every unique track and its
+         playlist membership in a single transaction
     6. Return tracks for PHASE 2
 
 Sync Mode:
     When --sync is used, compares fetched tracks against database
     and returns only new tracks (not already in playlist).
+    Playlists whose Spotify snapshot_id is unchanged since the last complete
+    fetch are skipped after the single playlist metadata call.
+    Liked Songs have no snapshot_id; they are read newest first until
+    LIKED_SONGS_KNOWN_RUN already-stored tracks in a row, and fetched
+    completely only every DEFAULT_LIKED_FULL_SYNC_DAYS (or on request) to
+    catch older removals.
 
 Batch Optimization:
     Instead of N+2 API calls per track, collects unique IDs and batches:
@@ -26,20 +32,151 @@ Batch Optimization:
     100 tracks with 50 artists and 40 albums:
     - Without batching: 200+ API calls
     - With batching: ~4 API calls
+
+Streaming Enrichment:
+    Artist/album batches are resolved while playlist pages are still
+    arriving (_EnrichmentPipeline), so Phase 1 takes roughly
+    max(pagination, enrichment) instead of their sum.
+
+Multi-playlist Sync:
+    fetch_playlists() lists up to DEFAULT_SYNC_WORKERS playlists at once
+    through the shared SpotifyClient, feeds all of them into one enrichment
+    pipeline (artists/albums deduplicated across playlists), then stores
+    them one at a time on the calling thread.
+
+Enrichment Cache:
+    The artist/album fields used for enrichment (genres, label, copyright)
+    are cached in the database's artists/albums tables for
+    ENRICHMENT_CACHE_TTL_SECONDS, and in an in-process EnrichmentCache that
+    `spot --sync` shares across playlists. Only missing or stale IDs are
+    requested from Spotify.
 """
 
-from dataclasses import replace
-from typing import Any
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
 
 from spot_downloader.core.database import Database, LIKED_SONGS_KEY
 from spot_downloader.core.exceptions import SpotifyError
 from spot_downloader.core.logger import get_logger
-from spot_downloader.spotify.client import SpotifyClient
+from spot_downloader.spotify.client import ALBUMS_PER_REQUEST, ARTISTS_PER_REQUEST, SpotifyClient
 from spot_downloader.spotify.models import LikedSongs, Playlist, Track
 
 logger = get_logger(__name__)
 
 
+# Artist genres and album label/copyright rarely change
+ENRICHMENT_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Concurrent artist/album batch lookups while pages are still downloading
+ENRICHMENT_WORKERS = 4
+
+# Playlists listed concurrently by fetch_playlists() (spotify.sync_workers)
+DEFAULT_SYNC_WORKERS = 4
+
+# Incremental Liked Songs sync stops after this many consecutive items that
+# are already linked with the same added_at
+LIKED_SONGS_KNOWN_RUN = 20
+
+# Days between complete Liked Songs fetches in sync mode, which also catch
+# removals below the incremental head (spotify.liked_full_sync_days)
+DEFAULT_LIKED_FULL_SYNC_DAYS = 7
+
+# Tracks between debug progress lines in _create_track_objects
+PROGRESS_LOG_INTERVAL = 1000
+
+# Album fields read by Track.from_spotify_api (besides tracks.items, see below)
+_ALBUM_CACHE_FIELDS = ("id", "label", "copyrights", "total_tracks", "release_date", "images")
+
+
+@dataclass(frozen=True)
+class _PlaylistListing:
+    """Playlist metadata and raw items, fetched but not yet stored."""
+    playlist_url: str
+    playlist_data: dict[str, Any]
+    items: list[dict[str, Any]] | None  # None: snapshot unchanged, nothing fetched
+
+
+@dataclass
+class EnrichmentCache:
+    """
+    In-process memo of artist/album enrichment data for one run.
+    
+    Pass the same instance to several fetch_*_phase1() calls so an artist or
+    album shared by many playlists is looked up once per run.
+    """
+    artists: dict[str, dict] = field(default_factory=dict)
+    albums: dict[str, dict] = field(default_factory=dict)
+
+
+def _enrichment_ids(track_data: dict[str, Any]) -> tuple[str | None, str | None]:
+    """Return (primary artist ID, album ID) of a track object, if present."""
+    artist_id = None
+    if track_data.get("artists"):
+        artist_id = track_data["artists"][0].get("id")
+    album_id = track_data.get("album", {}).get("id")
+    return artist_id or None, album_id or None
+
+
+def _project_artist(artist_data: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the artist fields used for enrichment."""
+    return {"id": artist_data["id"], "genres": artist_data.get("genres", [])}
+
+
+def _project_album(album_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Keep only the album fields used for enrichment.
+    
+    The album's track list is reduced to its last item's disc_number, which
+    is all Track.from_spotify_api reads from it.
+    """
+    projected = {key: album_data[key] for key in _ALBUM_CACHE_FIELDS if key in album_data}
+    album_tracks = album_data.get("tracks", {}).get("items", [])
+    if album_tracks:
+        projected["tracks"] = {
+            "items": [{"disc_number": album_tracks[-1].get("disc_number", 1)}]
+        }
+    return projected
+
+
+class _KnownRunDetector:
+    """
+    caught_up callback for SpotifyClient.current_user_saved_tracks_until().
+    
+    Counts consecutive items that are already linked with the same
+    added_at (items without a track are neutral). Once LIKED_SONGS_KNOWN_RUN
+    of them are seen, everything older is assumed unchanged.
+    
+    Attributes:
+        caught_up: Whether the run was found (False: whole library listed).
+        old_head_end: Highest stored position among the known items seen,
+                      i.e. the end of the stored range the new head replaces.
+    """
+    
+    def __init__(self, known: dict[str, tuple[int, str | None]]) -> None:
+        self._known = known
+        self._run = 0
+        self.caught_up = False
+        self.old_head_end = 0
+    
+    def __call__(self, items: list[dict[str, Any]]) -> bool:
+        for item in items:
+            track_id = (item.get("track") or {}).get("id")
+            if not track_id:
+                continue
+            link = self._known.get(track_id)
+            if link is not None and link[1] == item.get("added_at"):
+                self._run += 1
+                self.old_head_end = max(self.old_head_end, link[0])
+            else:
+                self._run = 0
+        self.caught_up = self._run >= LIKED_SONGS_KNOWN_RUN
+        return self.caught_up
+
+
 def _assign_track_numbers(tracks: list[Track]) -> list[Track]:
     """
     Assign position numbers based on Spotify's order.
@@ -62,6 +199,76 @@ def _assign_track_numbers(tracks: list[Track]) -> list[Track]:
     ]
 
 
+class _EnrichmentPipeline:
+    """
+    Resolves artist/album data while playlist pages are still arriving.
+    
+    add_items() is passed as the on_page callback of the client's paginated
+    methods and may be called from several threads. New IDs are grouped
+    into API-sized batches and resolved on the executor through the
+    fetcher's cache-aware _batch_fetch_* methods. finish() resolves the
+    remaining partial batches and returns the merged maps.
+    """
+    
+    def __init__(self, fetcher: "SpotifyFetcher", executor: ThreadPoolExecutor) -> None:
+        self._fetcher = fetcher
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._seen_artists: set[str] = set()
+        self._seen_albums: set[str] = set()
+        self._pending_artists: set[str] = set()
+        self._pending_albums: set[str] = set()
+        self._artist_futures: list[Future] = []
+        self._album_futures: list[Future] = []
+    
+    def add_items(self, items: list[dict[str, Any]]) -> None:
+        """Queue the artist/album IDs of a page of playlist items."""
+        with self._lock:
+            for item in items:
+                if not SpotifyFetcher._is_valid_track(item):
+                    continue
+                artist_id, album_id = _enrichment_ids(item["track"])
+                if artist_id and artist_id not in self._seen_artists:
+                    self._seen_artists.add(artist_id)
+                    self._pending_artists.add(artist_id)
+                if album_id and album_id not in self._seen_albums:
+                    self._seen_albums.add(album_id)
+                    self._pending_albums.add(album_id)
+            
+            if len(self._pending_artists) >= ARTISTS_PER_REQUEST:
+                self._submit_artists()
+            if len(self._pending_albums) >= ALBUMS_PER_REQUEST:
+                self._submit_albums()
+    
+    def finish(self) -> tuple[dict[str, dict], dict[str, dict]]:
+        """Resolve the remaining IDs and return (artist_map, album_map)."""
+        with self._lock:
+            if self._pending_artists:
+                self._submit_artists()
+            if self._pending_albums:
+                self._submit_albums()
+        
+        artist_map: dict[str, dict] = {}
+        for future in self._artist_futures:
+            artist_map.update(future.result())
+        album_map: dict[str, dict] = {}
+        for future in self._album_futures:
+            album_map.update(future.result())
+        return artist_map, album_map
+    
+    def _submit_artists(self) -> None:
+        batch, self._pending_artists = self._pending_artists, set()
+        self._artist_futures.append(
+            self._executor.submit(self._fetcher._batch_fetch_artists, batch)
+        )
+    
+    def _submit_albums(self) -> None:
+        batch, self._pending_albums = self._pending_albums, set()
+        self._album_futures.append(
+            self._executor.submit(self._fetcher._batch_fetch_albums, batch)
+        )
+
+
 class SpotifyFetcher:
     """
     Fetches Spotify metadata and stores in Global Track Registry.
@@ -73,7 +280,7 @@ class SpotifyFetcher:
         - Filtering for sync mode
     """
     
-    def __init__(self, database: Database) -> None:
+    def __init__(self, database: Database, cache: EnrichmentCache | None = None) -> None:
         if not SpotifyClient.is_initialized():
             raise SpotifyError(
                 "SpotifyClient not initialized. Call SpotifyClient.init() first.",
@@ -82,6 +289,7 @@ class SpotifyFetcher:
         
         self._client = SpotifyClient()
         self._database = database
+        self._cache = cache if cache is not None else EnrichmentCache()
     
     def fetch_playlist(
         self,
@@ -94,6 +302,9 @@ class SpotifyFetcher:
         Args:
             playlist_url: Full Spotify playlist URL.
             sync_mode: If True, only return tracks not already in database.
+                       If the playlist's snapshot_id matches the one stored by
+                       the last complete fetch, nothing else is fetched and no
+                       tracks are returned.
         
         Returns:
             Tuple of (Playlist, list[Track]) for subsequent phases.
@@ -101,83 +312,107 @@ class SpotifyFetcher:
         Raises:
             SpotifyError: If playlist not found or network error.
         """
-        logger.info(f"Fetching playlist: {playlist_url}")
-        
-        # 1. Fetch playlist metadata
-        playlist_data = self._client.playlist(playlist_url)
-        playlist_id = playlist_data["id"]
-        playlist_name = playlist_data.get("name", "Unknown Playlist")
-        
-        logger.info(f"Playlist: {playlist_name}")
-        
-        # 2. Fetch all track items
-        track_items = self._client.playlist_all_items(playlist_url)
-        logger.info(f"Found {len(track_items)} track items")
-        
-        # 3. Filter valid tracks and collect IDs for batch fetching
-        valid_items, artist_ids, album_ids = self._collect_valid_items(track_items)
-        
-        # 4. Batch fetch artists and albums
-        artist_map = self._batch_fetch_artists(artist_ids)
-        album_map = self._batch_fetch_albums(album_ids)
-        
-        # 5. Create Track objects
-        tracks = self._create_track_objects(valid_items, artist_map, album_map)
-        logger.info(f"Successfully parsed {len(tracks)} tracks")
-        
-        # 6. Get existing track IDs BEFORE modifying database (for sync mode filtering)
-        if sync_mode:
-            existing_track_ids = self._database.get_playlist_track_ids(playlist_id)
-        else:
-            existing_track_ids = set()
-        
-        # 7. Assign position numbers based on Spotify order
-        tracks = _assign_track_numbers(tracks)
-        
-        # 8. Create/update playlist in database
-        self._database.add_playlist(
-            playlist_id=playlist_id,
-            spotify_url=playlist_data.get("external_urls", {}).get("spotify", playlist_url),
-            name=playlist_name
-        )
+        with ThreadPoolExecutor(
+            max_workers=ENRICHMENT_WORKERS, thread_name_prefix="spotify-enrich"
+        ) as executor:
+            pipeline = _EnrichmentPipeline(self, executor)
+            listing = self._list_playlist(playlist_url, sync_mode, pipeline.add_items)
+            artist_map, album_map = pipeline.finish()
+        
+        return self._store_playlist(listing, artist_map, album_map, sync_mode)
+    
+    def fetch_playlists(
+        self,
+        playlist_urls: list[str],
+        sync_mode: bool = False,
+        max_workers: int = DEFAULT_SYNC_WORKERS
+    ) -> list[tuple[Playlist, list[Track]] | Exception]:
+        """
+        Fetch several playlists concurrently, storing them one at a time.
         
-        # 9. Store tracks in Global Track Registry (updates positions for existing tracks)
-        self._store_tracks(tracks, playlist_id)
+        Up to max_workers playlists are listed at once through the shared
+        SpotifyClient (whose rate limiter bounds the total request rate).
+        All of them feed one enrichment pipeline, so an artist or album
+        appearing in several playlists is requested once, in full batches.
+        Database writes happen afterwards on the calling thread, playlist
+        by playlist, in input order.
         
-        # 10. Remove orphaned links (tracks removed from Spotify playlist)
-        valid_ids = {t.spotify_id for t in tracks}
-        removed = self._database.sync_playlist_tracks(playlist_id, valid_ids)
-        if removed > 0:
-            logger.info(f"Removed {removed} tracks no longer in playlist")
+        Args:
+            playlist_urls: Spotify playlist URLs.
+            sync_mode: Same as fetch_playlist(), applied to every playlist.
+            max_workers: Playlists listed concurrently.
         
-        # 11. Filter for sync mode (return only NEW tracks for phases 2-5)
-        if sync_mode:
-            new_tracks = [t for t in tracks if t.spotify_id not in existing_track_ids]
-            logger.info(f"Sync mode: {len(new_tracks)} new tracks to process")
-            tracks_for_phases = new_tracks
-        else:
-            tracks_for_phases = tracks
+        Returns:
+            One entry per URL, in input order: the (Playlist, list[Track])
+            fetch_playlist() would return, or the exception that made that
+            playlist fail. One failing playlist does not affect the others.
+        """
+        listings: list[_PlaylistListing | Exception] = []
         
-        # 11. Create Playlist object
-        playlist = Playlist.from_spotify_api(playlist_data, tracks)
+        with ThreadPoolExecutor(
+            max_workers=ENRICHMENT_WORKERS, thread_name_prefix="spotify-enrich"
+        ) as enrich_executor:
+            pipeline = _EnrichmentPipeline(self, enrich_executor)
+            
+            workers = max(1, min(max_workers, len(playlist_urls)))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="spotify-playlist"
+            ) as executor:
+                futures = [
+                    executor.submit(self._list_playlist, url, sync_mode, pipeline.add_items)
+                    for url in playlist_urls
+                ]
+                for future in futures:
+                    try:
+                        listings.append(future.result())
+                    except Exception as e:
+                        listings.append(e)
+            
+            try:
+                artist_map, album_map = pipeline.finish()
+            except Exception as e:
+                # Every listed playlist needs the enrichment data
+                return [e] * len(listings)
+        
+        results: list[tuple[Playlist, list[Track]] | Exception] = []
+        for listing in listings:
+            if isinstance(listing, Exception):
+                results.append(listing)
+                continue
+            try:
+                results.append(self._store_playlist(listing, artist_map, album_map, sync_mode))
+            except Exception as e:
+                results.append(e)
         
-        return playlist, tracks_for_phases
+        return results
     
-    def fetch_liked_songs(self, sync_mode: bool = False) -> tuple[LikedSongs, list[Track]]:
+    def fetch_liked_songs(
+        self,
+        sync_mode: bool = False,
+        full_sync: bool = False,
+        full_sync_days: float = DEFAULT_LIKED_FULL_SYNC_DAYS
+    ) -> tuple[LikedSongs, list[Track]]:
         """
         Fetch user's Liked Songs (saved tracks).
         
         Args:
             sync_mode: If True, only return tracks not already in database.
+                       Liked Songs are then fetched incrementally: pages are
+                       read newest first until LIKED_SONGS_KNOWN_RUN tracks
+                       in a row are already stored with the same added_at.
+            full_sync: In sync mode, fetch the whole library anyway (detects
+                       tracks removed below the incremental head).
+            full_sync_days: In sync mode, fetch the whole library when the
+                            last complete fetch is older than this.
         
         Returns:
             Tuple of (LikedSongs, list[Track]) for subsequent phases.
+            After an incremental fetch, LikedSongs.tracks only holds the
+            re-fetched head; total_tracks is still the library size.
         
         Raises:
             SpotifyError: If user auth not enabled.
         """
-        logger.info("Fetching Liked Songs...")
-        
         if not self._client.has_user_auth:
             raise SpotifyError(
                 "User authentication required for Liked Songs. "
@@ -185,24 +420,43 @@ class SpotifyFetcher:
                 is_auth_error=True
             )
         
-        # 1. Fetch all saved tracks
-        saved_items = self._client.current_user_all_saved_tracks()
-        total_count = len(saved_items)
-        logger.info(f"Found {total_count} liked songs")
+        known: dict[str, tuple[int, str | None]] = {}
+        if sync_mode and not full_sync and not self._full_sync_due(full_sync_days):
+            known = self._database.get_playlist_links(LIKED_SONGS_KEY)
+        
+        # 1-3. Fetch saved tracks, resolving artists/albums as pages arrive
+        detector = _KnownRunDetector(known)
+        total_count: int | None = None
         
-        # 2. Filter valid tracks and collect IDs
-        valid_items, artist_ids, album_ids = self._collect_valid_items(saved_items)
+        def list_head(on_page: Callable[[list[dict[str, Any]]], None]) -> list[dict[str, Any]]:
+            nonlocal total_count
+            items, total_count = self._client.current_user_saved_tracks_until(detector, on_page)
+            return items
         
-        # 3. Batch fetch artists and albums
-        artist_map = self._batch_fetch_artists(artist_ids)
-        album_map = self._batch_fetch_albums(album_ids)
+        if known:
+            logger.info("Fetching new Liked Songs...")
+            list_items = list_head
+        else:
+            logger.info("Fetching Liked Songs...")
+            list_items = self._client.current_user_all_saved_tracks
+        
+        saved_items, valid_items, artist_map, album_map = self._fetch_items_with_enrichment(list_items)
+        if total_count is None:
+            total_count = len(saved_items)
+        incremental = detector.caught_up
+        if incremental:
+            logger.info(f"Fetched {len(saved_items)} of {total_count} liked songs (incremental)")
+        else:
+            logger.info(f"Found {total_count} liked songs")
         
         # 4. Create Track objects
         tracks = self._create_track_objects(valid_items, artist_map, album_map)
         logger.info(f"Successfully parsed {len(tracks)} tracks")
         
         # 5. Get existing track IDs BEFORE modifying database (for sync mode filtering)
-        if sync_mode:
+        if known:
+            existing_track_ids = set(known)
+        elif sync_mode:
             existing_track_ids = self._database.get_liked_songs_track_ids()
         else:
             existing_track_ids = set()
@@ -214,12 +468,21 @@ class SpotifyFetcher:
         # 7. Ensure liked_songs entry exists
         self._database.ensure_liked_songs_exists()
         
-        # 8. Store tracks in Global Track Registry (updates positions for existing tracks)
-        self._store_tracks(tracks, LIKED_SONGS_KEY)
-        
-        # 9. Remove orphaned links (tracks removed from Liked Songs)
         valid_ids = {t.spotify_id for t in tracks}
-        removed = self._database.sync_playlist_tracks(LIKED_SONGS_KEY, valid_ids)
+        if incremental:
+            # 8-9. Drop tracks unliked within the head, move the rest behind
+            # it, then store the head (positions 1..len(tracks))
+            removed = self._database.splice_playlist_head(
+                LIKED_SONGS_KEY, detector.old_head_end, valid_ids, len(tracks)
+            )
+            self._store_tracks(tracks, LIKED_SONGS_KEY)
+        else:
+            # 8. Store tracks in Global Track Registry (updates positions for existing tracks)
+            self._store_tracks(tracks, LIKED_SONGS_KEY)
+            
+            # 9. Remove orphaned links (tracks removed from Liked Songs)
+            removed = self._database.sync_playlist_tracks(LIKED_SONGS_KEY, valid_ids)
+            self._database.set_playlist_last_full_sync(LIKED_SONGS_KEY)
         if removed > 0:
             logger.info(f"Removed {removed} tracks no longer in Liked Songs")
         
@@ -236,10 +499,147 @@ class SpotifyFetcher:
         
         return liked_songs, tracks_for_phases
     
+    def _full_sync_due(self, full_sync_days: float) -> bool:
+        """Whether the last complete Liked Songs fetch is missing or too old."""
+        last_full_sync = self._database.get_playlist_last_full_sync(LIKED_SONGS_KEY)
+        if last_full_sync is None:
+            return True
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(last_full_sync)
+        return age >= timedelta(days=full_sync_days)
+    
     # =========================================================================
     # Private Helper Methods
     # =========================================================================
     
+    def _list_playlist(
+        self,
+        playlist_url: str,
+        sync_mode: bool,
+        on_page: Callable[[list[dict[str, Any]]], None]
+    ) -> "_PlaylistListing":
+        """
+        Network half of fetch_playlist(): playlist metadata and all items.
+        
+        Only reads from the database (the stored snapshot_id), so it can
+        run on worker threads. Returns a listing with items=None when the
+        playlist is unchanged since the last sync.
+        """
+        logger.info(f"Fetching playlist: {playlist_url}")
+        
+        # 1. Fetch playlist metadata
+        playlist_data = self._client.playlist(playlist_url)
+        playlist_id = playlist_data["id"]
+        snapshot_id = playlist_data.get("snapshot_id")
+        
+        logger.info(f"Playlist: {playlist_data.get('name', 'Unknown Playlist')}")
+        
+        # Sync mode: an unchanged snapshot means no tracks were added,
+        # removed or reordered since the last complete fetch
+        if sync_mode and snapshot_id is not None:
+            if self._database.get_playlist_snapshot_id(playlist_id) == snapshot_id:
+                logger.info("Playlist unchanged since last sync (same snapshot_id), skipping")
+                return _PlaylistListing(playlist_url, playlist_data, None)
+        
+        # 2-3. Fetch all track items, artists/albums are resolved as pages arrive
+        items = self._client.playlist_all_items(playlist_url, on_page=on_page)
+        logger.info(f"Found {len(items)} track items")
+        
+        return _PlaylistListing(playlist_url, playlist_data, items)
+    
+    def _store_playlist(
+        self,
+        listing: "_PlaylistListing",
+        artist_map: dict[str, dict],
+        album_map: dict[str, dict],
+        sync_mode: bool
+    ) -> tuple[Playlist, list[Track]]:
+        """
+        Database half of fetch_playlist(): build Track objects and store them.
+        
+        Must run on one thread at a time (see fetch_playlists()).
+        """
+        playlist_data = listing.playlist_data
+        playlist_id = playlist_data["id"]
+        playlist_name = playlist_data.get("name", "Unknown Playlist")
+        spotify_url = playlist_data.get("external_urls", {}).get("spotify", listing.playlist_url)
+        
+        if listing.items is None:
+            self._database.add_playlist(
+                playlist_id=playlist_id,
+                spotify_url=spotify_url,
+                name=playlist_name
+            )
+            return Playlist.from_spotify_api(playlist_data, []), []
+        
+        # 4-5. Create Track objects
+        valid_items, _, _ = self._collect_valid_items(listing.items)
+        tracks = self._create_track_objects(valid_items, artist_map, album_map)
+        logger.info(f"Successfully parsed {len(tracks)} tracks")
+        
+        # 6. Get existing track IDs BEFORE modifying database (for sync mode filtering)
+        if sync_mode:
+            existing_track_ids = self._database.get_playlist_track_ids(playlist_id)
+        else:
+            existing_track_ids = set()
+        
+        # 7. Assign position numbers based on Spotify order
+        tracks = _assign_track_numbers(tracks)
+        
+        # 8. Create/update playlist in database
+        self._database.add_playlist(
+            playlist_id=playlist_id,
+            spotify_url=spotify_url,
+            name=playlist_name
+        )
+        
+        # 9. Store tracks in Global Track Registry (updates positions for existing tracks)
+        self._store_tracks(tracks, playlist_id)
+        
+        # 10. Remove orphaned links (tracks removed from Spotify playlist)
+        valid_ids = {t.spotify_id for t in tracks}
+        removed = self._database.sync_playlist_tracks(playlist_id, valid_ids)
+        if removed > 0:
+            logger.info(f"Removed {removed} tracks no longer in playlist")
+        
+        # Everything is stored: later syncs can skip this snapshot
+        self._database.set_playlist_snapshot_id(playlist_id, playlist_data.get("snapshot_id"))
+        
+        # 11. Filter for sync mode (return only NEW tracks for phases 2-5)
+        if sync_mode:
+            new_tracks = [t for t in tracks if t.spotify_id not in existing_track_ids]
+            logger.info(f"Sync mode: {len(new_tracks)} new tracks to process")
+            tracks_for_phases = new_tracks
+        else:
+            tracks_for_phases = tracks
+        
+        # 12. Create Playlist object
+        playlist = Playlist.from_spotify_api(playlist_data, tracks)
+        
+        return playlist, tracks_for_phases
+    
+    def _fetch_items_with_enrichment(
+        self,
+        list_items: Callable[[Callable[[list[dict[str, Any]]], None]], list[dict[str, Any]]]
+    ) -> tuple[list[dict], list[dict], dict[str, dict], dict[str, dict]]:
+        """
+        Run a paginated listing with artist/album enrichment overlapped.
+        
+        Args:
+            list_items: Client listing method taking an on_page callback.
+        
+        Returns:
+            Tuple of (all_items, valid_items, artist_map, album_map)
+        """
+        with ThreadPoolExecutor(
+            max_workers=ENRICHMENT_WORKERS, thread_name_prefix="spotify-enrich"
+        ) as executor:
+            pipeline = _EnrichmentPipeline(self, executor)
+            items = list_items(pipeline.add_items)
+            valid_items, _, _ = self._collect_valid_items(items)
+            artist_map, album_map = pipeline.finish()
+        
+        return items, valid_items, artist_map, album_map
+    
     def _collect_valid_items(
         self, 
         items: list[dict[str, Any]]
@@ -260,17 +660,12 @@ class SpotifyFetcher:
                 skipped += 1
                 continue
             
-            track_data = item["track"]
             valid_items.append(item)
             
-            # Collect primary artist ID (for genres)
-            if track_data.get("artists"):
-                artist_id = track_data["artists"][0].get("id")
-                if artist_id:
-                    artist_ids.add(artist_id)
-            
-            # Collect album ID (for publisher/copyright)
-            album_id = track_data.get("album", {}).get("id")
+            # Primary artist ID (for genres), album ID (for publisher/copyright)
+            artist_id, album_id = _enrichment_ids(item["track"])
+            if artist_id:
+                artist_ids.add(artist_id)
             if album_id:
                 album_ids.add(album_id)
         
@@ -282,32 +677,65 @@ class SpotifyFetcher:
         return valid_items, artist_ids, album_ids
     
     def _batch_fetch_artists(self, artist_ids: set[str]) -> dict[str, dict]:
-        """Batch fetch artist data for genres."""
-        if not artist_ids:
-            return {}
-        
-        logger.debug("Batch fetching artist data...")
-        artist_map = {}
-        
-        for artist_data in self._client.artists(list(artist_ids)):
-            if artist_data:
-                artist_map[artist_data["id"]] = artist_data
-        
-        return artist_map
+        """Batch fetch artist data for genres (memo -> database cache -> API)."""
+        return self._fetch_with_cache(
+            artist_ids,
+            kind="artists",
+            memo=self._cache.artists,
+            get_cached=self._database.get_cached_artists,
+            store_cached=self._database.store_cached_artists,
+            fetch_batch=self._client.artists,
+            project=_project_artist
+        )
     
     def _batch_fetch_albums(self, album_ids: set[str]) -> dict[str, dict]:
-        """Batch fetch album data for publisher/copyright."""
-        if not album_ids:
+        """Batch fetch album data for publisher/copyright (memo -> database cache -> API)."""
+        return self._fetch_with_cache(
+            album_ids,
+            kind="albums",
+            memo=self._cache.albums,
+            get_cached=self._database.get_cached_albums,
+            store_cached=self._database.store_cached_albums,
+            fetch_batch=self._client.albums,
+            project=_project_album
+        )
+    
+    def _fetch_with_cache(
+        self,
+        ids: set[str],
+        kind: str,
+        memo: dict[str, dict],
+        get_cached: Callable[[set[str], float], dict[str, dict]],
+        store_cached: Callable[[dict[str, dict]], None],
+        fetch_batch: Callable[[list[str]], list[dict[str, Any]]],
+        project: Callable[[dict[str, Any]], dict[str, Any]]
+    ) -> dict[str, dict]:
+        """Resolve IDs from the run memo, then the database cache, then Spotify."""
+        if not ids:
             return {}
         
-        logger.debug("Batch fetching album data...")
-        album_map = {}
-        
-        for album_data in self._client.albums(list(album_ids)):
-            if album_data:
-                album_map[album_data["id"]] = album_data
-        
-        return album_map
+        result = {i: memo[i] for i in ids if i in memo}
+        missing = ids - result.keys()
+        
+        if missing:
+            cached = get_cached(missing, ENRICHMENT_CACHE_TTL_SECONDS)
+            memo.update(cached)
+            result.update(cached)
+            missing -= cached.keys()
+        
+        if missing:
+            logger.debug(f"Batch fetching {len(missing)} {kind} from Spotify...")
+            fetched = {
+                data["id"]: project(data)
+                for data in fetch_batch(list(missing))
+                if data
+            }
+            store_cached(fetched)
+            memo.update(fetched)
+            result.update(fetched)
+        
+        logger.debug(f"{kind.capitalize()}: {len(ids) - len(missing)} cached, {len(missing)} fetched")
+        return result
     
     def _create_track_objects(
         self,
@@ -315,8 +743,14 @@ class SpotifyFetcher:
         artist_map: dict[str, dict],
         album_map: dict[str, dict]
     ) -> list[Track]:
-        """Convert API items to Track objects with enriched metadata."""
+        """
+        Convert API items to Track objects with enriched metadata.
+        
+        Progress is logged once per PROGRESS_LOG_INTERVAL tracks (not per
+        track), and only when DEBUG is enabled.
+        """
         tracks = []
+        log_progress = logger.isEnabledFor(logging.DEBUG)
         
         for item in valid_items:
             track_data = item["track"]
@@ -342,7 +776,17 @@ class SpotifyFetcher:
                 added_at=added_at
             )
             tracks.append(track)
-            logger.debug(f"Processed: {track.artist} - {track.name}")
+            
+            if log_progress and len(tracks) % PROGRESS_LOG_INTERVAL == 0:
+                logger.debug(f"Processed {len(tracks)}/{len(valid_items)} tracks")
+        
+        if log_progress and tracks:
+            with_genres = sum(1 for t in tracks if t.genres)
+            with_label = sum(1 for t in tracks if t.publisher)
+            logger.debug(
+                f"Processed {len(tracks)} tracks "
+                f"({with_genres} with genres, {with_label} with label)"
+            )
         
         return tracks
     
@@ -350,9 +794,9 @@ class SpotifyFetcher:
         """
         Store tracks in Global Track Registry and link to playlist.
         
-        This is the core of the new architecture:
-        1. get_or_create_global_track() - adds/updates in global registry
-        2. link_track_to_playlist() - creates M:N relationship
+        This is the core of the new architecture: upsert_tracks_and_links()
+        adds/updates each track in the global registry and creates the M:N
+        relationship with the playlist, all in one database transaction.
         
         Deduplicates by spotify_id (keeps first occurrence if duplicates).
         """
@@ -374,21 +818,19 @@ class SpotifyFetcher:
                 f"(same song added multiple times)"
             )
         
-        # Store each track in Global Track Registry and link to playlist
-        for track in unique_tracks:
-            # Add/update in global registry (returns database ID)
-            track_db_id = self._database.get_or_create_global_track(
-                spotify_id=track.spotify_id,
-                track_data=track.to_database_dict()
-            )
-            
-            # Link to this playlist with position
-            self._database.link_track_to_playlist(
-                playlist_id=playlist_id,
-                track_db_id=track_db_id,
-                position=track.assigned_number,
-                added_at=track.added_at
-            )
+        # Store all tracks in Global Track Registry and link to playlist with position
+        self._database.upsert_tracks_and_links(
+            playlist_id=playlist_id,
+            tracks=[
+                {
+                    "spotify_id": track.spotify_id,
+                    "track_data": track.to_database_dict(),
+                    "position": track.assigned_number,
+                    "added_at": track.added_at,
+                }
+                for track in unique_tracks
+            ]
+        )
         
         logger.debug(f"Stored {len(unique_tracks)} tracks in Global Track Registry")
     
@@ -442,7 +884,8 @@ class SpotifyFetcher:
 def fetch_playlist_phase1(
     database: Database,
     playlist_url: str,
-    sync_mode: bool = False
+    sync_mode: bool = False,
+    cache: EnrichmentCache | None = None
 ) -> tuple[Playlist, list[Track]]:
     """
     PHASE 1 entry point for playlist downloads.
@@ -451,27 +894,59 @@ def fetch_playlist_phase1(
         database: Database instance.
         playlist_url: Spotify playlist URL.
         sync_mode: Whether to filter to new tracks only.
+        cache: Artist/album memo to share with other fetches in this run.
     
     Returns:
         Tuple of (Playlist, list[Track]) for subsequent phases.
     """
-    fetcher = SpotifyFetcher(database)
+    fetcher = SpotifyFetcher(database, cache)
     return fetcher.fetch_playlist(playlist_url, sync_mode)
 
 
+def fetch_playlists_phase1(
+    database: Database,
+    playlist_urls: list[str],
+    sync_mode: bool = False,
+    cache: EnrichmentCache | None = None,
+    max_workers: int = DEFAULT_SYNC_WORKERS
+) -> list[tuple[Playlist, list[Track]] | Exception]:
+    """
+    PHASE 1 entry point for syncing several playlists at once.
+    
+    Args:
+        database: Database instance.
+        playlist_urls: Spotify playlist URLs.
+        sync_mode: Whether to filter to new tracks only.
+        cache: Artist/album memo to share with other fetches in this run.
+        max_workers: Playlists listed concurrently.
+    
+    Returns:
+        Per-URL results in input order; a failed playlist's entry is the
+        exception raised for it (see SpotifyFetcher.fetch_playlists).
+    """
+    fetcher = SpotifyFetcher(database, cache)
+    return fetcher.fetch_playlists(playlist_urls, sync_mode, max_workers)
+
+
 def fetch_liked_songs_phase1(
     database: Database,
-    sync_mode: bool = False
+    sync_mode: bool = False,
+    cache: EnrichmentCache | None = None,
+    full_sync: bool = False,
+    full_sync_days: float = DEFAULT_LIKED_FULL_SYNC_DAYS
 ) -> tuple[LikedSongs, list[Track]]:
     """
     PHASE 1 entry point for --liked downloads.
     
     Args:
         database: Database instance.
-        sync_mode: Whether to filter to new tracks only.
+        sync_mode: Whether to filter to new tracks only (incremental fetch).
+        cache: Artist/album memo to share with other fetches in this run.
+        full_sync: In sync mode, fetch the whole library anyway.
+        full_sync_days: In sync mode, days between complete fetches.
     
     Returns:
         Tuple of (LikedSongs, list[Track]) for subsequent phases.
     """
-    fetcher = SpotifyFetcher(database)
-    return fetcher.fetch_liked_songs(sync_mode)
\ No newline at end of file
+    fetcher = SpotifyFetcher(database, cache)
+    return fetcher.fetch_liked_songs(sync_mode, full_sync, full_sync_days)
\ No newline at end of file
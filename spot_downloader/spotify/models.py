@@ -7,6 +7,10 @@ to pass track information between phases.
 
 Design Decisions:
     - All dataclasses are frozen (immutable) to prevent accidental modification
+    - Track is slotted (no per-instance __dict__): one is created for every
+      playlist item and every pending track, so its size matters
+    - Names that repeat across tracks (artists, albums, genres, labels) are
+      interned by the factory methods, so equal strings share one object
     - Fields match Spotify API response structure where possible
     - Optional fields have sensible defaults
     - Models are independent of database storage format
@@ -22,11 +26,17 @@ Usage:
     )
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+def _intern(value: Any) -> Any:
+    """Intern a string so repeated names share one object; pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
 class Track:
     """
     Immutable representation of a Spotify track.
@@ -116,6 +126,11 @@ class Track:
         from_database_dict: Reconstruct Track from database storage.
         to_database_dict: Convert to dict for database storage.
     
+    Derived Properties:
+        search_query and duration_seconds are computed on first access and
+        cached in private slots (excluded from __init__, comparison and
+        repr). dataclasses.replace() starts the copy with an empty cache.
+    
     Example:
         # Creating from Spotify API response
         track = Track.from_spotify_api(spotify_track_data, artist_data, album_data)
@@ -151,7 +166,10 @@ class Track:
     copyright_text: str = ""
     assigned_number: int | None = None
     added_at: str | None = None
-
+    
+    # Lazily computed derived values (see search_query, duration_seconds)
+    _search_query: str | None = field(default=None, init=False, repr=False, compare=False)
+    _duration_seconds: int | None = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_spotify_api(
@@ -214,7 +232,7 @@ class Track:
         popularity = track_data.get("popularity", 0)
         
         # Extract artists
-        artists_list = [a["name"] for a in track_data.get("artists", [])]
+        artists_list = [_intern(a["name"]) for a in track_data.get("artists", [])]
         artist = artists_list[0] if artists_list else "Unknown Artist"
         artists = tuple(artists_list)
         
@@ -302,7 +320,7 @@ class Track:
         
         # If we have artist data, extract genres
         if artist_data:
-            genres = tuple(artist_data.get("genres", []))
+            genres = tuple(_intern(g) for g in artist_data.get("genres", []))
         
         return cls(
             spotify_id=spotify_id,
@@ -310,22 +328,22 @@ class Track:
             name=name,
             artist=artist,
             artists=artists,
-            album=album_name,
+            album=_intern(album_name),
             duration_ms=duration_ms,
-            album_artist=album_artist,
+            album_artist=_intern(album_artist),
             track_number=track_number,
             disc_number=disc_number,
             disc_count=disc_count,
             tracks_count=tracks_count,
-            release_date=release_date,
+            release_date=_intern(release_date),
             year=year,
             isrc=isrc,
             explicit=explicit,
             popularity=popularity,
             cover_url=cover_url,
             genres=genres,
-            publisher=publisher,
-            copyright_text=copyright_text,
+            publisher=_intern(publisher),
+            copyright_text=_intern(copyright_text),
             assigned_number=None,  # Assigned later by _assign_track_numbers
             added_at=added_at
         )
@@ -421,31 +439,31 @@ class Track:
             uses tuples for immutability. This method handles the conversion.
         """
         # Convert lists to tuples
-        artists = tuple(data.get("artists", [data.get("artist", "Unknown Artist")]))
-        genres = tuple(data.get("genres", []))
+        artists = tuple(map(_intern, data.get("artists", [data.get("artist", "Unknown Artist")])))
+        genres = tuple(map(_intern, data.get("genres", [])))
         
         return cls(
             spotify_id=track_id,
             spotify_url=data.get("spotify_url", f"https://open.spotify.com/track/{track_id}"),
             name=data.get("name", "Unknown"),
-            artist=data.get("artist", "Unknown Artist"),
+            artist=_intern(data.get("artist", "Unknown Artist")),
             artists=artists,
-            album=data.get("album", "Unknown Album"),
+            album=_intern(data.get("album", "Unknown Album")),
             duration_ms=data.get("duration_ms", 0),
-            album_artist=data.get("album_artist", ""),
+            album_artist=_intern(data.get("album_artist", "")),
             track_number=data.get("track_number", 1),
             disc_number=data.get("disc_number", 1),
             disc_count=data.get("disc_count", 1),
             tracks_count=data.get("tracks_count", 1),
-            release_date=data.get("release_date", ""),
+            release_date=_intern(data.get("release_date", "")),
             year=data.get("year", 0),
             isrc=data.get("isrc"),
             explicit=data.get("explicit", False),
             popularity=data.get("popularity", 0),
             cover_url=data.get("cover_url"),
             genres=genres,
-            publisher=data.get("publisher", ""),
-            copyright_text=data.get("copyright_text", ""),
+            publisher=_intern(data.get("publisher", "")),
+            copyright_text=_intern(data.get("copyright_text", "")),
             assigned_number=data.get("assigned_number"),
             added_at=data.get("added_at"),
         )
@@ -462,7 +480,9 @@ class Track:
         Example:
             track.search_query  # "Queen - Bohemian Rhapsody"
         """
-        return f"{self.artist} - {self.name}"
+        if self._search_query is None:
+            object.__setattr__(self, "_search_query", f"{self.artist} - {self.name}")
+        return self._search_query
     
     @property
     def duration_seconds(self) -> int:
@@ -475,7 +495,9 @@ class Track:
         Example:
             track.duration_seconds  # 354 (for 354320 ms)
         """
-        return self.duration_ms // 1000
+        if self._duration_seconds is None:
+            object.__setattr__(self, "_duration_seconds", self.duration_ms // 1000)
+        return self._duration_seconds
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,437 @@
+"""
+Offline Spotify API stand-ins for spot-downloader (PHASE 1 benchmarks).
+
+SpotifyClient normally wraps a live spotipy.Spotify, so PHASE 1 cannot run
+without credentials and its timing depends on the network. This module
+provides objects with the same method signatures that SpotifyClient can
+wrap instead (see SpotifyClient.init_with_instance()):
+
+    - RecordingSpotify: Wraps a real spotipy.Spotify and records every
+      response, keyed by method and arguments, so a run can be saved
+      to disk with save().
+    - ReplaySpotify: Serves a saved recording back. A request that was
+      not recorded fails like a 404 from Spotify.
+    - SyntheticSpotify: Generates playlists, Liked Songs, artists and
+      albums of any size on the fly, deterministically.
+
+Both stand-ins simulate the network through FakeNetwork:
+    - latency: Seconds slept per request (plus up to `jitter` seconds).
+    - rate_limit_every: Every Nth request is answered with a 429 carrying
+      Retry-After: retry_after, like Spotify does.
+
+Usage:
+    from spot_downloader.spotify.client import SpotifyClient
+    from spot_downloader.spotify.replay import FakeNetwork, SyntheticSpotify
+
+    spotify = SyntheticSpotify(
+        playlists={"bench10k": 10_000},
+        network=FakeNetwork(latency=0.05, rate_limit_every=200)
+    )
+    SpotifyClient.init_with_instance(spotify)
+    playlist, tracks = fetch_playlist_phase1(database, spotify.playlist_url("bench10k"))
+
+Recording file format:
+    Gzip-compressed JSON: {"version": 1, "responses": {key: response}},
+    where key is request_key(method, args, kwargs). Artists, albums and
+    tracks fetched in batches are stored one per entity_key(method, id)
+    instead, because batch composition varies between runs.
+
+See spot_downloader.spotify.benchmark for the command-line harness.
+"""
+
+import gzip
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import spotipy
+
+from spot_downloader.core.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+RECORDING_VERSION = 1
+
+# spotipy.Spotify methods used by SpotifyClient that are recorded/replayed
+RECORDED_METHODS = frozenset({
+    "track",
+    "tracks",
+    "artist",
+    "artists",
+    "album",
+    "albums",
+    "playlist",
+    "playlist_items",
+    "current_user",
+    "current_user_saved_tracks",
+    "search",
+})
+
+# Several-IDs endpoints: recorded per entity, since batch composition depends
+# on page arrival order. Maps method name to the response's list key.
+BATCH_METHODS = {"tracks": "tracks", "artists": "artists", "albums": "albums"}
+
+# Synthetic data shape: how many tracks share one artist / one album
+TRACKS_PER_ARTIST = 5
+TRACKS_PER_ALBUM = 10
+
+_SPOTIFY_ID_LENGTH = 22
+
+
+def request_key(method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """
+    Canonical key of one spotipy call, used to match recordings on replay.
+
+    Playlist URLs and bare IDs are not normalized: replay must be driven by
+    the same inputs as the recording.
+    """
+    return json.dumps([method, list(args), kwargs], sort_keys=True, default=str)
+
+
+def entity_key(method: str, entity_id: str) -> str:
+    """Key of one entity returned by a BATCH_METHODS call, e.g. "artists:<id>"."""
+    return f"{method}:{entity_id}"
+
+
+def load_recording(path: Path) -> dict[str, Any]:
+    """
+    Read a recording saved by RecordingSpotify.save().
+
+    Returns:
+        Mapping of request_key() to the recorded response.
+
+    Raises:
+        ValueError: If the file is not a recording of a supported version.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != RECORDING_VERSION:
+        raise ValueError(f"Unsupported Spotify recording: {path}")
+    return data["responses"]
+
+
+def _spotify_id(prefix: str, index: int) -> str:
+    """Deterministic 22-character ID, e.g. _spotify_id("ar", 7) -> "ar00000000000000000007"."""
+    return f"{prefix}{index:0{_SPOTIFY_ID_LENGTH - len(prefix)}d}"
+
+
+def _id_from_url(id_or_url: str) -> str:
+    """Bare ID from a Spotify URL, URI or ID (query string removed)."""
+    if id_or_url.startswith("spotify:"):
+        return id_or_url.split(":")[-1]
+    return id_or_url.rstrip("/").split("/")[-1].split("?")[0]
+
+
+@dataclass
+class FakeNetwork:
+    """
+    Simulated latency and rate limiting shared by the offline stand-ins.
+
+    Attributes:
+        latency: Seconds every request takes.
+        jitter: Extra random delay, up to this many seconds.
+        rate_limit_every: Answer every Nth request with a 429 (0 disables).
+        retry_after: Retry-After header value of injected 429s, in seconds.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_every: int = 0
+    retry_after: float = 1.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+
+    def request(self, method: str) -> None:
+        """
+        Simulate the round trip of one request.
+
+        Raises:
+            spotipy.SpotifyException: An injected 429.
+        """
+        with self._lock:
+            self.requests += 1
+            inject = self.rate_limit_every > 0 and self.requests % self.rate_limit_every == 0
+            if inject:
+                self.rate_limited += 1
+
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        if inject:
+            raise spotipy.SpotifyException(
+                429, -1,
+                f"{method}: API rate limit exceeded (injected)",
+                headers={"Retry-After": str(self.retry_after)}
+            )
+
+
+class RecordingSpotify:
+    """
+    Records responses of a real spotipy.Spotify for later replay.
+
+    Calls to RECORDED_METHODS are forwarded and their responses kept in
+    memory (last response wins for repeated requests); everything else is
+    passed through untouched. Failed requests are not recorded.
+    """
+
+    def __init__(self, spotify: spotipy.Spotify) -> None:
+        self._spotify = spotify
+        self._lock = threading.Lock()
+        self._responses: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._spotify, name)
+        if name not in RECORDED_METHODS:
+            return attr
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            response = attr(*args, **kwargs)
+            with self._lock:
+                if name in BATCH_METHODS and response:
+                    for entity in response.get(BATCH_METHODS[name]) or []:
+                        if entity:
+                            self._responses[entity_key(name, entity["id"])] = entity
+                else:
+                    self._responses[request_key(name, args, kwargs)] = response
+            return response
+
+        return record
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def save(self, path: Path) -> None:
+        """Write all recorded responses to path (gzip-compressed JSON)."""
+        with self._lock:
+            data = {"version": RECORDING_VERSION, "responses": dict(self._responses)}
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        logger.info(f"Saved {len(data['responses'])} Spotify responses to {path}")
+
+
+class ReplaySpotify:
+    """
+    Serves responses captured by RecordingSpotify.
+
+    Each call of RECORDED_METHODS goes through the FakeNetwork first, then
+    returns the recorded response for identical arguments. Unrecorded
+    requests raise a 404 SpotifyException, which SpotifyClient turns into
+    SpotifyError as usual. BATCH_METHODS responses are assembled from the
+    recorded entities, with None for unknown IDs like Spotify returns.
+    """
+
+    def __init__(self, responses: dict[str, Any], network: FakeNetwork | None = None) -> None:
+        self._responses = responses
+        self.network = network if network is not None else FakeNetwork()
+
+    @classmethod
+    def from_file(cls, path: Path, network: FakeNetwork | None = None) -> "ReplaySpotify":
+        """Create a replay from a file written by RecordingSpotify.save()."""
+        return cls(load_recording(path), network)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in RECORDED_METHODS:
+            raise AttributeError(name)
+
+        def replay(*args: Any, **kwargs: Any) -> Any:
+            self.network.request(name)
+            if name in BATCH_METHODS:
+                return {BATCH_METHODS[name]: [
+                    self._responses.get(entity_key(name, _id_from_url(i)))
+                    for i in args[0]
+                ]}
+            key = request_key(name, args, kwargs)
+            if key not in self._responses:
+                raise spotipy.SpotifyException(
+                    404, -1, f"No recorded response for {name}{args}"
+                )
+            return self._responses[key]
+
+        return replay
+
+
+class SyntheticSpotify:
+    """
+    Generated Spotify catalogue of arbitrary size.
+
+    Playlists are declared by ID and track count; every track, artist and
+    album is derived from its index, so two instances with the same
+    arguments return identical data. Track i of a playlist belongs to
+    artist i // TRACKS_PER_ARTIST and album i // TRACKS_PER_ALBUM, so
+    playlists share artists/albums with each other like real libraries do.
+
+    Items carry the fields in PLAYLIST_ITEM_FIELDS plus what enrichment
+    reads; `fields` and `market` arguments are accepted and ignored.
+    """
+
+    def __init__(
+        self,
+        playlists: dict[str, int] | None = None,
+        liked_songs: int = 0,
+        network: FakeNetwork | None = None
+    ) -> None:
+        self._playlists = dict(playlists or {})
+        self._liked_songs = liked_songs
+        self.network = network if network is not None else FakeNetwork()
+
+    @staticmethod
+    def playlist_url(playlist_id: str) -> str:
+        """Spotify URL of a synthetic playlist."""
+        return f"https://open.spotify.com/playlist/{playlist_id}"
+
+    # =========================================================================
+    # spotipy.Spotify interface
+    # =========================================================================
+
+    def playlist(
+        self,
+        playlist_id: str,
+        fields: str | None = None,
+        market: str | None = None,
+        additional_types: tuple[str, ...] = ("track",)
+    ) -> dict[str, Any]:
+        self.network.request("playlist")
+        playlist_id = self._known_playlist(playlist_id)
+        total = self._playlists[playlist_id]
+        return {
+            "id": playlist_id,
+            "name": f"Synthetic {total} tracks",
+            "description": "",
+            "owner": {"id": "synthetic", "display_name": "Synthetic"},
+            "images": [],
+            "external_urls": {"spotify": self.playlist_url(playlist_id)},
+            "tracks": {"total": total},
+            "uri": f"spotify:playlist:{playlist_id}",
+            "snapshot_id": f"snapshot-{total}",
+        }
+
+    def playlist_items(
+        self,
+        playlist_id: str,
+        fields: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        market: str | None = None,
+        additional_types: tuple[str, ...] = ("track", "episode")
+    ) -> dict[str, Any]:
+        self.network.request("playlist_items")
+        playlist_id = self._known_playlist(playlist_id)
+        return self._page(playlist_id, self._playlists[playlist_id], limit, offset)
+
+    def current_user_saved_tracks(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        market: str | None = None
+    ) -> dict[str, Any]:
+        self.network.request("current_user_saved_tracks")
+        return self._page("liked", self._liked_songs, limit, offset)
+
+    def artists(self, artists: list[str]) -> dict[str, Any]:
+        self.network.request("artists")
+        return {"artists": [self._artist(_id_from_url(a)) for a in artists]}
+
+    def albums(self, albums: list[str], market: str | None = None) -> dict[str, Any]:
+        self.network.request("albums")
+        return {"albums": [self._album(_id_from_url(a)) for a in albums]}
+
+    def current_user(self) -> dict[str, Any]:
+        self.network.request("current_user")
+        return {"id": "synthetic", "display_name": "Synthetic"}
+
+    def search(
+        self,
+        q: str,
+        limit: int = 10,
+        offset: int = 0,
+        type: str = "track",
+        market: str | None = None
+    ) -> dict[str, Any]:
+        self.network.request("search")
+        return {f"{type}s": {"items": [], "total": 0, "next": None}}
+
+    # =========================================================================
+    # Data generation
+    # =========================================================================
+
+    def _known_playlist(self, id_or_url: str) -> str:
+        playlist_id = _id_from_url(id_or_url)
+        if playlist_id not in self._playlists:
+            raise spotipy.SpotifyException(404, -1, f"Playlist not found: {playlist_id}")
+        return playlist_id
+
+    def _page(self, prefix: str, total: int, limit: int, offset: int) -> dict[str, Any]:
+        end = min(total, offset + limit)
+        return {
+            "items": [self._item(prefix, i) for i in range(offset, end)],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next": f"synthetic:{prefix}?offset={end}" if end < total else None,
+        }
+
+    @staticmethod
+    def _item(prefix: str, index: int) -> dict[str, Any]:
+        artist_index = index // TRACKS_PER_ARTIST
+        album_index = index // TRACKS_PER_ALBUM
+        track_id = _spotify_id(f"{prefix[:10]}t", index)
+        return {
+            "added_at": "2024-01-01T00:00:00Z",
+            "is_local": False,
+            "track": {
+                "id": track_id,
+                "name": f"Track {index}",
+                "type": "track",
+                "is_local": False,
+                "duration_ms": 180_000 + index % 120_000,
+                "explicit": index % 7 == 0,
+                "popularity": index % 100,
+                "track_number": index % TRACKS_PER_ALBUM + 1,
+                "disc_number": 1,
+                "external_ids": {"isrc": f"XX{index:010d}"},
+                "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+                "artists": [{"id": _spotify_id("ar", artist_index), "name": f"Artist {artist_index}"}],
+                "album": {
+                    "id": _spotify_id("al", album_index),
+                    "name": f"Album {album_index}",
+                    "release_date": f"{2000 + album_index % 25}-01-01",
+                    "total_tracks": TRACKS_PER_ALBUM,
+                    "images": [{
+                        "url": f"https://i.scdn.co/image/{album_index}",
+                        "width": 640,
+                        "height": 640,
+                    }],
+                    "artists": [{"name": f"Artist {artist_index}"}],
+                },
+            },
+        }
+
+    @staticmethod
+    def _artist(artist_id: str) -> dict[str, Any]:
+        return {
+            "id": artist_id,
+            "name": f"Artist {artist_id}",
+            "genres": ["synthetic", f"genre {artist_id[-1]}"],
+        }
+
+    @staticmethod
+    def _album(album_id: str) -> dict[str, Any]:
+        return {
+            "id": album_id,
+            "name": f"Album {album_id}",
+            "label": "Synthetic Records",
+            "copyrights": [{"text": "(C) Synthetic Records", "type": "C"}],
+            "total_tracks": TRACKS_PER_ALBUM,
+            "release_date": "2000-01-01",
+            "images": [],
+            "tracks": {"items": [{"disc_number": 1}]},
+        }
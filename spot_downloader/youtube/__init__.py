@@ -7,6 +7,8 @@ YouTube Music videos and songs (PHASE 2).
 Components:
     - YouTubeResult: Data model for YouTube search results
     - MatchResult: Data model for matching outcomes
+    - ScoreComponents: Per-component scores of a candidate
+    - ScoringWeights: Weights and bonuses combining them into a score
     - YouTubeMatcher: Main matcher class with matching algorithm
 
 Usage:
@@ -25,18 +27,23 @@ Usage:
 """
 
 from spot_downloader.youtube.matcher import (
+    ScoringWeights,
     YouTubeMatcher,
     get_tracks_needing_match,
     match_tracks_phase2,
+    rescore_matches,
 )
-from spot_downloader.youtube.models import MatchResult, YouTubeResult
+from spot_downloader.youtube.models import MatchResult, ScoreComponents, YouTubeResult
 
 __all__ = [
     # Models
     "YouTubeResult",
     "MatchResult",
+    "ScoreComponents",
     # Matcher
     "YouTubeMatcher",
+    "ScoringWeights",
     "match_tracks_phase2",
+    "rescore_matches",
     "get_tracks_needing_match",
 ]
@@ -0,0 +1,188 @@
+"""
+PHASE 2 scoring microbenchmark for spot-downloader.
+
+Scores generated YouTube Music candidates against generated Spotify tracks,
+entirely offline, and compares the per-candidate scorer
+(YouTubeMatcher._score_components) with the batch scorer
+(YouTubeMatcher._score_components_batch). Both must return identical
+components; the run fails if they don't.
+
+Candidates are variants of the track (other versions, uploads, other
+artists), like the ~100 results of a real ISRC + text search.
+
+Usage:
+    python -m spot_downloader.youtube.benchmark
+    python -m spot_downloader.youtube.benchmark --tracks 10000 --candidates 100  # 1M candidates
+
+Options:
+    --tracks: Number of tracks to score.
+    --candidates: Candidates per track.
+    --seed: Seed of the generated data.
+"""
+
+import argparse
+import gc
+import random
+import time
+from dataclasses import dataclass
+
+from spot_downloader.spotify.models import Track
+from spot_downloader.youtube.matcher import YouTubeMatcher
+from spot_downloader.youtube.models import YouTubeResult
+
+
+DEFAULT_TRACKS = 1_000
+DEFAULT_CANDIDATES = 100
+
+_WORDS = (
+    "love", "night", "heart", "fire", "dream", "alive", "summer", "oliver",
+    "city", "lights", "forever", "dance", "gold", "river", "wild", "home",
+)
+_SUFFIXES = (
+    "", "", "", " (Official Video)", " (Live)", " - Remastered 2011",
+    " (Acoustic)", " [Lyrics]", " (Slowed + Reverb)", " Remix", " (Cover)",
+    " (feat. Someone)",
+)
+
+
+@dataclass(frozen=True)
+class ScoringResult:
+    """Timing of one scorer over all generated candidates."""
+    label: str
+    tracks: int
+    candidates: int
+    seconds: float
+
+    def __str__(self) -> str:
+        per_track = self.seconds / self.tracks * 1e6 if self.tracks else 0.0
+        rate = self.candidates / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"{self.label:>14}  {self.candidates:>9} candidates  {self.seconds:>8.2f}s  "
+            f"{per_track:>8.1f} us/track  {rate:>10.0f} candidates/s"
+        )
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).title()
+
+
+def generate_dataset(
+    tracks: int,
+    candidates: int,
+    seed: int = 0
+) -> list[tuple[Track, list[YouTubeResult]]]:
+    """Generate (track, candidates) pairs; deterministic for a seed."""
+    rng = random.Random(seed)
+    dataset = []
+
+    for i in range(tracks):
+        artists = tuple(_phrase(rng, rng.randint(1, 2)) for _ in range(rng.randint(1, 3)))
+        track = Track(
+            spotify_id=f"track{i}",
+            spotify_url=f"https://open.spotify.com/track/track{i}",
+            name=_phrase(rng, rng.randint(1, 4)) + rng.choice(_SUFFIXES[:6]),
+            artist=artists[0],
+            artists=artists,
+            album=rng.choice(("", _phrase(rng, 2))),
+            duration_ms=rng.randint(120, 360) * 1000,
+            explicit=rng.random() < 0.2,
+            popularity=rng.randint(0, 100)
+        )
+
+        results = []
+        for j in range(candidates):
+            if rng.random() < 0.5:
+                title = track.name.split(" (")[0] + rng.choice(_SUFFIXES)
+                result_artists = artists[:rng.randint(1, len(artists))]
+            else:
+                title = _phrase(rng, rng.randint(1, 5)) + rng.choice(_SUFFIXES)
+                result_artists = (_phrase(rng, 1),) if rng.random() < 0.8 else ()
+            result_type = rng.choice(("song", "video"))
+            results.append(YouTubeResult(
+                video_id=f"v{i}x{j}",
+                url=f"https://music.youtube.com/watch?v=v{i}x{j}",
+                title=title,
+                author=result_artists[0] if result_artists else "",
+                duration_seconds=track.duration_ms // 1000 + rng.randint(-5, 5),
+                is_verified=result_type == "song",
+                artists=result_artists,
+                album=rng.choice((None, track.album, _phrase(rng, 2))),
+                is_explicit=rng.choice((None, True, False)),
+                views=rng.randint(0, 10**8),
+                result_type=result_type
+            ))
+        dataset.append((track, results))
+
+    return dataset
+
+
+def run_scoring(
+    dataset: list[tuple[Track, list[YouTubeResult]]]
+) -> tuple[ScoringResult, ScoringResult]:
+    """
+    Time the per-candidate and batch scorers over a dataset.
+
+    The garbage collector is disabled while timing (as timeit does): with
+    a large dataset alive, its collections would dominate both timings.
+
+    Raises:
+        AssertionError: If the scorers disagree on any candidate.
+    """
+    # Scoring only: no database or YTMusic client needed
+    matcher = YouTubeMatcher.__new__(YouTubeMatcher)
+    candidates = sum(len(results) for _, results in dataset)
+
+    # Warm up both scorers (regex cache, rapidfuzz/numpy first-call costs)
+    for track, results in dataset[:10]:
+        [matcher._score_components(r, track) for r in results]
+        matcher._score_components_batch(results, track)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        single = [
+            [matcher._score_components(r, track) for r in results]
+            for track, results in dataset
+        ]
+        single_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = [
+            matcher._score_components_batch(results, track)
+            for track, results in dataset
+        ]
+        batch_seconds = time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    if single != batch:
+        raise AssertionError("Batch scorer differs from per-candidate scorer")
+
+    return (
+        ScoringResult("per-candidate", len(dataset), candidates, single_seconds),
+        ScoringResult("batch", len(dataset), candidates, batch_seconds),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point (see module docstring)."""
+    parser = argparse.ArgumentParser(
+        prog="python -m spot_downloader.youtube.benchmark",
+        description="Benchmark PHASE 2 candidate scoring on generated data."
+    )
+    parser.add_argument("--tracks", type=int, default=DEFAULT_TRACKS)
+    parser.add_argument("--candidates", type=int, default=DEFAULT_CANDIDATES, help="per track")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dataset = generate_dataset(args.tracks, args.candidates, args.seed)
+    single, batch = run_scoring(dataset)
+    print(single)
+    print(batch)
+    print(f"{'speedup':>14}  {single.seconds / batch.seconds:.2f}x (identical scores)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,18 @@ PHASE 2 Workflow:
     1. Get tracks without YouTube URL from Global Track Registry
     2. For each track, search YouTube Music
     3. Apply matching algorithm to find best result
-    4. Store YouTube URL in database (or mark as failed)
+    4. Store YouTube URL in database (or mark as failed), and the scored
+       candidates of each search (match_candidates)
     5. Return match statistics
 
+Rescoring:
+    rescore_matches() (spot --rescore) re-selects all matches from the
+    stored candidates with the current weights and thresholds, offline.
+
 Dependencies:
     - ytmusicapi: YouTube Music API client
     - rapidfuzz: Fuzzy string matching (same as spotDL)
+    - numpy: Required by rapidfuzz.process.cdist (batch scoring)
 
 Usage:
     from spot_downloader.youtube.matcher import YouTubeMatcher
@@ -37,17 +43,26 @@ Usage:
 
 import random
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache, partial
+from typing import Any, Generator, Iterable
 
-from rapidfuzz import fuzz
+import numpy as np
+import requests
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
 from ytmusicapi import YTMusic
 
-from spot_downloader.core.database import Database
+from spot_downloader.core.concurrency import iter_completed
+from spot_downloader.core.config import MatchingConfig
+from spot_downloader.core.database import Database, YOUTUBE_MATCH_FAILED
+from spot_downloader.core.exceptions import ConfigError
 from spot_downloader.core.logger import get_logger, log_match_close_alternatives
 from spot_downloader.spotify.models import Track
-from spot_downloader.youtube.models import MatchResult, YouTubeResult
+from spot_downloader.youtube.models import MatchResult, ScoreComponents, YouTubeResult
 
 from spot_downloader.core.logger import (
     get_logger,
@@ -102,6 +117,46 @@ SEARCH_OPTIONS = [
     {"filter": "videos", "ignore_spelling": True, "limit": 50},
 ]
 
+# ISRC search limit
+ISRC_SEARCH_LIMIT = 20
+
+# Timeout of a YouTube Music request (ytmusicapi's default, which it only
+# applies to sessions it creates itself)
+SEARCH_TIMEOUT_SECONDS = 30
+
+# Names of the two searches of a track, as stored in match_candidates
+ISRC_STAGE = "isrc"
+TEXT_STAGE = "text"
+
+# Tracks submitted ahead per matching thread by match_tracks()
+PENDING_TASKS_PER_THREAD = 4
+
+
+# =============================================================================
+# SEARCH RESULT CACHE
+# =============================================================================
+
+# Search responses are stored in the database (youtube_search_cache) keyed by
+# (query, filter, limit), so --force-rematch runs and re-runs after scoring
+# changes don't search again. Entries older than the TTL are searched again;
+# after each run the cache is cut back to SEARCH_CACHE_MAX_ENTRIES (oldest first).
+SEARCH_CACHE_TTL_SECONDS = 30 * 24 * 3600
+SEARCH_CACHE_MAX_ENTRIES = 200_000
+
+# Fields of a ytmusicapi search result read by YouTubeResult.from_ytmusic_result().
+# Only these are cached (thumbnails etc. are most of a raw response).
+SEARCH_CACHE_FIELDS = (
+    "videoId",
+    "resultType",
+    "title",
+    "artists",
+    "duration",
+    "duration_seconds",
+    "album",
+    "isExplicit",
+    "views",
+)
+
 
 # =============================================================================
 # RETRY CONFIGURATION FOR TRANSIENT ERRORS
@@ -172,8 +227,9 @@ EXPLICIT_MATCH_SCORES = {
     "unknown": 0,                 # One or both have None: no adjustment
 }
 
-# Album match bonus
+# Album match bonus, given from this album name similarity (0-100)
 ALBUM_MATCH_BONUS = 5
+ALBUM_MATCH_THRESHOLD = 80
 
 # Forbidden Word Penalty (per word, matches spotDL)
 # Applied when YouTube has a keyword (e.g., "acoustic", "instrumental") that Spotify doesn't
@@ -185,6 +241,30 @@ FORBIDDEN_WORD_PENALTY = 15
 CLOSE_MATCH_THRESHOLD = 5.0
 
 
+# Cache sizes for memoized normalization. Artist and album names repeat
+# across the candidates of a track and across tracks; titles repeat between
+# a track's searches (songs/videos, ISRC/text)
+NAME_CACHE_SIZE = 16384
+TITLE_CACHE_SIZE = 4096
+
+# Patterns for _normalize_text()
+_BRACKETED_PATTERN = re.compile(r'\s*[\(\[\{].*?[\)\]\}]\s*')
+_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s]')
+
+# All forbidden words in one pass, as whole words only ("live" must not
+# match "alive" or "oliver")
+_FORBIDDEN_WORDS_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(word) for word in FORBIDDEN_WORDS) + r')\b'
+)
+
+# Forbidden words covered by each match: "remastered" also counts as
+# "remaster", "bassboosted" as "bassboost" (as with spotDL's substring check)
+_FORBIDDEN_WORD_FORMS = {
+    form: frozenset(word for word in FORBIDDEN_WORDS if form.startswith(word))
+    for form in FORBIDDEN_WORDS
+}
+
+
 def _normalize_text(text: str) -> str:
     """
     Normalize text for comparison by removing special characters and lowercasing.
@@ -197,14 +277,185 @@ def _normalize_text(text: str) -> str:
     """
     # Remove text in parentheses/brackets (often contains version info)
     # but keep the base text
-    text = re.sub(r'\s*[\(\[\{].*?[\)\]\}]\s*', ' ', text)
+    text = _BRACKETED_PATTERN.sub(' ', text)
     # Remove special characters except spaces
-    text = re.sub(r'[^\w\s]', '', text)
+    text = _SPECIAL_CHARS_PATTERN.sub('', text)
     # Normalize whitespace
     text = ' '.join(text.split())
     return text.lower().strip()
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _normalize_name(text: str) -> str:
+    """_normalize_text() for artist and album names, memoized."""
+    return _normalize_text(text)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _forbidden_words_in(title: str) -> frozenset[str]:
+    """Forbidden words appearing as whole words in a title (memoized)."""
+    words: frozenset[str] = frozenset()
+    for form in _FORBIDDEN_WORDS_PATTERN.findall(title.lower()):
+        words |= _FORBIDDEN_WORD_FORMS[form]
+    return words
+
+
+def _ratios(query: str, choices: list[str]) -> list[float]:
+    """
+    fuzz.ratio() of query against each choice, in one cdist call.
+    
+    float64 keeps the results identical to fuzz.ratio() (cdist returns
+    float32 by default).
+    """
+    if not choices:
+        return []
+    return process.cdist([query], choices, scorer=fuzz.ratio, dtype=np.float64)[0].tolist()
+
+
+def _result_type_key(result: YouTubeResult) -> str:
+    """RESULT_TYPE_BONUS key of a result (result type and verification)."""
+    if result.result_type == "song":
+        return "song_verified" if result.is_verified else "song_unverified"
+    return "video_verified" if result.is_verified else "video_unverified"
+
+
+def _explicit_key(track: Track, result: YouTubeResult) -> str:
+    """EXPLICIT_MATCH_SCORES key for the explicit flags of a track and result."""
+    if track.explicit is None or result.is_explicit is None:
+        return "unknown"
+    if track.explicit and result.is_explicit:
+        return "both_explicit"
+    if not track.explicit and not result.is_explicit:
+        return "both_clean"
+    if track.explicit:
+        return "spotify_explicit_yt_clean"
+    return "spotify_clean_yt_explicit"
+
+
+@dataclass(frozen=True)
+class ScoringWeights:
+    """
+    Weights, bonuses and penalties that combine ScoreComponents into a score.
+    
+    Defaults are the module constants above; the `matching` section of
+    config.yaml overrides them (see from_config()), both for PHASE 2 and
+    for spot --rescore.
+    
+    Attributes:
+        title_weight: Weight of title similarity (TITLE_WEIGHT).
+        artist_weight: Weight of artist similarity (ARTIST_WEIGHT).
+        result_type_bonus: Bonus per result type key (RESULT_TYPE_BONUS).
+        album_match_bonus: Album similarity bonus (ALBUM_MATCH_BONUS).
+        album_match_threshold: Similarity needed for it (ALBUM_MATCH_THRESHOLD).
+        explicit_match_scores: Adjustment per explicit key (EXPLICIT_MATCH_SCORES).
+        forbidden_word_penalty: Penalty per forbidden word (FORBIDDEN_WORD_PENALTY).
+    """
+    
+    title_weight: float = TITLE_WEIGHT
+    artist_weight: float = ARTIST_WEIGHT
+    result_type_bonus: dict[str, float] = field(default_factory=lambda: dict(RESULT_TYPE_BONUS))
+    album_match_bonus: float = ALBUM_MATCH_BONUS
+    album_match_threshold: float = ALBUM_MATCH_THRESHOLD
+    explicit_match_scores: dict[str, float] = field(
+        default_factory=lambda: dict(EXPLICIT_MATCH_SCORES)
+    )
+    forbidden_word_penalty: float = FORBIDDEN_WORD_PENALTY
+    
+    @classmethod
+    def from_config(cls, matching: MatchingConfig) -> "ScoringWeights":
+        """
+        Apply the overrides of a config.yaml `matching` section to the defaults.
+        
+        Raises:
+            ConfigError: If a bonus table override has an unknown key.
+        """
+        defaults = cls()
+        values: dict[str, Any] = {}
+        for f in fields(cls):
+            override = getattr(matching, f.name)
+            if override is None:
+                continue
+            if isinstance(override, dict):
+                table = getattr(defaults, f.name)
+                unknown = sorted(set(override) - set(table))
+                if unknown:
+                    raise ConfigError(
+                        f"Unknown key in 'matching.{f.name}': {', '.join(unknown)} "
+                        f"(expected: {', '.join(table)})",
+                        details={"field": f"matching.{f.name}", "keys": unknown}
+                    )
+                override = {**table, **override}
+            values[f.name] = override
+        return cls(**values)
+
+
+def _combine_score(components: ScoreComponents, weights: ScoringWeights) -> float:
+    """
+    Combine component scores into a match score.
+    
+    Args:
+        components: Output of YouTubeMatcher._score_components().
+        weights: Weights, bonuses and penalties to apply.
+    
+    Returns:
+        Match score (0-100+, can exceed 100 with bonuses).
+    """
+    # Weighted average of title and artist scores
+    base_score = (
+        (components.title_score * weights.title_weight)
+        + (components.artist_score * weights.artist_weight)
+    )
+    
+    # Bonuses and penalties, in the order they were always applied
+    adjustments = 0.0
+    adjustments += weights.result_type_bonus[components.result_type]
+    if (components.album_score is not None
+            and components.album_score >= weights.album_match_threshold):
+        adjustments += weights.album_match_bonus
+    adjustments += weights.explicit_match_scores[components.explicit]
+    for _ in components.forbidden_words:
+        adjustments -= weights.forbidden_word_penalty  # -15 per word by default
+    
+    return base_score + adjustments
+
+
+@dataclass
+class _SearchStage:
+    """
+    Scored candidates of one search of a track (ISRC or text).
+    
+    Attributes:
+        query: The search query (ISRC or "Artist - Title").
+        results: Number of usable results the search returned.
+        candidates: Results within duration tolerance, with their scores.
+    """
+    
+    query: str
+    results: int
+    candidates: list[tuple[YouTubeResult, ScoreComponents]]
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict (see from_dict())."""
+        return {
+            "query": self.query,
+            "results": self.results,
+            "candidates": [
+                [asdict(result), asdict(components)]
+                for result, components in self.candidates
+            ],
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_SearchStage":
+        """Rebuild a stage stored with to_dict()."""
+        candidates = []
+        for result, components in data["candidates"]:
+            result["artists"] = tuple(result["artists"])
+            components["forbidden_words"] = tuple(components["forbidden_words"])
+            candidates.append((YouTubeResult(**result), ScoreComponents(**components)))
+        return cls(query=data["query"], results=data["results"], candidates=candidates)
+
+
 def _check_forbidden_words(spotify_title: str, youtube_title: str) -> list[str]:
     """
     Check if YouTube title contains forbidden words that Spotify title lacks.
@@ -217,23 +468,32 @@ def _check_forbidden_words(spotify_title: str, youtube_title: str) -> list[str]:
         spotify_title: The Spotify track title.
         youtube_title: The YouTube result title.
     
+    Words match as whole words only (case-insensitive): "Alive" does not
+    contain "live".
+    
     Returns:
-        List of forbidden words found in YouTube but not in Spotify.
-        Empty list if no mismatches found.
+        List of forbidden words found in YouTube but not in Spotify,
+        in FORBIDDEN_WORDS order. Empty list if no mismatches found.
     
     Example:
         # Spotify: "Playing God" vs YouTube: "Playing God (Acoustic)"
         # Returns: ["acoustic"]
     """
-    spotify_lower = spotify_title.lower()
-    youtube_lower = youtube_title.lower()
-    
-    found_words = []
-    for word in FORBIDDEN_WORDS:
-        if word in youtube_lower and word not in spotify_lower:
-            found_words.append(word)
-    
-    return found_words
+    return _missing_forbidden_words(
+        _forbidden_words_in(youtube_title),
+        _forbidden_words_in(spotify_title)
+    )
+
+
+def _missing_forbidden_words(
+    youtube_words: frozenset[str],
+    spotify_words: frozenset[str]
+) -> list[str]:
+    """Words of youtube_words not in spotify_words, in FORBIDDEN_WORDS order."""
+    if not youtube_words:
+        return []
+    missing = youtube_words - spotify_words
+    return [word for word in FORBIDDEN_WORDS if word in missing]
 
 
 class YouTubeMatcher:
@@ -246,13 +506,15 @@ class YouTubeMatcher:
     
     Attributes:
         _database: Database instance for storing match results.
-        _ytmusic: ytmusicapi YTMusic client instance.
+        _clients: Per-thread ytmusicapi YTMusic clients (see _client()).
+        _offline: Only use cached search results, never search YouTube Music.
+        _search_cache_ttl: Maximum age of cached search results (seconds).
     
     Thread Safety:
         The match_track() method is thread-safe and can be called
-        from multiple threads simultaneously. The ytmusicapi client
-        is stateless for search operations, and database operations
-        use internal locking.
+        from multiple threads simultaneously. Each thread searches
+        with its own YTMusic client and HTTP session (no shared
+        connection pool), and database operations use internal locking.
     
     Matching Strategy:
         1. ISRC Search (highest accuracy):
@@ -281,18 +543,79 @@ class YouTubeMatcher:
         results = matcher.match_tracks(tracks, num_threads=4)
     """
     
-    def __init__(self, database: Database) -> None:
+    def __init__(
+        self,
+        database: Database,
+        offline: bool = False,
+        search_cache_ttl: float = SEARCH_CACHE_TTL_SECONDS,
+        weights: ScoringWeights | None = None,
+        min_score: float = MIN_SIMILARITY_SCORE
+    ) -> None:
         """
         Initialize the YouTubeMatcher.
         
         Args:
             database: Database instance for storing match results.
+            offline: Match only from cached search results (any age).
+                    Tracks without cached results stay pending.
+            search_cache_ttl: Maximum age of cached search results (seconds).
+            weights: Scoring weights (None: the module defaults).
+            min_score: Minimum score of an accepted match.
         
         Behavior:
-            Creates a ytmusicapi.YTMusic client with English language.
+            Unless offline, the calling thread's YTMusic client is created
+            here, so the process locale (set by YTMusic.__init__) is set
+            before any worker thread starts. The other threads create
+            theirs on first search.
         """
         self._database = database
-        self._ytmusic = YTMusic(language="en")
+        self._offline = offline
+        self._search_cache_ttl = search_cache_ttl
+        self._weights = weights if weights is not None else ScoringWeights()
+        self._min_score = min_score
+        self._clients = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        
+        if not offline:
+            self._client()
+    
+    def _client(self) -> YTMusic:
+        """
+        Get the calling thread's YTMusic client, creating it on first use.
+        
+        Each client gets its own requests session with a single keep-alive
+        connection (searches only go to music.youtube.com), so worker
+        threads neither share a session nor wait on each other's pool.
+        
+        YTMusic.__init__ calls locale.setlocale(), which is process-wide
+        and not thread-safe, so clients are constructed under
+        _sessions_lock, one at a time.
+        """
+        ytmusic = getattr(self._clients, "ytmusic", None)
+        if ytmusic is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            session.request = partial(session.request, timeout=SEARCH_TIMEOUT_SECONDS)
+            with self._sessions_lock:
+                self._sessions.append(session)
+                ytmusic = YTMusic(language="en", requests_session=session)
+                self._clients.ytmusic = ytmusic
+        return ytmusic
+    
+    def close(self) -> None:
+        """
+        Close the HTTP sessions of all clients created so far.
+        
+        The per-thread clients are dropped with them, so a later search on
+        any thread (e.g. match_track() called directly) gets a new client
+        instead of a closed session.
+        """
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._clients = threading.local()
+        for session in sessions:
+            session.close()
     
     def match_track(self, track: Track) -> MatchResult:
         """
@@ -315,120 +638,226 @@ class YouTubeMatcher:
                b. Filter by duration tolerance
                c. Score by title/artist similarity
                d. Sort by score (verified results get bonus)
-            4. Return best match or failure result
+            4. Store the candidates of each search (for spot --rescore)
+            5. Return best match or failure result
         
         Thread Safety:
             This method is thread-safe. Multiple threads can call it
-            simultaneously for different tracks. The ytmusicapi client
-            is stateless for searches, and database operations use locks.
+            simultaneously for different tracks. Each thread uses its own
+            YTMusic client, and database operations use locks.
         """
         logger.debug(f"Matching track: {track.artist} - {track.name}")
+        stages: dict[str, _SearchStage] = {}
         
         # Try ISRC search first if available
         if track.isrc:
             logger.debug(f"Trying ISRC search: {track.isrc}")
-            results = self._search_by_isrc(track.isrc)
+            stages[ISRC_STAGE] = self._score_stage(
+                track.isrc, self._search_by_isrc(track.isrc), track
+            )
+            result = self._evaluate_stage(
+                ISRC_STAGE, stages[ISRC_STAGE], track.spotify_id, track.popularity,
+                self._min_score, self._weights
+            )
             
-            if results:
-                # Filter by duration
-                filtered = self._filter_by_duration(results, track.duration_ms)
-                
-                if filtered:
-                    # Score and select best match
-                    scored = [(r, self._score_result(r, track)) for r in filtered]
-                    best, alternatives = self._select_best_match(scored, track)
-                    
-                    if best is not None:
-                        best_result, best_score = best
-                        confidence = min(best_score / 100.0, 1.0)
-                        
-                        logger.debug(
-                            f"ISRC match found: {best_result.title} "
-                            f"(score: {best_score:.1f})"
-                        )
-                        
-                        return MatchResult.success(
-                            spotify_id=track.spotify_id,
-                            youtube_result=best_result,
-                            confidence=confidence,
-                            reason=f"ISRC match (score: {best_score:.1f})",
-                            close_alternatives=alternatives
-                        )
-                    else:
-                        logger.debug(
-                            f"ISRC results found but none passed score threshold"
-                        )
-                else:
-                    logger.debug(
-                        f"ISRC results found but none passed duration filter"
-                    )
-            else:
-                logger.debug(f"No ISRC results found")
+            if result.matched:
+                logger.debug(
+                    f"ISRC match found: {result.youtube_result.title} "
+                    f"({result.match_reason})"
+                )
+                self._store_stages(track.spotify_id, stages)
+                return result
+            
+            logger.debug(f"ISRC search: {result.match_reason}")
         
         # Fall back to text search
         search_query = track.search_query
         logger.debug(f"Trying text search: {search_query}")
         
-        results = self._search_by_text(search_query)
+        stages[TEXT_STAGE] = self._score_stage(
+            search_query, self._search_by_text(search_query), track
+        )
+        result = self._evaluate_stage(
+            TEXT_STAGE, stages[TEXT_STAGE], track.spotify_id, track.popularity,
+            self._min_score, self._weights
+        )
+        self._store_stages(track.spotify_id, stages)
         
-        if not results:
-            logger.warning(f"No results found for: {track.artist} - {track.name}")
-            return MatchResult.failure(
-                spotify_id=track.spotify_id,
-                reason=f"No results found for search query: {search_query}"
+        if result.matched:
+            logger.debug(
+                f"Text search match: {result.youtube_result.title} by "
+                f"{result.youtube_result.author} ({result.match_reason})"
             )
+        else:
+            logger.warning(f"{result.match_reason}: {track.artist} - {track.name}")
         
-        # Filter by duration
+        return result
+    
+    def _score_stage(
+        self,
+        query: str,
+        results: list[YouTubeResult],
+        track: Track
+    ) -> "_SearchStage":
+        """Filter one search's results by duration and score the rest."""
         filtered = self._filter_by_duration(results, track.duration_ms)
+        return _SearchStage(
+            query=query,
+            results=len(results),
+            candidates=list(zip(filtered, self._score_components_batch(filtered, track)))
+        )
+    
+    def _evaluate_stage(
+        self,
+        stage_name: str,
+        stage: "_SearchStage",
+        spotify_id: str,
+        popularity: int,
+        min_score: float,
+        weights: ScoringWeights
+    ) -> MatchResult:
+        """
+        Select the match of one search from its scored candidates.
+        
+        Used both when matching and by rescore(), so a rescore with the
+        same settings picks the same match.
         
-        if not filtered:
-            logger.warning(
-                f"No results within duration tolerance for: "
-                f"{track.artist} - {track.name}"
+        Args:
+            stage_name: ISRC_STAGE or TEXT_STAGE.
+            stage: The search's candidates.
+            spotify_id: Spotify ID of the track.
+            popularity: Spotify popularity of the track.
+            min_score: Minimum acceptable score.
+            weights: Weights combining the candidates' ScoreComponents.
+        
+        Returns:
+            MatchResult (failure reasons name the step that rejected all).
+        """
+        if not stage.results:
+            return MatchResult.failure(
+                spotify_id=spotify_id,
+                reason=f"No results found for search query: {stage.query}"
             )
+        
+        if not stage.candidates:
             return MatchResult.failure(
-                spotify_id=track.spotify_id,
+                spotify_id=spotify_id,
                 reason=f"No results within {DURATION_TOLERANCE_SECONDS}s duration tolerance"
             )
         
-        # Score all filtered results
-        scored = [(r, self._score_result(r, track)) for r in filtered]
-        
-        # Select best match
-        best, alternatives = self._select_best_match(scored, track)
+        scored = [(r, _combine_score(c, weights)) for r, c in stage.candidates]
+        best, alternatives = self._select_best_match(scored, popularity, min_score)
         
         if best is None:
-            logger.warning(
-                f"No results above minimum score for: "
-                f"{track.artist} - {track.name}"
-            )
             return MatchResult.failure(
-                spotify_id=track.spotify_id,
-                reason=f"No results above minimum similarity score ({MIN_SIMILARITY_SCORE})"
+                spotify_id=spotify_id,
+                reason=f"No results above minimum similarity score ({min_score:g})"
             )
         
         best_result, best_score = best
-        confidence = min(best_score / 100.0, 1.0)
-        
-        logger.debug(
-            f"Text search match: {best_result.title} by {best_result.author} "
-            f"(score: {best_score:.1f})"
-        )
+        label = "ISRC" if stage_name == ISRC_STAGE else "Text search"
         
         return MatchResult.success(
-            spotify_id=track.spotify_id,
+            spotify_id=spotify_id,
             youtube_result=best_result,
-            confidence=confidence,
-            reason=f"Text search match (score: {best_score:.1f})",
-            close_alternatives=alternatives
+            confidence=min(best_score / 100.0, 1.0),
+            reason=f"{label} match (score: {best_score:.1f})",
+            close_alternatives=alternatives,
+            score=best_score
         )
     
+    def _store_stages(self, spotify_id: str, stages: dict[str, "_SearchStage"]) -> None:
+        """Store the candidates of a track's searches (see rescore())."""
+        self._database.store_match_candidates(
+            spotify_id,
+            {name: stage.to_dict() for name, stage in stages.items()}
+        )
+    
+    def rescore(
+        self,
+        min_score: float | None = None,
+        weights: ScoringWeights | None = None
+    ) -> dict[str, int]:
+        """
+        Re-select matches from stored candidates, without any network access.
+        
+        Scores are recombined from the stored ScoreComponents with the
+        given weights, bonuses and penalties, then each track's searches
+        are evaluated as in match_track(): ISRC first, then text.
+        
+        Tracks already downloaded are not changed. The new score is stored
+        as the track's match_score. A track whose ISRC search no longer
+        yields a match, and whose text search never ran, is reset to
+        pending so the next PHASE 2 run searches for it.
+        
+        Args:
+            min_score: Minimum acceptable score (None: the matcher's).
+            weights: Scoring weights (None: the matcher's).
+        
+        Returns:
+            Counts: tracks (rescored), unchanged, matched (previously
+            unmatched), rematched (different video), failed, pending.
+        """
+        if min_score is None:
+            min_score = self._min_score
+        if weights is None:
+            weights = self._weights
+        
+        counts = dict.fromkeys(
+            ("tracks", "unchanged", "matched", "rematched", "failed", "pending"), 0
+        )
+        updates: dict[str, tuple[str | None, float | None]] = {}
+        
+        for spotify_id, popularity, youtube_url, match_score, data in (
+            self._database.iter_match_candidates()
+        ):
+            counts["tracks"] += 1
+            new_url = None
+            new_score = None
+            
+            for stage_name in (ISRC_STAGE, TEXT_STAGE):
+                if stage_name not in data:
+                    continue
+                result = self._evaluate_stage(
+                    stage_name,
+                    _SearchStage.from_dict(data[stage_name]),
+                    spotify_id,
+                    popularity,
+                    min_score,
+                    weights
+                )
+                if result.matched:
+                    new_url, new_score = result.youtube_url, result.score
+                    break
+                if stage_name == TEXT_STAGE:
+                    # As stored by mark_youtube_match_failed()
+                    new_url, new_score = YOUTUBE_MATCH_FAILED, 0.0
+            
+            if new_url == youtube_url:
+                counts["unchanged"] += 1
+                if new_score != match_score:
+                    updates[spotify_id] = (new_url, new_score)
+                continue
+            
+            updates[spotify_id] = (new_url, new_score)
+            if new_url is None:
+                counts["pending"] += 1
+            elif new_url == YOUTUBE_MATCH_FAILED:
+                counts["failed"] += 1
+            elif youtube_url in (None, YOUTUBE_MATCH_FAILED):
+                counts["matched"] += 1
+            else:
+                counts["rematched"] += 1
+        
+        self._database.update_youtube_urls(updates)
+        return counts
     
     def match_tracks(
         self,
-        tracks: list[Track],
+        tracks: Iterable[Track],
         num_threads: int = 4,
-        progress_bar: MatchingProgressBar | None = None
+        progress_bar: MatchingProgressBar | None = None,
+        total: int | None = None
     ) -> list[MatchResult]:
         """
         Match multiple tracks using parallel processing.
@@ -436,53 +865,60 @@ class YouTubeMatcher:
         Updates the Global Track Registry directly - no playlist_id needed
         since youtube_url is stored per-track globally.
         
+        Tracks are consumed lazily, with at most PENDING_TASKS_PER_THREAD
+        tasks per thread submitted ahead, so a work-queue generator
+        (Database.iter_tracks_needing_youtube_match()) is never loaded whole.
+        
         Args:
-            tracks: List of Track objects to match.
+            tracks: Track objects to match (a list or any iterable).
             num_threads: Number of parallel threads for matching.
             progress_bar: Optional existing progress bar to use.
                          If None, creates a new one.
+            total: Number of tracks, for the progress bar. Required when
+                  tracks has no len() (e.g. a generator).
         
         Returns:
             List of MatchResult objects, one per input track.
         """
-        if not tracks:
+        if total is None:
+            total = len(tracks)
+        if total == 0:
             return []
         
         # Map to store results in original order
         results_map: dict[str, MatchResult] = {}
+        order: list[str] = []
+        
+        def ordered(tracks: Iterable[Track]) -> Generator[Track, None, None]:
+            for track in tracks:
+                order.append(track.spotify_id)
+                yield track
         
         # Determine if we own the progress bar (and should manage its lifecycle)
         own_progress_bar = progress_bar is None
         if own_progress_bar:
-            progress_bar = MatchingProgressBar(total=len(tracks), description="Matching")
+            progress_bar = MatchingProgressBar(total=total, description="Matching")
             progress_bar.start()
         
-        def process_track(track: Track) -> tuple[Track, MatchResult]:
-            """Process a single track and return both track and result."""
-            result = self.match_track(track)
-            return (track, result)
-        
         try:
             with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                # Submit all tasks
-                future_to_track = {
-                    executor.submit(process_track, track): track
-                    for track in tracks
-                }
-                
                 # Process results as they complete
-                for future in as_completed(future_to_track):
-                    track = future_to_track[future]
-                    
+                for track, future in iter_completed(
+                    executor,
+                    self.match_track,
+                    ordered(tracks),
+                    num_threads * PENDING_TASKS_PER_THREAD
+                ):
                     try:
-                        _, result = future.result()
+                        result = future.result()
                         results_map[track.spotify_id] = result
                         
                         # Update Global Track Registry (no playlist_id needed!)
                         if result.matched:
                             self._database.set_youtube_url(
                                 track.spotify_id,
-                                result.youtube_url
+                                result.youtube_url,
+                                result.score
                             )
                             progress_bar.log(
                                 format_matched_message(
@@ -573,9 +1009,73 @@ class YouTubeMatcher:
             # Only stop the progress bar if we created it
             if own_progress_bar:
                 progress_bar.stop()
+            
+            # Worker threads are gone: close their connections
+            self.close()
+        
+        if not self._offline:
+            removed = self._database.prune_search_cache(
+                SEARCH_CACHE_MAX_ENTRIES,
+                self._search_cache_ttl
+            )
+            if removed:
+                logger.debug(f"Evicted {removed} cached search results")
         
         # Build results list in original order
-        return [results_map[track.spotify_id] for track in tracks]
+        return [results_map[spotify_id] for spotify_id in order]
+    
+    def _search(self, query: str, search_filter: str, limit: int) -> list[dict[str, Any]]:
+        """
+        Search YouTube Music, through the search result cache.
+        
+        Results of successful searches are cached, including empty ones.
+        Searches that fail for good (non-transient, after all retries) are
+        not cached, so they are tried again next run.
+        
+        Args:
+            query: Search query (ISRC or "Artist - Title").
+            search_filter: ytmusicapi filter ("songs" or "videos").
+            limit: Maximum number of results.
+        
+        Returns:
+            Raw search results, reduced to SEARCH_CACHE_FIELDS.
+        
+        Raises:
+            TransientSearchError: If the search failed transiently, or if
+                                 offline and the search is not cached.
+        """
+        cached = self._database.get_cached_search(
+            query,
+            search_filter,
+            limit,
+            None if self._offline else self._search_cache_ttl
+        )
+        if cached is not None:
+            return cached
+        
+        if self._offline:
+            raise TransientSearchError(f"No cached {search_filter} search for: {query}")
+        
+        succeeded = False
+        
+        def search() -> list[dict[str, Any]]:
+            nonlocal succeeded
+            raw_results = self._client().search(
+                query,
+                filter=search_filter,
+                ignore_spelling=True,
+                limit=limit
+            )
+            succeeded = True
+            return raw_results
+        
+        raw_results = [
+            {key: raw[key] for key in SEARCH_CACHE_FIELDS if key in raw}
+            for raw in self._search_with_retry(search)
+        ]
+        if succeeded:
+            self._database.store_cached_search(query, search_filter, limit, raw_results)
+        return raw_results
 
     def _search_with_retry(
         self, 
@@ -732,13 +1232,7 @@ class YouTubeMatcher:
         Returns:
             List of YouTubeResult objects matching the ISRC.
         """
-        raw_results = self._search_with_retry(
-            self._ytmusic.search,
-            isrc,
-            filter="songs",
-            ignore_spelling=True,
-            limit=20
-        )
+        raw_results = self._search(isrc, "songs", ISRC_SEARCH_LIMIT)
         
         results = []
         for raw in raw_results:
@@ -772,11 +1266,7 @@ class YouTubeMatcher:
         seen_ids = set()
         
         for options in SEARCH_OPTIONS:
-            raw_results = self._search_with_retry(
-                self._ytmusic.search,
-                query,
-                **options
-            )
+            raw_results = self._search(query, options["filter"], options["limit"])
             
             for raw in raw_results:
                 video_id = raw.get("videoId")
@@ -842,17 +1332,30 @@ class YouTubeMatcher:
             4. Explicit Match: +3 both explicit, +2 both clean, -5/-2 mismatches
             5. Forbidden Word Penalty: -15 per forbidden word found
         """
+        return _combine_score(self._score_components(result, track), self._weights)
+    
+    def _score_components(self, result: YouTubeResult, track: Track) -> ScoreComponents:
+        """
+        Compute the similarity scores and bonus keys of a YouTube result.
+        
+        Args:
+            result: YouTubeResult to score.
+            track: Spotify Track to match against.
+        
+        Returns:
+            ScoreComponents, combined into a score by _combine_score().
+        """
         # Normalize texts for comparison
         spotify_title = _normalize_text(track.name)
         youtube_title = _normalize_text(result.title)
         
         # Build artist strings for comparison
-        spotify_artist = _normalize_text(track.artist)
-        youtube_artist = _normalize_text(result.author)
+        spotify_artist = _normalize_name(track.artist)
+        youtube_artist = _normalize_name(result.author)
         
         # Also try matching against all artists
-        spotify_all_artists = _normalize_text(" ".join(track.artists))
-        youtube_all_artists = _normalize_text(" ".join(result.artists)) if result.artists else youtube_artist
+        spotify_all_artists = _normalize_name(" ".join(track.artists))
+        youtube_all_artists = _normalize_name(" ".join(result.artists)) if result.artists else youtube_artist
         
         # Calculate title similarity
         title_score = fuzz.ratio(spotify_title, youtube_title)
@@ -862,57 +1365,94 @@ class YouTubeMatcher:
         artist_score_all = fuzz.ratio(spotify_all_artists, youtube_all_artists)
         artist_score = max(artist_score_primary, artist_score_all)
         
-        # Weighted average of title and artist scores
-        base_score = (title_score * TITLE_WEIGHT) + (artist_score * ARTIST_WEIGHT)
+        # Album similarity
+        album_score = None
+        if track.album and result.album:
+            album_score = fuzz.ratio(
+                _normalize_name(track.album),
+                _normalize_name(result.album)
+            )
+        
+        return ScoreComponents(
+            title_score=title_score,
+            artist_score=artist_score,
+            album_score=album_score,
+            result_type=_result_type_key(result),
+            explicit=_explicit_key(track, result),
+            forbidden_words=tuple(_check_forbidden_words(track.name, result.title))
+        )
+    
+    def _score_components_batch(
+        self,
+        results: list[YouTubeResult],
+        track: Track
+    ) -> list[ScoreComponents]:
+        """
+        Compute ScoreComponents for all results of a search at once.
         
-        # Initialize bonus/penalty accumulator
-        adjustments = 0.0
+        Produces exactly what _score_components() gives for each result,
+        but normalizes the Spotify side once and computes the similarities
+        of all candidates with one process.cdist() call per component
+        instead of up to four fuzz.ratio() calls per candidate.
         
-        # 1. Result Type Priority bonus
-        if result.result_type == "song":
-            if result.is_verified:
-                adjustments += RESULT_TYPE_BONUS["song_verified"]
-            else:
-                adjustments += RESULT_TYPE_BONUS["song_unverified"]
-        else:
-            if result.is_verified:
-                adjustments += RESULT_TYPE_BONUS["video_verified"]
-            else:
-                adjustments += RESULT_TYPE_BONUS["video_unverified"]
+        Args:
+            results: YouTubeResults to score.
+            track: Spotify Track to match against.
         
-        # 2. Album match bonus
-        if track.album and result.album:
-            spotify_album = _normalize_text(track.album)
-            youtube_album = _normalize_text(result.album)
-            album_similarity = fuzz.ratio(spotify_album, youtube_album)
-            if album_similarity >= 80:
-                adjustments += ALBUM_MATCH_BONUS
-        
-        # 3. Explicit flag matching
-        if track.explicit is not None and result.is_explicit is not None:
-            if track.explicit and result.is_explicit:
-                adjustments += EXPLICIT_MATCH_SCORES["both_explicit"]
-            elif not track.explicit and not result.is_explicit:
-                adjustments += EXPLICIT_MATCH_SCORES["both_clean"]
-            elif track.explicit and not result.is_explicit:
-                adjustments += EXPLICIT_MATCH_SCORES["spotify_explicit_yt_clean"]
-            elif not track.explicit and result.is_explicit:
-                adjustments += EXPLICIT_MATCH_SCORES["spotify_clean_yt_explicit"]
-        
-        # 4. Forbidden words check (spotDL style)
-        # Check if YouTube has forbidden words that Spotify doesn't have
-        forbidden_words_found = _check_forbidden_words(track.name, result.title)
-        for _ in forbidden_words_found:
-            adjustments -= FORBIDDEN_WORD_PENALTY  # -15 per word
-        
-        final_score = base_score + adjustments
-        
-        return final_score
+        Returns:
+            ScoreComponents for each result, in order.
+        """
+        if not results:
+            return []
+        
+        youtube_titles = [_normalize_text(r.title) for r in results]
+        youtube_artists = [_normalize_name(r.author) for r in results]
+        # With one artist (the usual case) the joined artists are the author
+        youtube_all_artists = [
+            _normalize_name(" ".join(r.artists)) if r.artists and r.artists != (r.author,) else artist
+            for r, artist in zip(results, youtube_artists)
+        ]
+        
+        title_scores = _ratios(_normalize_text(track.name), youtube_titles)
+        artist_scores = [
+            max(primary, everyone)
+            for primary, everyone in zip(
+                _ratios(_normalize_name(track.artist), youtube_artists),
+                _ratios(_normalize_name(" ".join(track.artists)), youtube_all_artists)
+            )
+        ]
+        
+        spotify_words = _forbidden_words_in(track.name)
+        
+        album_scores: list[float | None] = [None] * len(results)
+        if track.album:
+            with_album = [i for i, r in enumerate(results) if r.album]
+            similarities = _ratios(
+                _normalize_name(track.album),
+                [_normalize_name(results[i].album) for i in with_album]
+            )
+            for i, similarity in zip(with_album, similarities):
+                album_scores[i] = similarity
+        
+        return [
+            ScoreComponents(
+                title_score=title_score,
+                artist_score=artist_score,
+                album_score=album_score,
+                result_type=_result_type_key(result),
+                explicit=_explicit_key(track, result),
+                forbidden_words=tuple(
+                    _missing_forbidden_words(_forbidden_words_in(result.title), spotify_words)
+                )
+            )
+            for result, title_score, artist_score, album_score
+            in zip(results, title_scores, artist_scores, album_scores)
+        ]
     
     def _select_best_match(
         self,
         candidates: list[tuple[YouTubeResult, float]],
-        track: Track,
+        popularity: int,
         min_score: float = MIN_SIMILARITY_SCORE
     ) -> tuple[tuple[YouTubeResult, float] | None, list[tuple[YouTubeResult, float]]]:
         """
@@ -923,7 +1463,7 @@ class YouTubeMatcher:
         
         Args:
             candidates: List of (YouTubeResult, score) tuples.
-            track: The Spotify Track being matched (needed for popularity check).
+            popularity: Spotify popularity of the track being matched.
             min_score: Minimum acceptable score (0-100).
         
         Returns:
@@ -938,7 +1478,7 @@ class YouTubeMatcher:
         adjusted_candidates = [(r, s) for r, s in candidates]
         
         # Apply Popularity-Views Correlation for popular tracks
-        if track.popularity > POPULARITY_HIGH_THRESHOLD:
+        if popularity > POPULARITY_HIGH_THRESHOLD:
             # Get candidates with known view counts
             candidates_with_views = [
                 (r, s, r.views) for r, s in adjusted_candidates
@@ -991,38 +1531,86 @@ class YouTubeMatcher:
 
 def match_tracks_phase2(
     database: Database,
-    tracks: list[Track],
+    tracks: Iterable[Track],
     num_threads: int = 4,
-    progress_bar: MatchingProgressBar | None = None
+    progress_bar: MatchingProgressBar | None = None,
+    offline: bool = False,
+    total: int | None = None,
+    matching: MatchingConfig | None = None
 ) -> list[MatchResult]:
     """
     Convenience function for PHASE 2 track matching.
     
     Args:
         database: Database instance.
-        tracks: List of Track objects from PHASE 1.
+        tracks: Track objects from PHASE 1, or a generator over the
+               work queue (see get_tracks_needing_match()).
         num_threads: Number of parallel matching threads.
         progress_bar: Optional existing progress bar to use.
+        offline: Match only from cached search results (no network).
+        total: Number of tracks; required when tracks is a generator.
+        matching: Scoring overrides from config.yaml (None: defaults).
     
     Returns:
         List of MatchResult objects.
+    
+    Raises:
+        ConfigError: If the scoring overrides are invalid.
     """
-    matcher = YouTubeMatcher(database)
-    return matcher.match_tracks(tracks, num_threads, progress_bar)
+    matching = matching if matching is not None else MatchingConfig()
+    matcher = YouTubeMatcher(
+        database,
+        offline=offline,
+        weights=ScoringWeights.from_config(matching),
+        min_score=matching.min_score if matching.min_score is not None else MIN_SIMILARITY_SCORE
+    )
+    return matcher.match_tracks(tracks, num_threads, progress_bar, total)
+
+
+def rescore_matches(
+    database: Database,
+    min_score: float | None = None,
+    matching: MatchingConfig | None = None
+) -> dict[str, int]:
+    """
+    Convenience function for spot --rescore (see YouTubeMatcher.rescore()).
+    
+    Args:
+        database: Database instance.
+        min_score: Minimum acceptable score (None: matching.min_score,
+                  or MIN_SIMILARITY_SCORE).
+        matching: Scoring overrides from config.yaml (None: defaults).
+    
+    Returns:
+        Counts of rescored tracks by outcome.
+    
+    Raises:
+        ConfigError: If the scoring overrides are invalid.
+    """
+    matching = matching if matching is not None else MatchingConfig()
+    if min_score is None:
+        min_score = matching.min_score
+    if min_score is None:
+        min_score = MIN_SIMILARITY_SCORE
+    
+    matcher = YouTubeMatcher(database, offline=True)
+    return matcher.rescore(min_score, ScoringWeights.from_config(matching))
 
 
-def get_tracks_needing_match(database: Database) -> list[dict[str, Any]]:
+def get_tracks_needing_match(database: Database) -> Generator[dict[str, Any], None, None]:
     """
     Get tracks from Global Track Registry that need YouTube matching.
     
     This queries globally - all tracks without youtube_url, regardless
-    of which playlist they belong to.
+    of which playlist they belong to. Tracks are read page by page; use
+    database.count_tracks_needing_youtube_match() for the total.
     
     Args:
         database: Database instance.
     
-    Returns:
-        List of track data dicts for tracks with youtube_url=None.
-        Each dict includes 'track_id' (spotify_id).
+    Yields:
+        Track data dicts for tracks with youtube_url=None.
+        Each dict includes 'track_id' (spotify_id) and only the columns
+        needed to rebuild a Track (no metadata blob or lyrics).
     """
-    return database.get_tracks_needing_youtube_match()
\ No newline at end of file
+    return database.iter_tracks_needing_youtube_match()
\ No newline at end of file
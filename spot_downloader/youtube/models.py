@@ -237,6 +237,35 @@ class YouTubeResult:
         return self.duration_seconds * 1000
 
 
+@dataclass(frozen=True)
+class ScoreComponents:
+    """
+    Per-component match scores of a YouTubeResult against a Spotify track.
+    
+    The final score is recombined from these with the current weights,
+    bonuses and penalties (see matcher._combine_score()). They are stored
+    with each PHASE 2 candidate, so matches can be re-selected with new
+    settings without searching again (spot --rescore).
+    
+    Attributes:
+        title_score: Similarity of normalized titles (0-100).
+        artist_score: Best similarity of primary/all artists (0-100).
+        album_score: Similarity of normalized album names (0-100),
+                     None if either side has no album.
+        result_type: Key into RESULT_TYPE_BONUS ("song_verified", ...).
+        explicit: Key into EXPLICIT_MATCH_SCORES ("both_clean", ...).
+        forbidden_words: Forbidden words in the YouTube title but not in
+                         the Spotify title.
+    """
+    
+    title_score: float
+    artist_score: float
+    album_score: float | None
+    result_type: str
+    explicit: str
+    forbidden_words: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True)
 class MatchResult:
     """
@@ -268,6 +297,9 @@ class MatchResult:
                            Empty tuple if no close alternatives exist.
                            Used for logging ambiguous matches so users can
                            verify the selection and use --replace if needed.
+        
+        score: Combined score of the selected result (stored as the
+               track's match_score). None for failed matches.
     
     Properties:
         youtube_url: The YouTube URL if matched, None otherwise.
@@ -289,6 +321,7 @@ class MatchResult:
     confidence: float
     match_reason: str
     close_alternatives: tuple[tuple[YouTubeResult, float], ...] = ()
+    score: float | None = None
     
     @property
     def youtube_url(self) -> str | None:
@@ -307,7 +340,8 @@ class MatchResult:
         youtube_result: YouTubeResult,
         confidence: float,
         reason: str,
-        close_alternatives: list[tuple[YouTubeResult, float]] | None = None
+        close_alternatives: list[tuple[YouTubeResult, float]] | None = None,
+        score: float | None = None
     ) -> "MatchResult":
         """
         Create a successful match result.
@@ -320,6 +354,7 @@ class MatchResult:
             close_alternatives: Optional list of (YouTubeResult, score) tuples
                                for matches within CLOSE_MATCH_THRESHOLD of best.
                                If provided, these will be logged for user review.
+            score: Combined score of youtube_result.
         
         Returns:
             MatchResult with matched=True.
@@ -348,7 +383,8 @@ class MatchResult:
             youtube_result=youtube_result,
             confidence=confidence,
             match_reason=reason,
-            close_alternatives=tuple(close_alternatives) if close_alternatives else ()
+            close_alternatives=tuple(close_alternatives) if close_alternatives else (),
+            score=score
         )
     
     @classmethod
@@ -0,0 +1,108 @@
+"""
+Query plan regression tests for the Database hot paths.
+
+Each query is run through EXPLAIN QUERY PLAN on a fresh database: a schema
+or query change that makes SQLite fall back to a full scan or a temporary
+sort fails here instead of showing up as a slow sync on a large library.
+"""
+
+import pytest
+
+from spot_downloader.core import database as database_module
+from spot_downloader.core.database import Database
+
+
+WORK_QUEUES = [
+    pytest.param(
+        database_module._MATCH_QUEUE_COLUMNS, "idx_pending_match",
+        Database._MATCH_QUEUE_WHERE, id="match",
+    ),
+    pytest.param(
+        database_module._DOWNLOAD_QUEUE_COLUMNS, "idx_pending_download",
+        Database._DOWNLOAD_QUEUE_WHERE, id="download",
+    ),
+]
+
+# playlist_tracks lookups, as issued by Database (placeholders only)
+PLAYLIST_LOOKUPS = [
+    pytest.param(
+        """
+        SELECT g.spotify_id, pt.position, pt.added_at FROM global_tracks g
+        JOIN playlist_tracks pt ON g.id = pt.track_id
+        WHERE pt.playlist_id = ?
+        """,
+        ("idx_playlist_tracks_playlist", "sqlite_autoindex_playlist_tracks_1"),
+        id="links-by-playlist",
+    ),
+    pytest.param(
+        """
+        SELECT g.*, pt.position, pt.added_at as playlist_added_at
+        FROM global_tracks g
+        JOIN playlist_tracks pt ON g.id = pt.track_id
+        WHERE pt.playlist_id = ?
+        ORDER BY pt.position
+        """,
+        ("idx_playlist_tracks_playlist", "sqlite_autoindex_playlist_tracks_1"),
+        id="tracks-by-playlist",
+    ),
+    pytest.param(
+        """
+        SELECT p.spotify_id as playlist_spotify_id, p.name, pt.position
+        FROM playlists p
+        JOIN playlist_tracks pt ON p.id = pt.playlist_id
+        JOIN global_tracks g ON pt.track_id = g.id
+        WHERE g.spotify_id = ?
+        ORDER BY p.name
+        """,
+        ("idx_playlist_tracks_track",),
+        id="playlists-by-track",
+    ),
+    pytest.param(
+        "SELECT MAX(position) FROM playlist_tracks WHERE playlist_id = ?",
+        ("idx_playlist_tracks_playlist", "sqlite_autoindex_playlist_tracks_1"),
+        id="max-position",
+    ),
+]
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = Database(tmp_path / "plans.db")
+    yield db
+    db.close()
+
+
+def _query_plan(db: Database, sql: str, params: tuple) -> list[str]:
+    with db._read_connection() as conn:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row["detail"] for row in rows]
+
+
+@pytest.mark.parametrize("columns, index, where", WORK_QUEUES)
+def test_work_queue_pages_use_partial_index(database, columns, index, where):
+    first_page, next_page = Database._work_queue_sql(columns, index, where)
+
+    for sql, params in ((first_page, (100,)), (next_page, ("2024-01-01", 1, 100))):
+        plan = _query_plan(database, sql, params)
+        assert any(f"USING INDEX {index}" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+@pytest.mark.parametrize("columns, index, where", WORK_QUEUES)
+def test_work_queue_count_uses_partial_index(database, columns, index, where):
+    plan = _query_plan(
+        database, f"SELECT COUNT(*) FROM global_tracks INDEXED BY {index} WHERE {where}", ()
+    )
+    assert any(f"USING INDEX {index}" in step for step in plan), plan
+
+
+@pytest.mark.parametrize("sql, indexes", PLAYLIST_LOOKUPS)
+def test_playlist_track_lookups_use_index(database, sql, indexes):
+    plan = _query_plan(database, sql, ("x",) if "spotify_id = ?" in sql else (1,))
+
+    # Plan steps read "SEARCH <table or alias> USING ..."
+    lookups = [step for step in plan if step.split()[1] in ("pt", "playlist_tracks")]
+    assert lookups, plan
+    for step in lookups:
+        assert step.startswith("SEARCH"), plan
+        assert any(index in step for index in indexes), plan
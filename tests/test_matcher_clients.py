@@ -0,0 +1,50 @@
+"""
+YouTubeMatcher client lifecycle: one YTMusic client per thread, created
+one at a time, and dropped by close().
+"""
+
+import threading
+
+import pytest
+
+from spot_downloader.core.database import Database
+from spot_downloader.youtube.matcher import YouTubeMatcher
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = Database(tmp_path / "matcher.db")
+    yield db
+    db.close()
+
+
+def test_client_created_eagerly_unless_offline(database):
+    assert len(YouTubeMatcher(database)._sessions) == 1
+    assert YouTubeMatcher(database, offline=True)._sessions == []
+
+
+def test_client_per_thread(database):
+    matcher = YouTubeMatcher(database)
+    main_client = matcher._client()
+
+    other_clients = []
+    thread = threading.Thread(target=lambda: other_clients.append(matcher._client()))
+    thread.start()
+    thread.join()
+
+    assert matcher._client() is main_client
+    assert other_clients[0] is not main_client
+    assert len(matcher._sessions) == 2
+    matcher.close()
+
+
+def test_close_drops_cached_clients(database):
+    matcher = YouTubeMatcher(database)
+    closed_client = matcher._client()
+
+    matcher.close()
+    client = matcher._client()
+
+    assert client is not closed_client
+    assert matcher._sessions == [client._session]
+    matcher.close()
@@ -0,0 +1,201 @@
+"""
+PHASE 2 scoring tests: forbidden words, component scores and their
+combination into a match score.
+
+Scores are pinned on fixed inputs, so a change to normalization, fuzzy
+matching or the default weights shows up here as an explicit diff.
+"""
+
+import pytest
+
+from spot_downloader.core.config import MatchingConfig
+from spot_downloader.spotify.models import Track
+from spot_downloader.youtube.benchmark import generate_dataset
+from spot_downloader.youtube.matcher import (
+    ScoringWeights,
+    YouTubeMatcher,
+    _check_forbidden_words,
+    _combine_score,
+)
+from spot_downloader.youtube.models import ScoreComponents, YouTubeResult
+
+
+def make_track(
+    name: str,
+    artists: tuple[str, ...],
+    album: str = "",
+    explicit: bool | None = False
+) -> Track:
+    return Track(
+        spotify_id="track0",
+        spotify_url="https://open.spotify.com/track/track0",
+        name=name,
+        artist=artists[0],
+        artists=artists,
+        album=album,
+        duration_ms=200_000,
+        explicit=explicit,
+        popularity=50
+    )
+
+
+def make_result(
+    title: str,
+    artists: tuple[str, ...],
+    album: str | None = None,
+    result_type: str = "song",
+    is_verified: bool = True,
+    is_explicit: bool | None = None,
+    video_id: str = "video0"
+) -> YouTubeResult:
+    return YouTubeResult(
+        video_id=video_id,
+        url=f"https://music.youtube.com/watch?v={video_id}",
+        title=title,
+        author=artists[0] if artists else "",
+        duration_seconds=200,
+        is_verified=is_verified,
+        artists=artists,
+        album=album,
+        is_explicit=is_explicit,
+        views=1000,
+        result_type=result_type
+    )
+
+
+@pytest.fixture
+def matcher() -> YouTubeMatcher:
+    # Scoring only: no database or YTMusic client needed
+    return YouTubeMatcher.__new__(YouTubeMatcher)
+
+
+# =============================================================================
+# Forbidden words
+# =============================================================================
+
+@pytest.mark.parametrize("spotify_title, youtube_title, expected", [
+    # Whole words only: "live" is not in "Alive" or "Oliver"
+    ("Song", "Alive", []),
+    ("Alive", "Alive", []),
+    ("Song", "Oliver", []),
+    ("Song", "Song (Live)", ["live"]),
+    ("Song", "SONG - LIVE AT WEMBLEY", ["live"]),
+    ("Song (Live)", "Song - Live", []),
+    # "remastered" also counts as "remaster" (spotDL's substring check)
+    ("Song", "Song - Remastered 2011", ["remastered", "remaster"]),
+    ("Song - Remastered", "Song (Remaster)", []),
+    ("Song - Remaster", "Song (Remastered)", ["remastered"]),
+    # Accepted change: "remixed" is not "remix" any more
+    ("Song", "Song (Remixed)", []),
+    ("Song", "Song Remix", ["remix"]),
+    # Results come in FORBIDDEN_WORDS order
+    ("Song", "Song (Acoustic Live Cover)", ["live", "acoustic", "cover"]),
+])
+def test_check_forbidden_words(spotify_title, youtube_title, expected):
+    assert _check_forbidden_words(spotify_title, youtube_title) == expected
+
+
+# =============================================================================
+# Component scores
+# =============================================================================
+
+def test_score_components_exact_match(matcher):
+    track = make_track("Playing God", ("Polyphia",), album="Remember That You Will Die")
+    result = make_result(
+        "Playing God", ("Polyphia",), album="Remember That You Will Die", is_explicit=False
+    )
+
+    assert matcher._score_components(result, track) == ScoreComponents(
+        title_score=100.0,
+        artist_score=100.0,
+        album_score=100.0,
+        result_type="song_verified",
+        explicit="both_clean",
+        forbidden_words=()
+    )
+
+
+def test_score_components_version_in_title(matcher):
+    track = make_track("Playing God", ("Polyphia",))
+    result = make_result(
+        "Playing God (Acoustic)", ("Polyphia",), result_type="video", is_verified=False
+    )
+
+    components = matcher._score_components(result, track)
+
+    # Bracketed text is dropped before comparing titles, but still penalized
+    assert components.title_score == 100.0
+    assert components.album_score is None
+    assert components.result_type == "video_unverified"
+    assert components.explicit == "unknown"
+    assert components.forbidden_words == ("acoustic",)
+
+
+def test_score_components_batch_matches_single(matcher):
+    track = make_track(
+        "Love Me Again (feat. Someone)", ("John Newman", "Someone"),
+        album="Tribute", explicit=True
+    )
+    results = [
+        make_result("Love Me Again", ("John Newman",), album="Tribute", is_explicit=True),
+        make_result("Love Me Again (Live)", ("John Newman",), result_type="video", is_verified=False),
+        make_result("Love Me Again - Remastered 2011", ("John Newman", "Someone"), album="Tribute (Deluxe)"),
+        make_result("Alive", ("Someone Else",), album=None, is_explicit=False),
+        make_result("love me again remixed", (), result_type="video", is_verified=True),
+        make_result("", ("John Newman",)),
+    ]
+
+    assert matcher._score_components_batch(results, track) == [
+        matcher._score_components(result, track) for result in results
+    ]
+
+
+def test_score_components_batch_matches_single_generated(matcher):
+    for track, results in generate_dataset(tracks=25, candidates=40, seed=7):
+        assert matcher._score_components_batch(results, track) == [
+            matcher._score_components(result, track) for result in results
+        ]
+
+
+def test_score_components_batch_empty(matcher):
+    assert matcher._score_components_batch([], make_track("Song", ("Artist",))) == []
+
+
+# =============================================================================
+# Combined score
+# =============================================================================
+
+def test_combine_score_defaults():
+    components = ScoreComponents(
+        title_score=100.0,
+        artist_score=80.0,
+        album_score=90.0,
+        result_type="song_verified",
+        explicit="spotify_explicit_yt_clean",
+        forbidden_words=("remastered", "remaster")
+    )
+
+    # 0.65 * 100 + 0.35 * 80 + 7 (song) + 5 (album) - 5 (explicit) - 2 * 15
+    assert _combine_score(components, ScoringWeights()) == pytest.approx(70.0)
+
+
+def test_combine_score_config_overrides():
+    components = ScoreComponents(
+        title_score=100.0,
+        artist_score=50.0,
+        album_score=70.0,
+        result_type="video_verified",
+        explicit="both_clean",
+        forbidden_words=("live",)
+    )
+    weights = ScoringWeights.from_config(MatchingConfig(
+        title_weight=0.5,
+        artist_weight=0.5,
+        album_match_threshold=60.0,
+        forbidden_word_penalty=10.0,
+        result_type_bonus={"video_verified": 4.0}
+    ))
+
+    # 0.5 * 100 + 0.5 * 50 + 4 (video) + 5 (album) + 2 (explicit) - 10
+    assert _combine_score(components, weights) == pytest.approx(76.0)
+    assert weights.result_type_bonus["song_verified"] == 7
@@ -0,0 +1,129 @@
+"""
+Rate limit tests for SpotifyClient against a local stub API.
+
+A 429 must reach SpotifyClient._call() on its first HTTP attempt, with
+its Retry-After header, so the shared token bucket (not urllib3 in the
+calling thread) decides how long every thread waits.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import spotipy
+
+from spot_downloader.spotify import client as client_module
+from spot_downloader.spotify.client import SpotifyClient, _create_spotify
+
+
+RETRY_AFTER_SECONDS = 1
+
+
+class _StubApi(ThreadingHTTPServer):
+    """Answers with the queued statuses in order, then 200 for good."""
+
+    def __init__(self, statuses: list[int]) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.statuses = statuses
+        self.requests = 0
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubApi
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+
+        body = json.dumps(
+            {"id": "track0"} if status == 200 else {"error": {"status": status}}
+        ).encode()
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", str(RETRY_AFTER_SECONDS))
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_api():
+    servers = []
+
+    def start(statuses: list[int]) -> _StubApi:
+        server = _StubApi(statuses)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    def make(server: _StubApi) -> SpotifyClient:
+        spotify = _create_spotify("client-id", "client-secret", user_auth=False)
+        spotify.prefix = f"http://127.0.0.1:{server.server_address[1]}/v1/"
+        # No token request to accounts.spotify.com
+        monkeypatch.setattr(
+            spotify.auth_manager, "get_access_token", lambda *args, **kwargs: "token"
+        )
+
+        # Bypass the singleton: each test gets its own limiter
+        client = object.__new__(SpotifyClient)
+        client.__init__(spotify, False, page_workers=1, requests_per_second=100.0)
+        return client
+
+    return make
+
+
+def test_rate_limit_is_retried_by_call_not_session(stub_api, make_client, monkeypatch):
+    server = stub_api([429])
+    client = make_client(server)
+
+    pauses = []
+    on_rate_limited = client._rate_limiter.on_rate_limited
+    monkeypatch.setattr(
+        client._rate_limiter, "on_rate_limited",
+        lambda retry_after: (pauses.append(retry_after), on_rate_limited(retry_after))
+    )
+
+    assert client._call(client._spotify.track, "track0") == {"id": "track0"}
+
+    # One HTTP request per _call attempt: the 429, then the retry
+    assert server.requests == 2
+    assert pauses == [RETRY_AFTER_SECONDS]
+
+
+def test_rate_limit_raised_with_headers_after_max_retries(stub_api, make_client, monkeypatch):
+    monkeypatch.setattr(client_module, "MAX_RATE_LIMIT_RETRIES", 0)
+    server = stub_api([429])
+    client = make_client(server)
+
+    with pytest.raises(spotipy.SpotifyException) as excinfo:
+        client._call(client._spotify.track, "track0")
+
+    assert server.requests == 1
+    assert excinfo.value.http_status == 429
+    assert excinfo.value.headers["Retry-After"] == str(RETRY_AFTER_SECONDS)
+
+
+def test_server_error_keeps_its_status_after_session_retries(stub_api, make_client, monkeypatch):
+    monkeypatch.setattr(client_module.Retry, "get_backoff_time", lambda self: 0)
+    server = stub_api([503] * 10)
+    client = make_client(server)
+
+    with pytest.raises(spotipy.SpotifyException) as excinfo:
+        client._call(client._spotify.track, "track0")
+
+    # First attempt plus spotipy's max_retries, reported as 503 (not 429)
+    assert server.requests == 1 + spotipy.Spotify.max_retries
+    assert excinfo.value.http_status == 503
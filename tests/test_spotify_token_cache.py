@@ -0,0 +1,41 @@
+"""
+Token cache tests: one file per auth mode and Spotify app, owner-only.
+"""
+
+import os
+import stat
+
+import pytest
+
+from spot_downloader.spotify.client import _PrivateCacheFileHandler, _token_cache_path
+
+
+def test_token_cache_path_depends_on_client_id_and_mode(tmp_path):
+    paths = {
+        _token_cache_path(tmp_path, client_id, user_auth)
+        for client_id in ("app-one", "app-two")
+        for user_auth in (False, True)
+    }
+
+    assert len(paths) == 4
+    assert all(path.parent == tmp_path for path in paths)
+    assert _token_cache_path(tmp_path, "app-one", True) == _token_cache_path(tmp_path, "app-one", True)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_token_cache_file_is_owner_only(tmp_path):
+    old_umask = os.umask(0o022)
+    try:
+        new_file = tmp_path / "new.json"
+        _PrivateCacheFileHandler(cache_path=str(new_file)).save_token_to_cache({"access_token": "x"})
+
+        existing_file = tmp_path / "existing.json"
+        existing_file.write_text("{}")
+        existing_file.chmod(0o644)
+        _PrivateCacheFileHandler(cache_path=str(existing_file)).save_token_to_cache({"access_token": "x"})
+    finally:
+        os.umask(old_umask)
+
+    for path in (new_file, existing_file):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert _PrivateCacheFileHandler(cache_path=str(path)).get_cached_token() == {"access_token": "x"}